@@ -8,27 +8,140 @@ https://github.com/ullbergm/homeassistant-gatus
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.const import CONF_URL, Platform
+from homeassistant.components.webhook import async_generate_id, async_unregister
+from homeassistant.const import CONF_URL, CONF_WEBHOOK_ID, Platform
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.loader import async_get_loaded_integration
 from homeassistant.util import slugify
 
 from .api import GatusApiClient
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_GROUP_DEVICES,
+    CONF_HISTORY_DEPTH,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PERFORMANCE_SENSORS,
+    CONF_RECONCILE_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_STATISTICS_WINDOWS,
+    CONF_STREAMING_DECODE,
+    CONF_WEBHOOK,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_GROUP_DEVICES,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_PERFORMANCE_SENSORS,
+    DEFAULT_RECONCILE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_STATISTICS_WINDOWS,
+    DEFAULT_STREAMING_DECODE,
+    DEFAULT_WEBHOOK,
+    DOMAIN,
+    LOGGER,
+    STATISTICS_WINDOWS,
+)
 from .coordinator import GatusDataUpdateCoordinator
 from .data import GatusData
+from .devices import GatusDevices
+from .filters import EndpointFilter
+from .services import async_setup_services
+from .snapshot import async_get_snapshot_store
+from .timing import create_trace_config
+from .webhook import async_register_webhook
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import GatusConfigEntry
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
+    Platform.SENSOR,
 ]
 
+# Options that change which entities exist or which devices they sit on, so
+# they take a reload to apply.
+_RELOAD_OPTIONS: dict[str, Any] = {
+    CONF_STATISTICS_WINDOWS: DEFAULT_STATISTICS_WINDOWS,
+    CONF_PERFORMANCE_SENSORS: DEFAULT_PERFORMANCE_SENSORS,
+    CONF_GROUP_DEVICES: DEFAULT_GROUP_DEVICES,
+}
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the integration's services."""
+    async_setup_services(hass)
+    return True
+
+
+def _coordinator_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the coordinator settings configured in the options."""
+    scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    max_update_interval = None
+    if options.get(CONF_WEBHOOK, DEFAULT_WEBHOOK):
+        # Gatus pushes state changes; polling only reconciles missed alerts.
+        scan_interval = options.get(CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL)
+    elif options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        max_scan_interval = options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        max_update_interval = timedelta(
+            seconds=max(int(max_scan_interval), int(scan_interval))
+        )
+    return {
+        "update_interval": timedelta(seconds=int(scan_interval)),
+        "max_update_interval": max_update_interval,
+        "stale_grace": timedelta(
+            seconds=int(
+                options.get(CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD)
+            )
+        ),
+        "endpoint_filter": EndpointFilter.from_options(options),
+    }
+
+
+def _client_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the API client settings configured in the options."""
+    return {
+        "history_depth": int(options.get(CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH)),
+        "stream": bool(options.get(CONF_STREAMING_DECODE, DEFAULT_STREAMING_DECODE)),
+    }
+
+
+def _needs_reload(entry: GatusConfigEntry) -> bool:
+    """
+    Return whether an entry update can only be applied by reloading it.
+
+    That is the case when the URL changed, or an option that decides which
+    entities exist or which devices they sit on.
+    """
+    runtime = entry.runtime_data
+    if entry.data[CONF_URL] != runtime.url:
+        return True
+    return any(
+        _option_value(entry.options, key, default)
+        != _option_value(runtime.options, key, default)
+        for key, default in _RELOAD_OPTIONS.items()
+    )
+
+
+def _option_value(options: Mapping[str, Any], key: str, default: Any) -> Any:
+    """Return an option in a form that compares equal regardless of order."""
+    value = options.get(key, default)
+    return frozenset(value) if isinstance(value, list) else value
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -36,28 +149,64 @@ async def async_setup_entry(
     entry: GatusConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    if CONF_WEBHOOK_ID not in entry.data:
+        # Generated once so the URL configured in Gatus stays valid.
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: async_generate_id()}
+        )
+
+    windows = entry.options.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS)
     coordinator = GatusDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
-        update_interval=timedelta(seconds=int(scan_interval)),
+        # Only wake entities when the parsed endpoint index actually changed.
+        always_update=False,
+        statistics_windows={
+            # Keep the canonical order (1h, 24h, 7d) whatever order was picked.
+            name: seconds
+            for name, seconds in STATISTICS_WINDOWS.items()
+            if name in windows
+        },
+        **_coordinator_options(entry.options),
     )
-    session = async_create_clientsession(hass)
+    session = async_create_clientsession(hass, trace_configs=[create_trace_config()])
     entry.runtime_data = GatusData(
         client=GatusApiClient(
             url=entry.data[CONF_URL],
             session=session,
+            **_client_options(entry.options),
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        devices=GatusDevices(
+            entry,
+            per_group=entry.options.get(CONF_GROUP_DEVICES, DEFAULT_GROUP_DEVICES),
+        ),
+        url=entry.data[CONF_URL],
+        options=dict(entry.options),
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    # Group devices link to the server device, so it must exist before them.
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, **entry.runtime_data.devices.server
+    )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if await coordinator.async_load_snapshot():
+        # Create entities from the saved snapshot right away and let the first
+        # live refresh run in the background, so startup never waits on Gatus.
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "gatus first refresh"
+        )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if entry.options.get(CONF_WEBHOOK, DEFAULT_WEBHOOK):
+        async_register_webhook(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
@@ -70,12 +219,56 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def async_reload_entry(
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+) -> None:
+    """Delete the saved snapshot when an entry is removed."""
+    await async_get_snapshot_store(hass, entry.entry_id).async_remove()
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: GatusConfigEntry,
+    device_entry: DeviceEntry,
+) -> bool:
+    """Allow removing the device of a group that no longer has endpoints."""
+    group = entry.runtime_data.devices.group_of(device_entry)
+    if group is None:
+        return False
+    data = entry.runtime_data.coordinator.data
+    endpoints = data.values() if isinstance(data, dict) else ()
+    return all(endpoint.group != group for endpoint in endpoints)
+
+
+async def async_update_options(
     hass: HomeAssistant,
     entry: GatusConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """
+    Apply changed options to the running coordinator and client.
+
+    Entities, the session and the collected history are kept; the entry is
+    only reloaded when the change cannot be applied in place.
+    """
+    if _needs_reload(entry):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    runtime = entry.runtime_data
+    webhook_was_enabled = runtime.options.get(CONF_WEBHOOK, DEFAULT_WEBHOOK)
+    runtime.options = dict(entry.options)
+    runtime.client.reconfigure(**_client_options(entry.options))
+    runtime.coordinator.async_apply_options(**_coordinator_options(entry.options))
+
+    use_webhook = entry.options.get(CONF_WEBHOOK, DEFAULT_WEBHOOK)
+    if use_webhook and not webhook_was_enabled:
+        async_register_webhook(hass, entry)
+    elif webhook_was_enabled and not use_webhook:
+        async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
+
+    # Poll right away so the new filters apply and the schedule restarts.
+    await runtime.coordinator.async_request_refresh()
 
 
 async def async_migrate_entry(
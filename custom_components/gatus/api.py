@@ -3,10 +3,73 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import hashlib
+import json
+import random
+import re
 import socket
-from typing import Any
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Final
+from urllib.parse import quote
 
 import aiohttp
+from aiohttp import hdrs
+
+from .const import LOGGER
+from .timing import RequestTiming, elapsed_ms
+
+# Returned by GatusApiClient.async_get_data when the statuses payload is the
+# same as the one returned by the previous successful call.
+NOT_MODIFIED: Final = object()
+
+# Size of the body chunks read from the socket in streaming mode.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bodies at least this large are decoded and turned into models in an executor
+# thread instead of on the event loop.
+EXECUTOR_DECODE_THRESHOLD = 256 * 1024
+
+# Per-attempt request timeout, in seconds.
+REQUEST_TIMEOUT = 10
+
+# Communication errors are retried this many times, waiting an exponentially
+# growing, jittered delay starting at RETRY_BACKOFF seconds in between.
+MAX_RETRIES = 2
+RETRY_BACKOFF = 1.0
+RETRY_BACKOFF_MAX = 30.0
+
+# A Retry-After longer than this is not waited out within a call; the circuit
+# is opened until it has passed instead.
+RETRY_AFTER_MAX = 30.0
+
+# After this many consecutive failed calls no request is sent for
+# CIRCUIT_COOLDOWN seconds; the first call after that probes Gatus again.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 60.0
+
+# Longest pause a server-supplied Retry-After can impose, so a misbehaving
+# proxy cannot silence polling for hours.
+CIRCUIT_COOLDOWN_MAX = 600.0
+
+_RETRY_AFTER_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What may still follow the digits decoded so far when a number is incomplete.
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    # orjson ships with Home Assistant; it decodes bytes directly and is several
+    # times faster than the stdlib on large payloads.
+    from orjson import loads as default_json_loads
+except ImportError:  # pragma: no cover - only without Home Assistant's deps
+    default_json_loads = json.loads
 
 
 class GatusApiClientError(Exception):
@@ -18,6 +81,11 @@ class GatusApiClientCommunicationError(
 ):
     """Exception to indicate a communication error."""
 
+    def __init__(self, *args: object, retry_after: float | None = None) -> None:
+        """Initialize with the server's requested ``retry_after`` in seconds."""
+        super().__init__(*args)
+        self.retry_after = retry_after
+
 
 class GatusApiClientAuthenticationError(
     GatusApiClientError,
@@ -25,6 +93,40 @@ class GatusApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return a Retry-After header (seconds or HTTP date) as seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _apply_hook(items: list[Any], item_hook: Callable[[Any], Any] | None) -> list[Any]:
+    """Pass ``items`` through ``item_hook``, dropping those it maps to None."""
+    if item_hook is None:
+        return items
+    return [hooked for item in items if (hooked := item_hook(item)) is not None]
+
+
+def _is_retryable(exception: GatusApiClientCommunicationError) -> bool:
+    """Return whether a communication error may succeed when retried."""
+    cause = exception.__cause__
+    # Client errors such as 404 will not go away by asking again.
+    return not (
+        isinstance(cause, aiohttp.ClientResponseError)
+        and cause.status < HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -32,46 +134,430 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
         raise GatusApiClientAuthenticationError(
             msg,
         )
+    if response.status in _RETRY_AFTER_STATUSES:
+        msg = f"Gatus answered {response.status}"
+        raise GatusApiClientCommunicationError(
+            msg,
+            retry_after=_parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
+        )
     response.raise_for_status()
 
 
+class JsonArrayStreamDecoder:
+    """
+    Incrementally decode the elements of a top-level JSON array.
+
+    Bytes are fed in arbitrary chunks; every element that is complete is
+    returned as soon as its closing token arrives, so only the element being
+    decoded has to be held in memory instead of the whole document.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._after_element = False
+        self._after_comma = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Consume ``chunk`` and return the array elements it completed."""
+        self._buffer += self._text.decode(chunk)
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        """Flush the decoder; raise ValueError if the array is incomplete."""
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain()
+        if not self._finished or self._buffer:
+            msg = "Truncated or malformed JSON array"
+            raise ValueError(msg)
+        return items
+
+    def _drain(self) -> list[Any]:
+        """Decode every complete element currently in the buffer."""
+        items: list[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while not self._finished:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if not self._started:
+                if char != "[":
+                    msg = "Expected a JSON array"
+                    raise ValueError(msg)
+                self._started = True
+                pos += 1
+            elif self._after_element:
+                self._separator(char)
+                pos += 1
+            elif char == "]" and not self._after_comma:
+                self._finished = True
+                pos += 1
+            elif char in ",]":
+                msg = "Expected a JSON array element"
+                raise ValueError(msg)
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # element not complete yet; wait for more bytes
+                if char in "-0123456789" and _NUMBER_TAIL.match(buffer, end):
+                    break  # the number may continue in the next chunk
+                items.append(item)
+                pos = end
+                self._after_element = True
+                self._after_comma = False
+        if self._finished:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+        self._buffer = buffer[pos:]
+        return items
+
+    def _separator(self, char: str) -> None:
+        """Consume the comma or closing bracket that must follow an element."""
+        if char == ",":
+            self._after_comma = True
+        elif char == "]":
+            self._finished = True
+        else:
+            msg = "Expected ',' or ']' after a JSON array element"
+            raise ValueError(msg)
+        self._after_element = False
+
+
 class GatusApiClient:
     """Gatus API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         session: aiohttp.ClientSession,
+        history_depth: int | None = None,
+        *,
+        stream: bool = False,
+        json_loads: Callable[[bytes], Any] | None = None,
+        executor_threshold: int = EXECUTOR_DECODE_THRESHOLD,
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
     ) -> None:
-        """Initialize the Gatus API Client."""
+        """
+        Initialize the Gatus API Client.
+
+        ``history_depth`` limits how many results Gatus returns per endpoint;
+        ``None`` keeps the server's default page size. With ``stream`` the
+        statuses body is decoded incrementally while it is being received.
+        ``json_loads`` decodes raw response bytes and defaults to orjson when
+        it is installed, falling back to the stdlib decoder. Streaming mode
+        always uses the stdlib decoder, which can resume on partial input.
+        Buffered bodies of ``executor_threshold`` bytes or more are decoded in
+        an executor thread so large fleets do not block the event loop.
+
+        Each attempt is limited to ``timeout`` seconds. Communication errors
+        are retried up to ``max_retries`` times with jittered exponential
+        backoff, honouring Retry-After on 429 and 503 answers, and repeated
+        failures open a circuit breaker that fails calls without a request
+        until CIRCUIT_COOLDOWN has passed.
+        """
         self._url = url
         self._session = session
+        self._history_depth = history_depth
+        self._stream = stream
+        self._json_loads = json_loads or default_json_loads
+        self._executor_threshold = executor_threshold
+        self._timeout = timeout
+        self._max_retries = max_retries
+        # Phase timings of the last successful request.
+        self.last_timing: RequestTiming | None = None
+        # Circuit breaker state.
+        self._consecutive_failures = 0
+        self._circuit_open_until: float | None = None
+        # Validators of the last successful statuses response.
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._body_digest: bytes | None = None
 
-    async def async_get_data(self) -> Any:
-        """Get endpoint statuses from the Gatus API."""
+    def _page_params(self) -> dict | None:
+        """Return the query parameters limiting the per-endpoint history."""
+        if self._history_depth is None:
+            return None
+        # Gatus paginates the result history of every endpoint; page 1 holds
+        # the newest results, so pageSize=1 is "latest only".
+        return {"page": 1, "pageSize": self._history_depth}
+
+    def reconfigure(self, history_depth: int | None, *, stream: bool) -> None:
+        """
+        Apply new request options from the next request on.
+
+        The cached validators of the last response are dropped, so the next
+        poll is decoded in full even when Gatus answers with the same body.
+        """
+        self._history_depth = history_depth
+        self._stream = stream
+        self._etag = None
+        self._last_modified = None
+        self._body_digest = None
+
+    async def async_get_data(
+        self,
+        item_hook: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        Get endpoint statuses from the Gatus API.
+
+        Returns ``NOT_MODIFIED`` instead of the decoded payload when the server
+        answers 304 to our validators, or when the body hashes the same as the
+        previous one.
+
+        When ``item_hook`` is given every element of the returned list is passed
+        through it; in streaming mode that happens as soon as each element has
+        been received, so raw records never accumulate. Elements for which the
+        hook returns None are left out.
+
+        The price of streaming is that the body digest is only known once
+        every element went through ``item_hook``, so a body equal to the
+        previous one is still reported as ``NOT_MODIFIED`` but costs the full
+        decode. A 304 answer is detected before any of it.
+        """
+        headers = {}
+        if self._etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        elif self._last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
         return await self._api_wrapper(
             method="get",
             url=f"{self._url.rstrip('/')}/api/v1/endpoints/statuses",
+            headers=headers or None,
+            params=self._page_params(),
+            conditional=True,
+            item_hook=item_hook,
         )
 
-    async def _api_wrapper(
+    async def async_get_endpoint(
+        self,
+        key: str,
+        item_hook: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        Get the status of a single endpoint from the Gatus API.
+
+        Uses the per-endpoint statuses route, which returns one endpoint record
+        in the same shape as the elements of ``async_get_data``'s list. The
+        record is passed through ``item_hook`` when one is given.
+        """
+        raw = await self._api_wrapper(
+            method="get",
+            url=(
+                f"{self._url.rstrip('/')}/api/v1/endpoints/"
+                f"{quote(key, safe='')}/statuses"
+            ),
+            params=self._page_params(),
+        )
+        return item_hook(raw) if item_hook is not None else raw
+
+    async def _decode_if_modified(
+        self,
+        response: aiohttp.ClientResponse,
+        item_hook: Callable[[Any], Any] | None,
+        timing: RequestTiming,
+    ) -> Any:
+        """Decode the body of ``response`` unless it equals the previous one."""
+        if self._stream:
+            # Elements are hooked as they arrive, before the digest is known;
+            # holding them back would accumulate the raw records streaming
+            # exists to avoid.
+            decoded, digest = await self._stream_items(response, item_hook, timing)
+            if digest == self._body_digest:
+                return NOT_MODIFIED
+        else:
+            body = await self._read_body(response, timing)
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if digest == self._body_digest:
+                return NOT_MODIFIED
+            decode_start = time.perf_counter()
+            if len(body) >= self._executor_threshold:
+                decoded = await asyncio.get_running_loop().run_in_executor(
+                    None, self._decode, body, item_hook
+                )
+            else:
+                decoded = self._decode(body, item_hook)
+            timing.decode = elapsed_ms(decode_start)
+        # Only remember validators once the payload decoded, so a bad body
+        # is never reported as unchanged on the next poll.
+        self._etag = response.headers.get(hdrs.ETAG)
+        self._last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        self._body_digest = digest
+        return decoded
+
+    @staticmethod
+    async def _read_body(
+        response: aiohttp.ClientResponse, timing: RequestTiming
+    ) -> bytes:
+        """Read the whole body, recording its size and transfer time."""
+        read_start = time.perf_counter()
+        body = await response.read()
+        timing.transfer = elapsed_ms(read_start)
+        timing.bytes_received = len(body)
+        return body
+
+    def _decode(self, body: bytes, item_hook: Callable[[Any], Any] | None) -> Any:
+        """Decode ``body`` and pass list elements through ``item_hook``."""
+        decoded = self._json_loads(body)
+        if isinstance(decoded, list):
+            return _apply_hook(decoded, item_hook)
+        return decoded
+
+    @staticmethod
+    async def _stream_items(
+        response: aiohttp.ClientResponse,
+        item_hook: Callable[[Any], Any] | None,
+        timing: RequestTiming,
+    ) -> tuple[list[Any], bytes]:
+        """Decode a JSON array body chunk by chunk, hashing it on the way."""
+        digest = hashlib.blake2b(digest_size=16)
+        decoder = JsonArrayStreamDecoder()
+        items: list[Any] = []
+        read_start = time.perf_counter()
+        decode_seconds = 0.0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            timing.bytes_received += len(chunk)
+            digest.update(chunk)
+            decode_start = time.perf_counter()
+            decoded = decoder.feed(chunk)
+            items.extend(_apply_hook(decoded, item_hook))
+            decode_seconds += time.perf_counter() - decode_start
+        decode_start = time.perf_counter()
+        decoded = decoder.close()
+        items.extend(_apply_hook(decoded, item_hook))
+        decode_seconds += time.perf_counter() - decode_start
+        timing.decode = decode_seconds * 1000
+        timing.transfer = elapsed_ms(read_start) - timing.decode
+        return items, digest.digest()
+
+    async def _api_wrapper(  # noqa: PLR0913
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        params: dict | None = None,
+        *,
+        conditional: bool = False,
+        item_hook: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Get information from the API, retrying transient failures."""
+        self._raise_if_circuit_open()
+        attempt = 0
+        while True:
+            try:
+                result = await self._request(
+                    method,
+                    url,
+                    data,
+                    headers,
+                    params,
+                    conditional=conditional,
+                    item_hook=item_hook,
+                )
+            except GatusApiClientCommunicationError as exception:
+                if not _is_retryable(exception):
+                    raise
+                delay = self._retry_delay(attempt, exception.retry_after)
+                if delay is None:
+                    self._record_failure(exception.retry_after)
+                    raise
+                attempt += 1
+                LOGGER.debug(
+                    "Retrying Gatus request in %.1f s (attempt %d of %d): %s",
+                    delay,
+                    attempt,
+                    self._max_retries,
+                    exception,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self._consecutive_failures = 0
+                self._circuit_open_until = None
+                return result
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float | None:
+        """Return how long to wait before the next attempt, or None to give up."""
+        if attempt >= self._max_retries:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= RETRY_AFTER_MAX else None
+        backoff = min(RETRY_BACKOFF * 2**attempt, RETRY_BACKOFF_MAX)
+        # Equal jitter: keeps a minimum wait while spreading out clients that
+        # failed at the same moment, such as after a Gatus restart.
+        return backoff / 2 + random.uniform(0, backoff / 2)  # noqa: S311
+
+    def _record_failure(self, retry_after: float | None) -> None:
+        """Count a failed call and open the circuit when Gatus looks unhealthy."""
+        self._consecutive_failures += 1
+        if retry_after is not None:
+            cooldown = min(retry_after, CIRCUIT_COOLDOWN_MAX)
+        elif self._consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            cooldown = CIRCUIT_COOLDOWN
+        else:
+            return
+        self._circuit_open_until = time.monotonic() + cooldown
+        LOGGER.warning(
+            "Gatus unavailable, pausing requests for %.0f s after %d failed calls",
+            cooldown,
+            self._consecutive_failures,
+        )
+
+    def _raise_if_circuit_open(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        if self._circuit_open_until is None:
+            return
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            msg = f"Gatus unavailable, requests paused for {remaining:.0f} s"
+            raise GatusApiClientCommunicationError(msg, retry_after=remaining)
+        # Half-open: let this call through as a probe. Another failure opens
+        # the circuit again, since the failure count was not reset.
+        self._circuit_open_until = None
+
+    async def _request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        params: dict | None,
+        *,
+        conditional: bool,
+        item_hook: Callable[[Any], Any] | None,
     ) -> Any:
-        """Get information from the API."""
+        """Make one request and decode its response."""
+        timing = RequestTiming()
         try:
-            async with asyncio.timeout(10):
+            async with asyncio.timeout(self._timeout):
                 response = await self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
+                    params=params,
                     json=data,
+                    trace_request_ctx=timing,
                 )
-                _verify_response_or_raise(response)
-                return await response.json()
+                if conditional and response.status == HTTPStatus.NOT_MODIFIED:
+                    result = NOT_MODIFIED
+                else:
+                    _verify_response_or_raise(response)
+                    if conditional:
+                        result = await self._decode_if_modified(
+                            response, item_hook, timing
+                        )
+                    else:
+                        body = await self._read_body(response, timing)
+                        decode_start = time.perf_counter()
+                        result = self._json_loads(body)
+                        timing.decode = elapsed_ms(decode_start)
 
         except GatusApiClientError:
             # Already the right exception type — let it propagate as-is.
@@ -91,3 +577,6 @@ class GatusApiClient:
             raise GatusApiClientError(
                 msg,
             ) from exception
+        timing.total = elapsed_ms(timing.started)
+        self.last_timing = timing
+        return result
@@ -10,7 +10,7 @@ from homeassistant.components.binary_sensor import (
 )
 
 from .const import LOGGER
-from .entity import GatusEntity
+from .entity import GatusEndpointEntity, async_setup_endpoint_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -22,42 +22,31 @@ if TYPE_CHECKING:
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: GatusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    known_endpoint_keys: set[str] = set()
-
-    def _add_new_endpoints() -> None:
-        """Add entities for any endpoints not yet registered."""
-        if not coordinator.data or not isinstance(coordinator.data, dict):
-            return
-
-        new_sensors: list[GatusEndpointBinarySensor] = []
-        for key, endpoint in coordinator.data.items():
-            if key not in known_endpoint_keys:
-                known_endpoint_keys.add(key)
-                new_sensors.append(
-                    GatusEndpointBinarySensor(
-                        coordinator=coordinator,
-                        endpoint_key=key,
-                        endpoint_name=endpoint.name,
-                        endpoint_group=endpoint.group,
-                    )
-                )
-
-        if new_sensors:
-            async_add_entities(new_sensors)
-
-    # Add initial entities and register a listener for future coordinator updates
-    # so that endpoints added to Gatus after setup are picked up automatically.
-    _add_new_endpoints()
-    entry.async_on_unload(coordinator.async_add_listener(_add_new_endpoints))
-
-
-class GatusEndpointBinarySensor(GatusEntity, BinarySensorEntity):
+
+    def _create_entities(
+        key: str, endpoint: GatusEndpoint
+    ) -> list[GatusEndpointBinarySensor]:
+        return [
+            GatusEndpointBinarySensor(
+                coordinator=coordinator,
+                endpoint_key=key,
+                endpoint_name=endpoint.name,
+                endpoint_group=endpoint.group,
+            )
+        ]
+
+    # Endpoints added to or removed from Gatus after setup are picked up from
+    # the coordinator's added and removed keys.
+    async_setup_endpoint_entities(hass, entry, async_add_entities, _create_entities)
+
+
+class GatusEndpointBinarySensor(GatusEndpointEntity, BinarySensorEntity):
     """Gatus endpoint binary sensor class."""
 
     def __init__(
@@ -68,20 +57,11 @@ class GatusEndpointBinarySensor(GatusEntity, BinarySensorEntity):
         endpoint_group: str,
     ) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
-        self._endpoint_key = endpoint_key
-        self._endpoint_name = endpoint_name
-        self._endpoint_group = endpoint_group
+        super().__init__(coordinator, endpoint_key, endpoint_name, endpoint_group)
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{endpoint_key}"
         # Using has_entity_name=True, so just the endpoint identification
-        self._attr_name = f"{endpoint_group} {endpoint_name}"
-
-    def _get_endpoint(self) -> GatusEndpoint | None:
-        """Return this endpoint's data from the coordinator index (O(1) lookup)."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        return self.coordinator.data.get(self._endpoint_key)
+        self._attr_name = self._endpoint_label
 
     @property
     def available(self) -> bool:
@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_URL
+from homeassistant.components import webhook
+from homeassistant.const import CONF_URL, CONF_WEBHOOK_ID
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import slugify
@@ -17,7 +18,38 @@ from .api import (
     GatusApiClientCommunicationError,
     GatusApiClientError,
 )
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_EXCLUDE_ENDPOINTS,
+    CONF_EXCLUDE_GROUPS,
+    CONF_GROUP_DEVICES,
+    CONF_HISTORY_DEPTH,
+    CONF_INCLUDE_ENDPOINTS,
+    CONF_INCLUDE_GROUPS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PERFORMANCE_SENSORS,
+    CONF_RECONCILE_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_STATISTICS_WINDOWS,
+    CONF_STREAMING_DECODE,
+    CONF_WEBHOOK,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_GROUP_DEVICES,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_PERFORMANCE_SENSORS,
+    DEFAULT_RECONCILE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_STATISTICS_WINDOWS,
+    DEFAULT_STREAMING_DECODE,
+    DEFAULT_WEBHOOK,
+    DOMAIN,
+    LOGGER,
+    MAX_HISTORY_DEPTH,
+    STATISTICS_WINDOWS,
+)
 
 if TYPE_CHECKING:
     from .data import GatusConfigEntry
@@ -88,7 +120,11 @@ class GatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     async def _test_credentials(self, url: str) -> None:
         """Validate credentials."""
         session = async_get_clientsession(self.hass)
-        client = GatusApiClient(url=url, session=session)
+        # A single result per endpoint is enough to prove the server answers.
+        # Report a bad URL right away rather than after retrying it.
+        client = GatusApiClient(
+            url=url, session=session, history_depth=1, max_retries=0
+        )
         await client.async_get_data()
 
 
@@ -106,6 +142,34 @@ class GatusOptionsFlowHandler(config_entries.OptionsFlow):
         current_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
+        current_adaptive_polling = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_max_interval = self.config_entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        current_webhook = self.config_entry.options.get(CONF_WEBHOOK, DEFAULT_WEBHOOK)
+        current_reconcile_interval = self.config_entry.options.get(
+            CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+        )
+        current_stale_grace = self.config_entry.options.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+        )
+        current_history_depth = self.config_entry.options.get(
+            CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH
+        )
+        current_streaming_decode = self.config_entry.options.get(
+            CONF_STREAMING_DECODE, DEFAULT_STREAMING_DECODE
+        )
+        current_windows = self.config_entry.options.get(
+            CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS
+        )
+        current_performance_sensors = self.config_entry.options.get(
+            CONF_PERFORMANCE_SENSORS, DEFAULT_PERFORMANCE_SENSORS
+        )
+        current_group_devices = self.config_entry.options.get(
+            CONF_GROUP_DEVICES, DEFAULT_GROUP_DEVICES
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -123,6 +187,102 @@ class GatusOptionsFlowHandler(config_entries.OptionsFlow):
                             mode=selector.NumberSelectorMode.BOX,
                         )
                     ),
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=bool(current_adaptive_polling),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=int(current_max_interval),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=10,
+                            max=3600,
+                            step=10,
+                            unit_of_measurement="seconds",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_WEBHOOK,
+                        default=bool(current_webhook),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_RECONCILE_INTERVAL,
+                        default=int(current_reconcile_interval),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=60,
+                            max=86400,
+                            step=60,
+                            unit_of_measurement="seconds",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STALE_GRACE_PERIOD,
+                        default=int(current_stale_grace),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=3600,
+                            step=10,
+                            unit_of_measurement="seconds",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HISTORY_DEPTH,
+                        default=int(current_history_depth),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=MAX_HISTORY_DEPTH,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STREAMING_DECODE,
+                        default=bool(current_streaming_decode),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_STATISTICS_WINDOWS,
+                        default=list(current_windows),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(STATISTICS_WINDOWS),
+                            multiple=True,
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PERFORMANCE_SENSORS,
+                        default=bool(current_performance_sensors),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_GROUP_DEVICES,
+                        default=bool(current_group_devices),
+                    ): selector.BooleanSelector(),
+                    **{
+                        vol.Optional(
+                            key,
+                            default=list(self.config_entry.options.get(key, [])),
+                        ): selector.TextSelector(
+                            selector.TextSelectorConfig(multiple=True)
+                        )
+                        for key in (
+                            CONF_INCLUDE_GROUPS,
+                            CONF_EXCLUDE_GROUPS,
+                            CONF_INCLUDE_ENDPOINTS,
+                            CONF_EXCLUDE_ENDPOINTS,
+                        )
+                    },
                 }
             ),
+            description_placeholders={
+                "webhook_path": webhook.async_generate_path(
+                    self.config_entry.data.get(CONF_WEBHOOK_ID, "")
+                )
+            },
         )
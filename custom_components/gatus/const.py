@@ -9,3 +9,69 @@ ATTRIBUTION = "Data provided by Gatus"
 
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 60  # seconds
+
+# Adaptive polling: the scan interval becomes the fastest interval, and
+# polling backs off by ADAPTIVE_BACKOFF_FACTOR after every
+# ADAPTIVE_STABLE_POLLS healthy polls, up to the maximum interval.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 600  # seconds
+ADAPTIVE_STABLE_POLLS = 3
+ADAPTIVE_BACKOFF_FACTOR = 2
+
+# Push updates: a Gatus custom alert calls a Home Assistant webhook, and
+# polling drops to a slow reconciliation interval.
+CONF_WEBHOOK = "webhook"
+DEFAULT_WEBHOOK = False
+CONF_RECONCILE_INTERVAL = "reconcile_interval"
+DEFAULT_RECONCILE_INTERVAL = 900  # seconds
+
+# Number of results Gatus returns per endpoint. Only the newest result drives
+# entity state, so by default ask for a single-result page.
+CONF_HISTORY_DEPTH = "history_depth"
+DEFAULT_HISTORY_DEPTH = 1
+MAX_HISTORY_DEPTH = 100  # Gatus caps pageSize at 100 results per endpoint
+
+# Decode the statuses body incrementally while it is received instead of
+# buffering it. Lowers peak memory on large instances at some CPU cost.
+CONF_STREAMING_DECODE = "streaming_decode"
+DEFAULT_STREAMING_DECODE = False
+
+# Keep serving the last good data for this long after Gatus becomes
+# unreachable before entities are marked unavailable; 0 disables.
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+DEFAULT_STALE_GRACE_PERIOD = 300  # seconds
+
+# Concurrent per-endpoint requests when refreshing endpoints by key.
+ENDPOINT_REFRESH_CONCURRENCY = 4
+
+# Requests and polls kept for the rolling timing statistics.
+TIMING_SAMPLES = 120
+
+# Diagnostic sensors reporting the integration's own polling cost.
+CONF_PERFORMANCE_SENSORS = "performance_sensors"
+DEFAULT_PERFORMANCE_SENSORS = False
+
+# Seconds after the data first changed before the startup snapshot is saved;
+# changes made meanwhile go into the same write, so a busy instance is
+# written at most this often.
+SNAPSHOT_SAVE_DELAY = 60
+
+# Rolling windows for the uptime and response time sensors, in seconds.
+CONF_STATISTICS_WINDOWS = "statistics_windows"
+STATISTICS_WINDOWS = {"1h": 3600, "24h": 86400, "7d": 604800}
+# Opt-in: each window adds sensors and per-endpoint history to every endpoint.
+DEFAULT_STATISTICS_WINDOWS: list[str] = []
+
+# Shell-style patterns selecting which endpoints get entities: groups are
+# matched by group name, and endpoint patterns by endpoint name or key.
+CONF_INCLUDE_GROUPS = "include_groups"
+CONF_EXCLUDE_GROUPS = "exclude_groups"
+CONF_INCLUDE_ENDPOINTS = "include_endpoints"
+CONF_EXCLUDE_ENDPOINTS = "exclude_endpoints"
+
+# Put each Gatus group's endpoint entities on a device of their own, linked
+# to the server device, instead of all on the server device.
+CONF_GROUP_DEVICES = "group_devices"
+DEFAULT_GROUP_DEVICES = False
@@ -2,19 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    NOT_MODIFIED,
     GatusApiClientAuthenticationError,
+    GatusApiClientCommunicationError,
     GatusApiClientError,
 )
-from .const import LOGGER
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_STABLE_POLLS,
+    ENDPOINT_REFRESH_CONCURRENCY,
+    LOGGER,
+    SNAPSHOT_SAVE_DELAY,
+    TIMING_SAMPLES,
+)
+from .filters import EndpointFilter
+from .history import EndpointHistory
 from .models import GatusEndpoint
+from .snapshot import async_get_snapshot_store, pack_endpoints, unpack_endpoints
+from .timing import RequestStats, RollingStats, elapsed_ms
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import datetime, timedelta
+
     from .data import GatusConfigEntry
 
 type GatusCoordinatorData = dict[str, GatusEndpoint]
@@ -26,34 +46,421 @@ class GatusDataUpdateCoordinator(DataUpdateCoordinator[GatusCoordinatorData]):
 
     config_entry: GatusConfigEntry
 
+    # Keys of endpoints whose latest result changed (or that appeared or
+    # disappeared) in the most recent refresh. Entities use this to skip
+    # state writes when their own endpoint did not change.
+    changed_endpoint_keys: frozenset[str] = frozenset()
+
+    # Keys of endpoints that appeared in or disappeared from the data in the
+    # most recent refresh. Platforms use these to add and remove entities
+    # without walking every endpoint.
+    added_endpoint_keys: frozenset[str] = frozenset()
+    removed_endpoint_keys: frozenset[str] = frozenset()
+
+    def __init__(
+        self,
+        *args: Any,
+        statistics_windows: Mapping[str, int] | None = None,
+        max_update_interval: timedelta | None = None,
+        stale_grace: timedelta | None = None,
+        endpoint_filter: EndpointFilter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the coordinator.
+
+        ``statistics_windows`` maps window names to durations in seconds; each
+        endpoint history keeps rolling aggregates for every one of them.
+
+        With ``max_update_interval`` set, polling adapts: ``update_interval``
+        becomes the fastest interval, used whenever an endpoint is failing or
+        changed health, and it is backed off towards ``max_update_interval``
+        while every endpoint stays healthy.
+
+        For up to ``stale_grace`` after Gatus became unreachable the last good
+        data keeps being served, with ``stale_since`` set to when the first
+        poll failed, instead of failing the update.
+
+        Endpoints rejected by ``endpoint_filter`` are dropped while the payload
+        is decoded, before a model is built for them.
+        """
+        super().__init__(*args, **kwargs)
+        self.min_update_interval = self.update_interval
+        self.max_update_interval = max_update_interval
+        self._stable_polls = 0
+        self._has_failures = False
+        self.stale_grace = stale_grace
+        self.stale_since: datetime | None = None
+        self.endpoint_filter = endpoint_filter or EndpointFilter()
+        # Phase timings of recent status polls, for diagnostics.
+        self.request_stats = RequestStats(TIMING_SAMPLES)
+        # The integration's own cost, for the performance sensors: duration
+        # of recent polls, parse throughput of the last full payload, and the
+        # state writes and time of the last listener dispatch.
+        self.poll_stats = RollingStats(TIMING_SAMPLES)
+        self.parse_rate: float | None = None
+        self.state_writes: int | None = None
+        self.listener_ms: float | None = None
+        self._pending_state_writes = 0
+        # Notified after every refresh, once the dispatch above was measured.
+        self._performance_listeners: list[CALLBACK_TYPE] = []
+        self._snapshot_store = async_get_snapshot_store(
+            self.hass, self.config_entry.entry_id
+        )
+        # The index the pending snapshot write will save, None when no write
+        # is pending.
+        self._snapshot_data: GatusCoordinatorData | None = None
+        # Per-endpoint rolling aggregates, kept only for the statistic windows.
+        self.history: dict[str, EndpointHistory] = {}
+        self.statistics_windows: dict[str, int] = {
+            name: seconds * 1000 for name, seconds in (statistics_windows or {}).items()
+        }
+
+    @callback
+    def async_apply_options(
+        self,
+        *,
+        update_interval: timedelta,
+        max_update_interval: timedelta | None,
+        stale_grace: timedelta | None,
+        endpoint_filter: EndpointFilter,
+    ) -> None:
+        """
+        Apply changed options to the running coordinator.
+
+        Takes the same settings as the constructor. The new interval is used
+        from the next scheduled refresh, and adaptive polling starts over from
+        the fastest interval.
+        """
+        self.update_interval = self.min_update_interval = update_interval
+        self.max_update_interval = max_update_interval
+        self._stable_polls = 0
+        self.stale_grace = stale_grace
+        self.endpoint_filter = endpoint_filter
+
+    async def async_load_snapshot(self) -> bool:
+        """
+        Load the last saved endpoint statuses as the current data.
+
+        Lets entities be created at startup before Gatus has answered.
+        Returns whether a snapshot was found.
+        """
+        stored = await self._snapshot_store.async_load()
+        if not stored:
+            return False
+        self.data = {
+            key: endpoint
+            for key, endpoint in unpack_endpoints(stored).items()
+            if self.endpoint_filter.matches(endpoint.group, endpoint.name, key)
+        }
+        LOGGER.debug("Loaded %d endpoints from the saved snapshot", len(self.data))
+        return True
+
+    def _schedule_snapshot_save(self, data: GatusCoordinatorData) -> None:
+        """
+        Save ``data`` at most SNAPSHOT_SAVE_DELAY from now.
+
+        ``Store.async_delay_save`` restarts its delay on every call, so with
+        polls faster than the delay nothing would ever be written. It is only
+        called when no write is pending; later data replaces the pending data
+        and goes into that same write. Packing is deferred to the write, so
+        whatever ``self.data`` becomes in between is never packed.
+        """
+        pending = self._snapshot_data is not None
+        self._snapshot_data = data
+        if not pending:
+            self._snapshot_store.async_delay_save(
+                self._pack_snapshot, SNAPSHOT_SAVE_DELAY
+            )
+
+    def _pack_snapshot(self) -> dict[str, Any]:
+        """Return the pending snapshot data for the store to write."""
+        data, self._snapshot_data = self._snapshot_data, None
+        return pack_endpoints(data or {})
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, measuring their time and state writes."""
+        self._pending_state_writes = 0
+        start = time.perf_counter()
+        super().async_update_listeners()
+        self.listener_ms = elapsed_ms(start)
+        self.state_writes = self._pending_state_writes
+
+    @callback
+    def async_add_performance_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for the measurements of every refresh; return a remover.
+
+        Unlike the coordinator listeners these are called after every
+        refresh, unchanged polls included, and only once the listener
+        dispatch has been measured.
+        """
+        self._performance_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._performance_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_update_performance_listeners(self) -> None:
+        """Call the performance listeners with the latest measurements."""
+        for update_callback in list(self._performance_listeners):
+            update_callback()
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, then report the cost of the refresh."""
+        await super()._async_refresh(*args, **kwargs)
+        self._async_update_performance_listeners()
+
+    @callback
+    def async_count_state_write(self) -> None:
+        """Count a state write made by an entity during a listener dispatch."""
+        self._pending_state_writes += 1
+
     async def _async_update_data(self) -> Any:
+        """Poll Gatus, timing the whole fetch, decode and diff."""
+        self.added_endpoint_keys = self.removed_endpoint_keys = frozenset()
+        start = time.perf_counter()
+        try:
+            return await self._async_poll()
+        finally:
+            self.poll_stats.add(elapsed_ms(start))
+
+    async def _async_poll(self) -> Any:
         """
         Update data via library.
 
-        Fetches endpoint statuses from Gatus API.
-        Returns a parsed list of GatusEndpoint objects.
+        Fetches endpoint statuses from Gatus API; the client turns each raw
+        record into a GatusEndpoint as it is decoded.
+        Returns a dict-keyed index of GatusEndpoint objects.
+
+        When Gatus reports the payload as unchanged the current data object is
+        returned as-is; with ``always_update=False`` that skips the listeners.
         """
+        client = self.config_entry.runtime_data.client
         try:
-            raw = await self.config_entry.runtime_data.client.async_get_data()
-            if raw and isinstance(raw, list):
-                endpoints = {
-                    ep.key: ep
-                    for item in raw
-                    if (ep := GatusEndpoint.from_dict(item)).key
-                }
+            raw = await client.async_get_data(
+                item_hook=self.endpoint_filter.wrap(GatusEndpoint.from_dict)
+            )
+            timing = client.last_timing
+            if timing is not None:
+                self.request_stats.add(timing)
+            self._mark_fresh()
+            if raw is NOT_MODIFIED:
+                LOGGER.debug("Gatus endpoint statuses unchanged since last poll")
+                self.changed_endpoint_keys = frozenset()
+                self._adapt_update_interval(unsettled=self._has_failures)
+                return self.data
+            # An empty list is a valid, empty index: Gatus has no endpoints,
+            # or the filter rejected every one of them.
+            if isinstance(raw, list):
+                endpoints = {ep.key: ep for ep in raw if ep.key}
+                if timing is not None and timing.decode:
+                    self.parse_rate = len(raw) / (timing.decode / 1000)
+                self.changed_endpoint_keys = self._diff_endpoints(endpoints)
+                self._record_history(endpoints)
+                if self.changed_endpoint_keys:
+                    self._schedule_snapshot_save(endpoints)
+                self._adapt_update_interval(unsettled=self._is_unsettled(endpoints))
                 LOGGER.debug(
-                    "Successfully fetched %d endpoints from Gatus", len(endpoints)
+                    "Successfully fetched %d endpoints from Gatus (%d changed)",
+                    len(endpoints),
+                    len(self.changed_endpoint_keys),
                 )
             else:
                 LOGGER.warning(
                     "Gatus API returned unexpected data format: %s", type(raw)
                 )
+                self.changed_endpoint_keys = frozenset()
                 return raw
         except GatusApiClientAuthenticationError as exception:
             LOGGER.error("Authentication failed for Gatus API: %s", exception)
             raise ConfigEntryAuthFailed(exception) from exception
+        except GatusApiClientCommunicationError as exception:
+            self._stable_polls = 0
+            if self._serve_stale(exception):
+                return self.data
+            LOGGER.error("Error fetching data from Gatus API: %s", exception)
+            raise UpdateFailed(exception) from exception
         except GatusApiClientError as exception:
             LOGGER.error("Error fetching data from Gatus API: %s", exception)
+            self._stable_polls = 0
             raise UpdateFailed(exception) from exception
         else:
             return endpoints  # dict[str, GatusEndpoint]
+
+    def _serve_stale(self, exception: GatusApiClientError) -> bool:
+        """Return whether the last good data is served in place of a failed poll."""
+        if not self.stale_grace or not self.data or not isinstance(self.data, dict):
+            return False
+        now = dt_util.utcnow()
+        if self.stale_since is None:
+            self.stale_since = now
+            LOGGER.warning(
+                "Error fetching data from Gatus API, keeping the last data for up "
+                "to %s: %s",
+                self.stale_grace,
+                exception,
+            )
+            self.changed_endpoint_keys = frozenset()
+            # The data object is unchanged, so wake listeners explicitly for
+            # the staleness change; endpoint entities will not write state.
+            self.async_update_listeners()
+            return True
+        if now - self.stale_since < self.stale_grace:
+            LOGGER.debug(
+                "Gatus still unreachable, keeping the last data: %s", exception
+            )
+            self.changed_endpoint_keys = frozenset()
+            return True
+        return False
+
+    def _mark_fresh(self) -> None:
+        """Clear the staleness marker after a successful poll."""
+        if self.stale_since is None:
+            return
+        LOGGER.info("Gatus API reachable again")
+        self.stale_since = None
+        self.async_update_listeners()
+
+    async def async_refresh_endpoints(self, keys: Iterable[str]) -> None:
+        """
+        Re-fetch the given endpoints and merge them into the current data.
+
+        Each endpoint is fetched through Gatus' per-endpoint route, at most
+        ENDPOINT_REFRESH_CONCURRENCY at a time. Fetched endpoints replace their
+        entries in ``data`` in place and listeners are notified only when a
+        latest result changed. The first failure is raised after the endpoints
+        that could be fetched have been merged.
+        """
+        keys = list(dict.fromkeys(keys))
+        client = self.config_entry.runtime_data.client
+        semaphore = asyncio.Semaphore(ENDPOINT_REFRESH_CONCURRENCY)
+        item_hook = self.endpoint_filter.wrap(GatusEndpoint.from_dict)
+
+        async def _fetch(key: str) -> GatusEndpoint | None:
+            async with semaphore:
+                return await client.async_get_endpoint(key, item_hook=item_hook)
+
+        results = await asyncio.gather(
+            *(_fetch(key) for key in keys), return_exceptions=True
+        )
+        endpoints = {
+            endpoint.key: endpoint
+            for endpoint in results
+            if isinstance(endpoint, GatusEndpoint) and endpoint.key
+        }
+        if not isinstance(self.data, dict):
+            self.data = {}
+        changed = frozenset(
+            key
+            for key, endpoint in endpoints.items()
+            if (old := self.data.get(key)) is None
+            or old.latest_result != endpoint.latest_result
+        )
+        LOGGER.debug(
+            "Refreshed %d of %d endpoints from Gatus (%d changed)",
+            len(endpoints),
+            len(keys),
+            len(changed),
+        )
+        added = frozenset(endpoints.keys() - self.data.keys())
+        self.data.update(endpoints)
+        if changed:
+            self.changed_endpoint_keys = changed
+            self.added_endpoint_keys = added
+            self.removed_endpoint_keys = frozenset()
+            self._record_history(endpoints)
+            self._schedule_snapshot_save(self.data)
+            self.async_update_listeners()
+            self._async_update_performance_listeners()
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _diff_endpoints(self, endpoints: GatusCoordinatorData) -> frozenset[str]:
+        """
+        Return the keys whose latest result differs from the current data.
+
+        Also sets ``added_endpoint_keys`` and ``removed_endpoint_keys``.
+        """
+        previous = self.data if isinstance(self.data, dict) else {}
+        self.added_endpoint_keys = frozenset(endpoints.keys() - previous.keys())
+        self.removed_endpoint_keys = frozenset(previous.keys() - endpoints.keys())
+        changed = {
+            key
+            for key, endpoint in endpoints.items()
+            if (old := previous.get(key)) is None
+            or old.latest_result != endpoint.latest_result
+        }
+        changed.update(self.removed_endpoint_keys)
+        return frozenset(changed)
+
+    def _record_history(self, endpoints: GatusCoordinatorData) -> None:
+        """Feed the results of changed endpoints into their rolling windows."""
+        if not self.statistics_windows:
+            # Nothing reads the histories without statistic sensors.
+            return
+        for key in self.changed_endpoint_keys:
+            endpoint = endpoints.get(key)
+            if endpoint is None:
+                self.history.pop(key, None)
+                continue
+            history = self.history.get(key)
+            if history is None:
+                history = self.history[key] = EndpointHistory(
+                    windows=self.statistics_windows
+                )
+            history.record(endpoint)
+
+    def _is_unsettled(self, endpoints: GatusCoordinatorData) -> bool:
+        """
+        Return whether any endpoint is failing or changed health this poll.
+
+        Whether any endpoint is failing is remembered for unmodified polls.
+        """
+        previous = self.data if isinstance(self.data, dict) else {}
+        self._has_failures = any(
+            not _is_healthy(endpoint) for endpoint in endpoints.values()
+        )
+        if self._has_failures:
+            return True
+        # Only endpoints with a new latest result can have recovered.
+        return any(
+            (old := previous.get(key)) is not None
+            and key in endpoints
+            and _is_healthy(old) != _is_healthy(endpoints[key])
+            for key in self.changed_endpoint_keys
+        )
+
+    def _adapt_update_interval(self, *, unsettled: bool) -> None:
+        """Tighten or back off the polling interval after a successful poll."""
+        if self.max_update_interval is None or self.min_update_interval is None:
+            return
+        if unsettled:
+            self._stable_polls = 0
+            interval = self.min_update_interval
+        else:
+            self._stable_polls += 1
+            if self._stable_polls < ADAPTIVE_STABLE_POLLS:
+                return
+            self._stable_polls = 0
+            interval = min(
+                self.update_interval * ADAPTIVE_BACKOFF_FACTOR,
+                self.max_update_interval,
+            )
+        if interval != self.update_interval:
+            LOGGER.debug("Polling Gatus every %s", interval)
+            self.update_interval = interval
+
+
+def _is_healthy(endpoint: GatusEndpoint) -> bool:
+    """Return whether an endpoint's latest result passed (or it has none)."""
+    latest = endpoint.latest_result
+    return latest is None or latest.success
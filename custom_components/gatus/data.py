@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
     from .api import GatusApiClient
     from .coordinator import GatusDataUpdateCoordinator
+    from .devices import GatusDevices
 
 
 type GatusConfigEntry = ConfigEntry[GatusData]
@@ -23,3 +24,8 @@ class GatusData:
     client: GatusApiClient
     coordinator: GatusDataUpdateCoordinator
     integration: Integration
+    devices: GatusDevices
+    # The URL and options the running client and coordinator were set up
+    # with, to tell which changes can be applied without a reload.
+    url: str = ""
+    options: dict[str, Any] = field(default_factory=dict)
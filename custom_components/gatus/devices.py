@@ -0,0 +1,112 @@
+"""Device registry metadata shared by the entities of a Gatus entry."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from awesomeversion import AwesomeVersion
+from awesomeversion.exceptions import AwesomeVersionException
+from homeassistant.const import CONF_URL
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.device_registry import DeviceEntry
+
+# Separates the entry id from the group name in group device identifiers.
+_GROUP_SEPARATOR = "_group_"
+
+
+class GatusDevices:
+    """
+    The devices of one config entry, built once and shared by its entities.
+
+    Every entity sits on the server device unless ``per_group`` is set. Then
+    the entities of an endpoint sit on a device for its Gatus group, linked
+    to the server device through ``via_device``; ungrouped endpoints stay on
+    the server device.
+    """
+
+    def __init__(self, entry: ConfigEntry, *, per_group: bool = False) -> None:
+        """Initialize."""
+        self._entry = entry
+        self.per_group = per_group
+        self._groups: dict[str, DeviceInfo] = {}
+
+    @cached_property
+    def server(self) -> DeviceInfo:
+        """Return the device of the Gatus server."""
+        gatus_url = self._entry.data.get(CONF_URL, "Gatus")
+        # Extract just the hostname from the URL for a cleaner name
+        try:
+            parsed = urlparse(gatus_url)
+            device_name = parsed.netloc or gatus_url
+        except (ValueError, AttributeError):
+            device_name = gatus_url
+
+        # Retrieve the integration version for device registry display
+        try:
+            integration_version = self._entry.runtime_data.integration.version
+        except AttributeError:
+            integration_version = None
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name=f"Gatus ({device_name})",
+            manufacturer="Gatus",
+            model="Health Monitor",
+            configuration_url=gatus_url,
+            sw_version=_normalize_sw_version(integration_version),
+        )
+
+    def endpoint(self, group: str) -> DeviceInfo:
+        """Return the device the entities of an endpoint in ``group`` sit on."""
+        if not self.per_group or not group:
+            return self.server
+        if (device_info := self._groups.get(group)) is None:
+            device_info = self._groups[group] = DeviceInfo(
+                identifiers={
+                    (DOMAIN, f"{self._entry.entry_id}{_GROUP_SEPARATOR}{group}")
+                },
+                name=group,
+                manufacturer="Gatus",
+                model="Endpoint Group",
+                via_device=(DOMAIN, self._entry.entry_id),
+            )
+        return device_info
+
+    def group_of(self, device_entry: DeviceEntry) -> str | None:
+        """Return the group ``device_entry`` is the device of, if a group device."""
+        prefix = f"{self._entry.entry_id}{_GROUP_SEPARATOR}"
+        for domain, identifier in device_entry.identifiers:
+            if domain == DOMAIN and identifier.startswith(prefix):
+                return identifier.removeprefix(prefix)
+        return None
+
+
+def _normalize_sw_version(integration_version: object | None) -> str | None:
+    """Return a safe software version string for device registry."""
+    if integration_version is None:
+        return None
+
+    version = str(integration_version).strip()
+    if not version:
+        return None
+
+    if not any(char.isdigit() for char in version):
+        LOGGER.debug(
+            "Skipping non-version integration value for sw_version: %s", version
+        )
+        return None
+
+    try:
+        AwesomeVersion(version)
+    except AwesomeVersionException:
+        LOGGER.debug("Skipping invalid integration version for sw_version: %s", version)
+        return None
+
+    return version
@@ -5,14 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.const import CONF_URL
+from homeassistant.const import CONF_URL, CONF_WEBHOOK_ID
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import GatusConfigEntry
 
-_REDACT = {CONF_URL}
+_REDACT = {CONF_URL, CONF_WEBHOOK_ID}
 
 
 async def async_get_config_entry_diagnostics(
@@ -26,6 +26,7 @@ async def async_get_config_entry_diagnostics(
     if coordinator.data and isinstance(coordinator.data, dict):
         for endpoint in coordinator.data.values():
             latest = endpoint.latest_result
+            history = coordinator.history.get(endpoint.key)
             endpoint_summary.append(
                 {
                     "key": endpoint.key,
@@ -35,7 +36,12 @@ async def async_get_config_entry_diagnostics(
                     "status_code": latest.status_code if latest else None,
                     "duration_ms": latest.duration_ms if latest else None,
                     "timestamp": latest.timestamp if latest else None,
-                    "result_count": len(endpoint.results),
+                    "result_count": endpoint.result_count,
+                    "window_counts": {
+                        name: window.count for name, window in history.windows.items()
+                    }
+                    if history is not None
+                    else {},
                 }
             )
 
@@ -46,7 +52,12 @@ async def async_get_config_entry_diagnostics(
             "last_exception": str(coordinator.last_exception)
             if coordinator.last_exception
             else None,
+            "stale_since": coordinator.stale_since.isoformat()
+            if coordinator.stale_since
+            else None,
+            "update_interval": str(coordinator.update_interval),
             "endpoint_count": len(endpoint_summary),
         },
+        "requests": coordinator.request_stats.as_dict(),
         "endpoints": endpoint_summary,
     }
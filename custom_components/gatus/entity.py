@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING
 
-from awesomeversion import AwesomeVersion
-from awesomeversion.exceptions import AwesomeVersionException
-from homeassistant.const import CONF_URL
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN, LOGGER
+from .const import ATTRIBUTION, LOGGER
 from .coordinator import GatusDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data import GatusConfigEntry
+    from .models import GatusEndpoint
+
 
 class GatusEntity(CoordinatorEntity[GatusDataUpdateCoordinator]):
     """GatusEntity class."""
@@ -23,61 +30,105 @@ class GatusEntity(CoordinatorEntity[GatusDataUpdateCoordinator]):
     def __init__(self, coordinator: GatusDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        # Get the Gatus URL for the device name
-        gatus_url = coordinator.config_entry.data.get(CONF_URL, "Gatus")
-        # Extract just the hostname from the URL for a cleaner name
-        try:
-            parsed = urlparse(gatus_url)
-            device_name = parsed.netloc or gatus_url
-        except (ValueError, AttributeError):
-            device_name = gatus_url
-
-        # Retrieve the integration version for device registry display
-        try:
-            integration_version = (
-                coordinator.config_entry.runtime_data.integration.version
-            )
-        except AttributeError:
-            integration_version = None
-
-        sw_version = self._normalize_sw_version(integration_version)
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={
-                (
-                    DOMAIN,
-                    coordinator.config_entry.entry_id,
-                ),
-            },
-            name=f"Gatus ({device_name})",
-            manufacturer="Gatus",
-            model="Health Monitor",
-            configuration_url=gatus_url,
-            sw_version=sw_version,
-        )
+        # Built once per entry and shared, not rebuilt for every entity.
+        self._attr_device_info = coordinator.config_entry.runtime_data.devices.server
 
-    @staticmethod
-    def _normalize_sw_version(integration_version: object | None) -> str | None:
-        """Return a safe software version string for device registry."""
-        if integration_version is None:
-            return None
 
-        version = str(integration_version).strip()
-        if not version:
-            return None
+class GatusEndpointEntity(GatusEntity):
+    """Base class for entities that represent a single Gatus endpoint."""
 
-        if not any(char.isdigit() for char in version):
-            LOGGER.debug(
-                "Skipping non-version integration value for sw_version: %s", version
-            )
-            return None
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        endpoint_key: str,
+        endpoint_name: str,
+        endpoint_group: str,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._endpoint_key = endpoint_key
+        self._endpoint_name = endpoint_name
+        self._endpoint_group = endpoint_group
+        devices = coordinator.config_entry.runtime_data.devices
+        self._attr_device_info = devices.endpoint(endpoint_group)
+        # Entity names are prefixed with the device name, which already is
+        # the group's on a group device.
+        self._endpoint_label = (
+            endpoint_name
+            if self._attr_device_info is not devices.server
+            else f"{endpoint_group} {endpoint_name}"
+        )
+        self._last_written_available: bool | None = None
 
-        try:
-            AwesomeVersion(version)
-        except AwesomeVersionException:
-            LOGGER.debug(
-                "Skipping invalid integration version for sw_version: %s", version
-            )
+    def _get_endpoint(self) -> GatusEndpoint | None:
+        """Return this endpoint's data from the coordinator index (O(1) lookup)."""
+        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
             return None
-
-        return version
+        return self.coordinator.data.get(self._endpoint_key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this endpoint's result or availability changed."""
+        available = self.available
+        if (
+            available == self._last_written_available
+            and self._endpoint_key not in self.coordinator.changed_endpoint_keys
+        ):
+            return
+        self._last_written_available = available
+        self.coordinator.async_count_state_write()
+        self.async_write_ha_state()
+
+
+@callback
+def async_setup_endpoint_entities(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    create_entities: Callable[[str, GatusEndpoint], Iterable[GatusEndpointEntity]],
+) -> None:
+    """
+    Keep a platform's endpoint entities in step with the endpoints in Gatus.
+
+    ``create_entities`` returns the entities of one endpoint. They are added
+    for every endpoint now and for those the coordinator reports as added
+    later; those of endpoints reported as removed are taken out of the entity
+    registry together. A refresh that added or removed nothing costs O(1).
+    """
+    coordinator = entry.runtime_data.coordinator
+    entities: dict[str, list[GatusEndpointEntity]] = {}
+
+    def _add(keys: Iterable[str]) -> None:
+        data = coordinator.data if isinstance(coordinator.data, dict) else {}
+        new_entities: list[GatusEndpointEntity] = []
+        for key in keys:
+            if key in entities or (endpoint := data.get(key)) is None:
+                continue
+            entities[key] = list(create_entities(key, endpoint))
+            new_entities.extend(entities[key])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    def _remove(keys: Iterable[str]) -> None:
+        registry = er.async_get(hass)
+        removed = [entity for key in keys for entity in entities.pop(key, ())]
+        for entity in removed:
+            if entity.registry_entry is not None:
+                # Removing the registry entry also removes the entity.
+                registry.async_remove(entity.entity_id)
+            elif entity.hass is not None:
+                entry.async_create_task(hass, entity.async_remove())
+        if removed:
+            LOGGER.debug("Removed %d entities of vanished endpoints", len(removed))
+
+    @callback
+    def _handle_coordinator_update() -> None:
+        """Add and remove entities for the endpoints that came and went."""
+        if coordinator.added_endpoint_keys:
+            _add(coordinator.added_endpoint_keys)
+        if coordinator.removed_endpoint_keys:
+            _remove(coordinator.removed_endpoint_keys)
+
+    if isinstance(coordinator.data, dict):
+        _add(coordinator.data)
+    entry.async_on_unload(coordinator.async_add_listener(_handle_coordinator_update))
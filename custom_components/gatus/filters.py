@@ -0,0 +1,111 @@
+"""Endpoint include/exclude filters for the Gatus integration."""
+
+from __future__ import annotations
+
+import re
+from fnmatch import translate
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CONF_EXCLUDE_ENDPOINTS,
+    CONF_EXCLUDE_GROUPS,
+    CONF_INCLUDE_ENDPOINTS,
+    CONF_INCLUDE_GROUPS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+
+def _compile(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile shell-style patterns into one case-insensitive regex."""
+    patterns = [pattern.strip() for pattern in patterns if pattern.strip()]
+    if not patterns:
+        return None
+    return re.compile("|".join(map(translate, patterns)), re.IGNORECASE)
+
+
+class EndpointFilter:
+    """
+    Include/exclude rules for endpoints, compiled once.
+
+    Groups are matched against ``include_groups``/``exclude_groups`` and
+    endpoint names and keys against ``include_patterns``/``exclude_patterns``;
+    all are shell-style patterns such as ``prod-*``. With any include rule an
+    endpoint must match one of them, and matching an exclude rule always
+    drops it.
+    """
+
+    __slots__ = ("_exclude_group", "_exclude_name", "_include_group", "_include_name")
+
+    def __init__(
+        self,
+        include_groups: Iterable[str] = (),
+        exclude_groups: Iterable[str] = (),
+        include_patterns: Iterable[str] = (),
+        exclude_patterns: Iterable[str] = (),
+    ) -> None:
+        """Compile the given patterns."""
+        self._include_group = _compile(include_groups)
+        self._exclude_group = _compile(exclude_groups)
+        self._include_name = _compile(include_patterns)
+        self._exclude_name = _compile(exclude_patterns)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> EndpointFilter:
+        """Return the filter configured in a config entry's options."""
+        return cls(
+            include_groups=options.get(CONF_INCLUDE_GROUPS, ()),
+            exclude_groups=options.get(CONF_EXCLUDE_GROUPS, ()),
+            include_patterns=options.get(CONF_INCLUDE_ENDPOINTS, ()),
+            exclude_patterns=options.get(CONF_EXCLUDE_ENDPOINTS, ()),
+        )
+
+    def __bool__(self) -> bool:
+        """Return whether any rule is set."""
+        return any(
+            pattern is not None
+            for pattern in (
+                self._include_group,
+                self._exclude_group,
+                self._include_name,
+                self._exclude_name,
+            )
+        )
+
+    def matches(self, group: str, name: str, key: str) -> bool:
+        """Return whether an endpoint passes the filter."""
+        if self._exclude_group is not None and self._exclude_group.match(group):
+            return False
+        if self._exclude_name is not None and (
+            self._exclude_name.match(name) or self._exclude_name.match(key)
+        ):
+            return False
+        if self._include_group is None and self._include_name is None:
+            return True
+        return bool(
+            (self._include_group is not None and self._include_group.match(group))
+            or (
+                self._include_name is not None
+                and (self._include_name.match(name) or self._include_name.match(key))
+            )
+        )
+
+    def wrap(self, hook: Callable[[dict[str, Any]], Any]) -> Callable[[Any], Any]:
+        """
+        Return ``hook`` guarded by the filter.
+
+        The guarded hook returns None for raw endpoint records that do not pass,
+        without calling ``hook``, so no model is built for them.
+        """
+        if not self:
+            return hook
+
+        def _filtered(data: dict[str, Any]) -> Any:
+            if not self.matches(
+                data.get("group") or "", data.get("name") or "", data.get("key") or ""
+            ):
+                return None
+            return hook(data)
+
+        return _filtered
@@ -0,0 +1,223 @@
+"""Rolling per-endpoint result statistics for the Gatus integration."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .models import GatusEndpoint
+
+# Rolling windows are split into this many time slots; the oldest slot is
+# dropped as a whole, so a window spans its duration to within one slot.
+_SLOTS_PER_WINDOW = 12
+
+# Latency histogram resolution: each power of two is split into 2**3 bins,
+# which bounds the percentile error to about 6%.
+_BIN_SUB_BITS = 3
+
+
+def parse_timestamp(value: str | None) -> int | None:
+    """Return an RFC 3339 timestamp as epoch milliseconds, or None if invalid."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return int(parsed.timestamp() * 1000)
+
+
+def _latency_bin(duration_us: int) -> int:
+    """Return the log-linear histogram bin of a duration."""
+    if duration_us < 1 << _BIN_SUB_BITS:
+        return duration_us
+    shift = duration_us.bit_length() - _BIN_SUB_BITS - 1
+    return (
+        ((shift + 1) << _BIN_SUB_BITS) + (duration_us >> shift) - (1 << _BIN_SUB_BITS)
+    )
+
+
+def _bin_midpoint_us(latency_bin: int) -> float:
+    """Return the representative duration of a histogram bin."""
+    if latency_bin < 1 << _BIN_SUB_BITS:
+        return float(latency_bin)
+    shift = (latency_bin >> _BIN_SUB_BITS) - 1
+    mantissa = (latency_bin & ((1 << _BIN_SUB_BITS) - 1)) + (1 << _BIN_SUB_BITS)
+    return (mantissa << shift) + ((1 << shift) - 1) / 2
+
+
+class _WindowSlot:
+    """Aggregates of the results that fall into one slot of a rolling window."""
+
+    __slots__ = ("bins", "count", "index", "successes", "total_us")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.count = 0
+        self.successes = 0
+        self.total_us = 0
+        self.bins: dict[int, int] = {}
+
+
+class RollingWindow:
+    """
+    Uptime and latency aggregates over a sliding time window.
+
+    Every result updates the slot it falls into and the running window totals,
+    and slots that slide out of the window are subtracted again, so adding a
+    result is O(1) and nothing is ever recomputed from history. Latency
+    percentiles come from a sparse log-linear histogram.
+    """
+
+    __slots__ = ("_bins", "_count", "_slot_ms", "_slots", "_successes", "_total_us")
+
+    def __init__(self, duration_ms: int) -> None:
+        """Initialize an empty window spanning ``duration_ms``."""
+        self._slot_ms = max(duration_ms // _SLOTS_PER_WINDOW, 1)
+        self._slots: deque[_WindowSlot] = deque()
+        self._count = 0
+        self._successes = 0
+        self._total_us = 0
+        self._bins: dict[int, int] = {}
+
+    @property
+    def count(self) -> int:
+        """Return the number of results in the window."""
+        return self._count
+
+    @property
+    def uptime(self) -> float | None:
+        """Return the percentage of successful results, or None when empty."""
+        if not self._count:
+            return None
+        return 100 * self._successes / self._count
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean response time in milliseconds, or None when empty."""
+        if not self._count:
+            return None
+        return self._total_us / self._count / 1000
+
+    def percentile_ms(self, percentile: float) -> float | None:
+        """Return the given response time percentile (0-100) in milliseconds."""
+        if not self._count:
+            return None
+        rank = max(math.ceil(self._count * percentile / 100), 1)
+        seen = 0
+        for latency_bin in sorted(self._bins):
+            seen += self._bins[latency_bin]
+            if seen >= rank:
+                return _bin_midpoint_us(latency_bin) / 1000
+        return None  # pragma: no cover - counts always add up to _count
+
+    def add(self, timestamp_ms: int, *, success: bool, duration_us: int) -> None:
+        """Add a result and drop the slots that fell out of the window."""
+        index = timestamp_ms // self._slot_ms
+        slots = self._slots
+        if not slots or slots[-1].index < index:
+            slots.append(_WindowSlot(index))
+        slot = slots[-1]
+        latency_bin = _latency_bin(duration_us)
+
+        slot.count += 1
+        slot.total_us += duration_us
+        slot.bins[latency_bin] = slot.bins.get(latency_bin, 0) + 1
+        self._count += 1
+        self._total_us += duration_us
+        self._bins[latency_bin] = self._bins.get(latency_bin, 0) + 1
+        if success:
+            slot.successes += 1
+            self._successes += 1
+
+        oldest = slots[-1].index - _SLOTS_PER_WINDOW + 1
+        while slots[0].index < oldest:
+            self._evict(slots.popleft())
+
+    def _evict(self, slot: _WindowSlot) -> None:
+        """Subtract a slot's aggregates from the window totals."""
+        self._count -= slot.count
+        self._successes -= slot.successes
+        self._total_us -= slot.total_us
+        for latency_bin, count in slot.bins.items():
+            remaining = self._bins[latency_bin] - count
+            if remaining:
+                self._bins[latency_bin] = remaining
+            else:
+                del self._bins[latency_bin]
+
+
+class EndpointHistory:
+    """
+    Rolling aggregates of one endpoint's results.
+
+    Every new result is pushed into the named rolling ``windows``. Raw results
+    are not kept: only the timestamp of the newest one is remembered, which is
+    all that is needed to de-duplicate the overlapping pages of successive
+    polls.
+    """
+
+    __slots__ = ("_last", "windows")
+
+    def __init__(self, windows: Mapping[str, int] | None = None) -> None:
+        """
+        Initialize an empty history.
+
+        ``windows`` maps window names to their duration in milliseconds.
+        """
+        self._last: int | None = None
+        self.windows = {
+            name: RollingWindow(duration_ms)
+            for name, duration_ms in (windows or {}).items()
+        }
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Return the epoch milliseconds of the newest result, if any."""
+        return self._last
+
+    def append(self, timestamp_ms: int, *, success: bool, duration_ns: int) -> bool:
+        """
+        Add a result to every window.
+
+        Results not newer than the last added one are ignored, which
+        de-duplicates the overlapping pages returned by successive polls.
+        Returns whether the result was added.
+        """
+        last = self._last
+        if last is not None and timestamp_ms <= last:
+            return False
+        self._last = timestamp_ms
+        duration_us = max(duration_ns // 1000, 0)
+        for window in self.windows.values():
+            window.add(timestamp_ms, success=success, duration_us=duration_us)
+        return True
+
+    def record(self, endpoint: GatusEndpoint) -> int:
+        """
+        Add the results of ``endpoint`` that are newer than the last one added.
+
+        Results are walked newest first and the walk stops at the first one
+        already added, so a poll normally parses a single raw result.
+        Returns the number of results added.
+        """
+        last = self.last_timestamp
+        pending: list[tuple[int, bool, int]] = []
+        for result in endpoint.iter_newest_first():
+            timestamp = parse_timestamp(result.timestamp)
+            if timestamp is None:
+                continue
+            if last is not None and timestamp <= last:
+                break
+            pending.append((timestamp, result.success, result.duration_ns))
+        return sum(
+            self.append(timestamp, success=success, duration_ns=duration_ns)
+            for timestamp, success, duration_ns in reversed(pending)
+        )
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from sys import intern
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """
+    Intern ``value`` if it is a string.
+
+    Hostnames, groups and names repeat across thousands of results and across
+    polls; interning makes every occurrence share one string object.
+    """
+    return intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class GatusResult:
     """A single health-check result returned by the Gatus API."""
 
@@ -26,33 +40,117 @@ class GatusResult:
         """Construct a GatusResult from a raw API response dict."""
         return cls(
             success=data.get("success", False),
-            hostname=data.get("hostname"),
+            hostname=_intern(data.get("hostname")),
             status_code=data.get("status"),
             duration_ns=data.get("duration", 0),
             timestamp=data.get("timestamp"),
         )
 
 
-@dataclass
 class GatusEndpoint:
-    """A monitored endpoint as returned by the Gatus API."""
+    """
+    A monitored endpoint as returned by the Gatus API.
+
+    Only the latest result is parsed eagerly. Older results are kept as the
+    raw API dicts and become GatusResult objects the first time ``results``
+    is read, since entities only ever look at the latest one.
+    """
+
+    __slots__ = ("_raw_results", "_results", "group", "key", "latest_result", "name")
+
+    def __init__(
+        self,
+        key: str,
+        name: str,
+        group: str,
+        results: list[GatusResult] | None = None,
+        *,
+        raw_results: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Initialize the endpoint.
+
+        Pass either parsed ``results`` or the API's ``raw_results`` (both
+        oldest first); of the raw ones only the latest is parsed right away.
+        """
+        self.key = key
+        self.name = name
+        self.group = group
+        self._raw_results: list[dict[str, Any]] = []
+        self._results: list[GatusResult] | None
+        self.latest_result: GatusResult | None
+        if raw_results:
+            self.latest_result = GatusResult.from_dict(raw_results[-1])
+            if len(raw_results) == 1:
+                self._results = [self.latest_result]
+            else:
+                # Keep only the older raw dicts; the latest one is parsed.
+                self._raw_results = raw_results[:-1]
+                self._results = None
+        else:
+            self._results = results or []
+            self.latest_result = self._results[-1] if self._results else None
 
-    key: str
-    name: str
-    group: str
-    results: list[GatusResult] = field(default_factory=list)
+    @property
+    def results(self) -> list[GatusResult]:
+        """Return every result, oldest first, parsing raw results on first use."""
+        if self._results is None:
+            self._results = [GatusResult.from_dict(r) for r in self._raw_results]
+            if self.latest_result is not None:
+                self._results.append(self.latest_result)
+            self._raw_results = []
+        return self._results
+
+    def iter_newest_first(self) -> Iterator[GatusResult]:
+        """Yield results newest first; raw results are parsed but not cached."""
+        if self._results is not None:
+            yield from reversed(self._results)
+            return
+        if self.latest_result is not None:
+            yield self.latest_result
+        for raw in reversed(self._raw_results):
+            yield GatusResult.from_dict(raw)
 
     @property
-    def latest_result(self) -> GatusResult | None:
-        """Return the most recent health-check result, or None if no results yet."""
-        return self.results[-1] if self.results else None
+    def result_count(self) -> int:
+        """Return the number of results without parsing them."""
+        if self._results is None:
+            return len(self._raw_results) + 1
+        return len(self._results)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare identity and latest result.
+
+        Older history is deliberately not compared: it would force every raw
+        result to be parsed, and entity state only depends on the latest one.
+        """
+        if not isinstance(other, GatusEndpoint):
+            return NotImplemented
+        return (
+            self.key == other.key
+            and self.name == other.name
+            and self.group == other.group
+            and self.latest_result == other.latest_result
+            and self.result_count == other.result_count
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a debug representation without materializing history."""
+        return (
+            f"GatusEndpoint(key={self.key!r}, name={self.name!r}, "
+            f"group={self.group!r}, result_count={self.result_count}, "
+            f"latest_result={self.latest_result!r})"
+        )
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> GatusEndpoint:
         """Construct a GatusEndpoint from a raw API response dict."""
         return cls(
-            key=data.get("key", ""),
-            name=data.get("name", ""),
-            group=data.get("group", ""),
-            results=[GatusResult.from_dict(r) for r in data.get("results", [])],
+            key=_intern(data.get("key", "")),
+            name=_intern(data.get("name", "")),
+            group=_intern(data.get("group", "")),
+            raw_results=data.get("results"),
         )
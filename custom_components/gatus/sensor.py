@@ -0,0 +1,286 @@
+"""Sensor platform for gatus_integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+
+from .const import CONF_PERFORMANCE_SENSORS, DEFAULT_PERFORMANCE_SENSORS
+from .entity import GatusEndpointEntity, GatusEntity, async_setup_endpoint_entities
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import GatusDataUpdateCoordinator
+    from .data import GatusConfigEntry
+    from .history import RollingWindow
+    from .models import GatusEndpoint
+
+
+@dataclass(frozen=True, kw_only=True)
+class GatusStatisticSensorEntityDescription(SensorEntityDescription):
+    """Describes a rolling statistic of a Gatus endpoint."""
+
+    label: str
+    value_fn: Callable[[RollingWindow], float | None]
+
+
+STATISTIC_SENSORS: tuple[GatusStatisticSensorEntityDescription, ...] = (
+    GatusStatisticSensorEntityDescription(
+        key="uptime",
+        label="uptime",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda window: window.uptime,
+    ),
+    GatusStatisticSensorEntityDescription(
+        key="response_time_avg",
+        label="average response time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda window: window.mean_ms,
+    ),
+    GatusStatisticSensorEntityDescription(
+        key="response_time_p95",
+        label="95th percentile response time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        value_fn=lambda window: window.percentile_ms(95),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GatusPerformanceSensorEntityDescription(SensorEntityDescription):
+    """Describes a measurement of the integration's own cost."""
+
+    value_fn: Callable[[GatusDataUpdateCoordinator], float | None]
+
+
+PERFORMANCE_SENSORS: tuple[GatusPerformanceSensorEntityDescription, ...] = (
+    GatusPerformanceSensorEntityDescription(
+        key="poll_duration",
+        name="Poll duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.poll_stats.last,
+    ),
+    GatusPerformanceSensorEntityDescription(
+        key="poll_duration_p95",
+        name="Poll duration (p95)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.poll_stats.percentile(95),
+    ),
+    GatusPerformanceSensorEntityDescription(
+        key="payload_size",
+        name="Payload size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.request_stats.bytes_received.last,
+    ),
+    GatusPerformanceSensorEntityDescription(
+        key="parse_rate",
+        name="Endpoints parsed per second",
+        native_unit_of_measurement="endpoints/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.parse_rate,
+    ),
+    GatusPerformanceSensorEntityDescription(
+        key="state_writes",
+        name="State writes per update",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.state_writes,
+    ),
+    GatusPerformanceSensorEntityDescription(
+        key="listener_time",
+        name="Listener time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.listener_ms,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    coordinator = entry.runtime_data.coordinator
+    async_add_entities([GatusStaleSinceSensor(coordinator)])
+    if entry.options.get(CONF_PERFORMANCE_SENSORS, DEFAULT_PERFORMANCE_SENSORS):
+        async_add_entities(
+            GatusPerformanceSensor(coordinator, description)
+            for description in PERFORMANCE_SENSORS
+        )
+
+    windows = list(coordinator.statistics_windows)
+    if not windows:
+        return
+
+    def _create_entities(
+        key: str, endpoint: GatusEndpoint
+    ) -> list[GatusEndpointStatisticSensor]:
+        return [
+            GatusEndpointStatisticSensor(
+                coordinator=coordinator,
+                endpoint_key=key,
+                endpoint_name=endpoint.name,
+                endpoint_group=endpoint.group,
+                description=description,
+                window=window,
+            )
+            for window in windows
+            for description in STATISTIC_SENSORS
+        ]
+
+    async_setup_endpoint_entities(hass, entry, async_add_entities, _create_entities)
+
+
+class GatusEndpointStatisticSensor(GatusEndpointEntity, SensorEntity):
+    """Rolling uptime or response time statistic of a Gatus endpoint."""
+
+    entity_description: GatusStatisticSensorEntityDescription
+
+    def __init__(  # noqa: PLR0913
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        endpoint_key: str,
+        endpoint_name: str,
+        endpoint_group: str,
+        description: GatusStatisticSensorEntityDescription,
+        window: str,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, endpoint_key, endpoint_name, endpoint_group)
+        self.entity_description = description
+        self._window = window
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{endpoint_key}"
+            f"_{description.key}_{window}"
+        )
+        self._attr_name = f"{self._endpoint_label} {description.label} ({window})"
+
+    def _get_window(self) -> RollingWindow | None:
+        """Return the rolling aggregates this sensor reports on."""
+        history = self.coordinator.history.get(self._endpoint_key)
+        if history is None:
+            return None
+        return history.windows.get(self._window)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if not self.coordinator.last_update_success:
+            return False
+        window = self._get_window()
+        return window is not None and window.count > 0
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic over the rolling window."""
+        window = self._get_window()
+        if window is None:
+            return None
+        return self.entity_description.value_fn(window)
+
+
+class GatusStaleSinceSensor(GatusEntity, SensorEntity):
+    """Since when the endpoint states have been served from stale data."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Stale since"
+
+    def __init__(self, coordinator: GatusDataUpdateCoordinator) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_stale_since"
+
+    @property
+    def available(self) -> bool:
+        """Return True; the sensor reports on Gatus being unavailable."""
+        return True
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when Gatus first failed to answer, or None while it answers."""
+        return self.coordinator.stale_since
+
+
+class GatusPerformanceSensor(GatusEntity, SensorEntity):
+    """Measurement of the integration's own polling and update cost."""
+
+    entity_description: GatusPerformanceSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        description: GatusPerformanceSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Write state after every refresh, once its cost was measured."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_performance_listener(self.async_write_ha_state)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Skip the coordinator listener dispatch.
+
+        It is not called for unchanged polls, and runs inside the dispatch
+        whose state writes and time these sensors report.
+        """
+
+    @property
+    def available(self) -> bool:
+        """Return True; the integration's cost is known even when polls fail."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the measurement."""
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,86 @@
+"""Services for gatus_integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .api import GatusApiClientError
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+    from .data import GatusConfigEntry
+
+SERVICE_REFRESH_ENDPOINT = "refresh_endpoint"
+ATTR_ENDPOINT_KEY = "endpoint_key"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+REFRESH_ENDPOINT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENDPOINT_KEY): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list[GatusConfigEntry]:
+    """Return the loaded entries a service call applies to."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    entries = [
+        entry
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        if entry_id is None or entry.entry_id == entry_id
+    ]
+    if entry_id is not None and not entries:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return entries
+
+
+async def _async_refresh_endpoint(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Re-fetch endpoints by key without polling the whole fleet."""
+    keys: list[str] = call.data[ATTR_ENDPOINT_KEY]
+    refreshed: set[str] = set()
+    for entry in _loaded_entries(hass, call):
+        coordinator = entry.runtime_data.coordinator
+        entry_keys = [key for key in keys if key in (coordinator.data or {})]
+        if not entry_keys:
+            continue
+        try:
+            await coordinator.async_refresh_endpoints(entry_keys)
+        except GatusApiClientError as exception:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="refresh_failed",
+                translation_placeholders={"error": str(exception)},
+            ) from exception
+        refreshed.update(entry_keys)
+
+    if unknown := [key for key in keys if key not in refreshed]:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unknown_endpoint",
+            translation_placeholders={"keys": ", ".join(unknown)},
+        )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _refresh_endpoint(call: ServiceCall) -> None:
+        await _async_refresh_endpoint(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_ENDPOINT,
+        _refresh_endpoint,
+        schema=REFRESH_ENDPOINT_SCHEMA,
+    )
@@ -0,0 +1,73 @@
+"""Persisted snapshot of the last good endpoint statuses."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .models import GatusEndpoint, GatusResult, _intern
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import GatusCoordinatorData
+
+SNAPSHOT_VERSION = 1
+
+type _Row = list[Any]
+
+
+def async_get_snapshot_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, list[_Row]]]:
+    """Return the store holding an entry's snapshot."""
+    return Store(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def pack_endpoints(data: GatusCoordinatorData) -> dict[str, list[_Row]]:
+    """
+    Return endpoints as compact rows for storage.
+
+    Each endpoint becomes a flat ``[key, name, group, *latest_result]`` list;
+    only the latest result is kept, as that is all entities need at startup.
+    """
+    rows: list[_Row] = []
+    for endpoint in data.values():
+        row: _Row = [endpoint.key, endpoint.name, endpoint.group]
+        if (latest := endpoint.latest_result) is not None:
+            row += [
+                latest.success,
+                latest.hostname,
+                latest.status_code,
+                latest.duration_ns,
+                latest.timestamp,
+            ]
+        rows.append(row)
+    return {"endpoints": rows}
+
+
+def unpack_endpoints(stored: dict[str, list[_Row]]) -> GatusCoordinatorData:
+    """Rebuild the coordinator data from stored rows."""
+    endpoints: GatusCoordinatorData = {}
+    for key, name, group, *latest in stored.get("endpoints", []):
+        results = []
+        if latest:
+            success, hostname, status_code, duration_ns, timestamp = latest
+            results.append(
+                GatusResult(
+                    success=success,
+                    hostname=_intern(hostname),
+                    status_code=status_code,
+                    duration_ns=duration_ns,
+                    timestamp=timestamp,
+                )
+            )
+        endpoints[key] = GatusEndpoint(
+            key=_intern(key),
+            name=_intern(name),
+            group=_intern(group),
+            results=results,
+        )
+    return endpoints
@@ -0,0 +1,184 @@
+"""Request phase timing for Gatus API calls."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+# Phases of a request, in the order they happen.
+PHASES = ("dns", "connect", "ttfb", "transfer", "decode", "total")
+
+
+def elapsed_ms(since: float) -> float:
+    """Return the milliseconds elapsed since a perf_counter mark."""
+    return (time.perf_counter() - since) * 1000
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """
+    Phase durations of one Gatus request, in milliseconds.
+
+    ``dns`` and ``connect`` are only filled in when the session was created
+    with ``create_trace_config()``, and are 0 for a reused connection.
+    ``ttfb`` runs from the request headers being sent to the response headers
+    arriving, ``transfer`` covers reading the body and ``decode`` turning it
+    into models; in streaming mode the two overlap and decode time is
+    subtracted from transfer.
+    """
+
+    dns: float | None = None
+    connect: float | None = None
+    ttfb: float | None = None
+    transfer: float | None = None
+    decode: float | None = None
+    total: float | None = None
+    bytes_received: int = 0
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+
+class RollingStats:
+    """Summary statistics over the most recent ``size`` samples."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty sample window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the newest sample, if any."""
+        return self._samples[-1] if self._samples else None
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one when full."""
+        self._samples.append(value)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the given percentile (0-100) of the samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(len(ordered) * percentile / 100), 1)
+        return ordered[rank - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count, last, mean, median, p95 and max of the samples."""
+        if not self._samples:
+            return {"count": 0}
+        return {
+            "count": len(self._samples),
+            "last": self.last,
+            "mean": sum(self._samples) / len(self._samples),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": max(self._samples),
+        }
+
+
+class RequestStats:
+    """Rolling statistics of every request phase and the payload size."""
+
+    __slots__ = ("bytes_received", "phases")
+
+    def __init__(self, size: int) -> None:
+        """Keep the most recent ``size`` requests."""
+        self.phases = {phase: RollingStats(size) for phase in PHASES}
+        self.bytes_received = RollingStats(size)
+
+    def add(self, timing: RequestTiming) -> None:
+        """Add the measurements of one request."""
+        for phase, stats in self.phases.items():
+            value = getattr(timing, phase)
+            if value is not None:
+                stats.add(value)
+        self.bytes_received.add(timing.bytes_received)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of every phase, in milliseconds, and bytes."""
+        return {
+            **{f"{phase}_ms": stats.as_dict() for phase, stats in self.phases.items()},
+            "bytes_received": self.bytes_received.as_dict(),
+        }
+
+
+def _timing(trace_config_ctx: SimpleNamespace) -> RequestTiming | None:
+    """Return the timing record passed as ``trace_request_ctx``, if any."""
+    timing = trace_config_ctx.trace_request_ctx
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_dns_resolvehost_start(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    trace_config_ctx.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    if (timing := _timing(trace_config_ctx)) is not None:
+        timing.dns = elapsed_ms(trace_config_ctx.dns_start)
+
+
+async def _on_connection_create_start(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    trace_config_ctx.connect_start = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    if (timing := _timing(trace_config_ctx)) is not None:
+        # Host resolution happens inside connection setup; report it apart.
+        timing.connect = elapsed_ms(trace_config_ctx.connect_start) - (timing.dns or 0)
+        timing.dns = timing.dns or 0
+
+
+async def _on_connection_reuseconn(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    if (timing := _timing(trace_config_ctx)) is not None:
+        timing.dns = timing.connect = 0
+
+
+async def _on_request_headers_sent(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    trace_config_ctx.headers_sent = time.perf_counter()
+
+
+async def _on_request_end(
+    _session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace, _params: Any
+) -> None:
+    if (timing := _timing(trace_config_ctx)) is not None and hasattr(
+        trace_config_ctx, "headers_sent"
+    ):
+        timing.ttfb = elapsed_ms(trace_config_ctx.headers_sent)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return a trace config that fills in RequestTiming connection phases."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
@@ -0,0 +1,70 @@
+"""Webhook receiver for Gatus custom alerts."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID
+
+from .api import GatusApiClientError
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from aiohttp.web import Request
+    from homeassistant.core import HomeAssistant
+
+    from .data import GatusConfigEntry
+
+# Characters Gatus replaces with "-" when it builds an endpoint key.
+_KEY_UNSAFE = re.compile(r"[/_,.# ]")
+
+
+def endpoint_key(group: str, name: str) -> str:
+    """Return the Gatus endpoint key for a group and endpoint name."""
+    group_part = _KEY_UNSAFE.sub("-", group.strip().lower())
+    name_part = _KEY_UNSAFE.sub("-", name.strip().lower())
+    return f"{group_part}_{name_part}"
+
+
+def async_register_webhook(hass: HomeAssistant, entry: GatusConfigEntry) -> None:
+    """Register the entry's webhook and unregister it when the entry unloads."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def _refresh(key: str | None) -> None:
+        """Refresh the alerting endpoint, or all of them if it is unknown."""
+        coordinator = entry.runtime_data.coordinator
+        if key and key in (coordinator.data or {}):
+            try:
+                await coordinator.async_refresh_endpoints([key])
+            except GatusApiClientError as exception:
+                LOGGER.warning("Error refreshing Gatus endpoint %s: %s", key, exception)
+            else:
+                return
+        await coordinator.async_request_refresh()
+
+    async def _handle_webhook(
+        hass: HomeAssistant,
+        webhook_id: str,  # noqa: ARG001 Unused function argument: `webhook_id`
+        request: Request,
+    ) -> None:
+        """Start refreshing the alerting endpoint and answer Gatus right away."""
+        try:
+            payload = await request.json()
+        except ValueError:
+            payload = None
+        key = None
+        if isinstance(payload, dict):
+            key = payload.get("key")
+            if not key and payload.get("name"):
+                key = endpoint_key(payload.get("group") or "", payload["name"])
+        LOGGER.debug("Gatus webhook received for endpoint %s", key or "unknown")
+        # A refresh can take several timed-out attempts; Gatus' alert client
+        # would give up on the request long before that.
+        entry.async_create_background_task(
+            hass, _refresh(key), f"gatus webhook refresh {key or 'all'}"
+        )
+
+    webhook.async_register(hass, DOMAIN, entry.title, webhook_id, _handle_webhook)
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
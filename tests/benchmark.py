@@ -0,0 +1,296 @@
+"""
+Benchmarks of the integration's hot paths against synthetic Gatus fleets.
+
+Run with ``scripts/benchmark`` or ``python -m tests.benchmark``. Results are
+printed (or written with ``--output``) as JSON: one record per case and fleet
+size, with the best wall time of ``--repeat`` runs and the peak memory
+allocated by one more run under tracemalloc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+from homeassistant.const import CONF_URL
+
+from custom_components.gatus import binary_sensor
+from custom_components.gatus.const import LOGGER
+from custom_components.gatus.coordinator import GatusDataUpdateCoordinator
+from custom_components.gatus.devices import GatusDevices
+from custom_components.gatus.models import GatusEndpoint
+
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 50_000)
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Measurements of one case at one fleet size."""
+
+    case: str
+    endpoints: int
+    history_depth: int
+    failure_rate: float
+    seconds: float
+    per_endpoint_us: float
+    peak_bytes: int
+
+
+class _PayloadClient:
+    """Stands in for GatusApiClient, serving a decoded payload."""
+
+    last_timing = None
+
+    def __init__(self, payload: list[dict[str, Any]]) -> None:
+        self.payload = payload
+
+    async def async_get_data(self, item_hook: Callable[[Any], Any]) -> list[Any]:
+        return [
+            hooked for item in self.payload if (hooked := item_hook(item)) is not None
+        ]
+
+
+class _NullStore:
+    """Stands in for the snapshot store; nothing is written."""
+
+    def async_delay_save(self, *_args: Any) -> None:
+        return None
+
+
+class _BenchmarkEntry:
+    """Just enough of a config entry for the coordinator and the platforms."""
+
+    entry_id = "benchmark"
+    pref_disable_polling = False
+    data = {CONF_URL: "http://gatus.example.com"}  # noqa: RUF012
+    options: dict[str, Any] = {}  # noqa: RUF012
+
+    def __init__(self) -> None:
+        self.runtime_data = MagicMock()
+        self.runtime_data.integration.version = "1.0.0"
+        self.runtime_data.devices = GatusDevices(self)
+
+    def async_on_unload(self, _func: Callable[[], None]) -> None:
+        return None
+
+
+def make_coordinator(
+    payload: list[dict[str, Any]],
+    statistics_windows: dict[str, int] | None = None,
+) -> GatusDataUpdateCoordinator:
+    """
+    Build a coordinator serving ``payload`` without a running Home Assistant.
+
+    Like the integration, no statistic windows are kept by default.
+    """
+    entry = _BenchmarkEntry()
+    coordinator = GatusDataUpdateCoordinator(
+        hass=MagicMock(),
+        logger=LOGGER,
+        name="benchmark",
+        config_entry=entry,
+        update_interval=timedelta(seconds=60),
+        always_update=False,
+        statistics_windows=statistics_windows or {},
+    )
+    coordinator._snapshot_store = _NullStore()
+    entry.runtime_data.client = _PayloadClient(payload)
+    entry.runtime_data.coordinator = coordinator
+    return coordinator
+
+
+async def setup_binary_sensors(
+    coordinator: GatusDataUpdateCoordinator,
+) -> tuple[Callable[[], None], list[Any]]:
+    """Set up the binary sensor platform; return its listener and entities."""
+    entities: list[Any] = []
+    listeners: list[Callable[[], None]] = []
+    add_listener = coordinator.async_add_listener
+
+    def _capture(
+        listener: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        listeners.append(listener)
+        return add_listener(listener, context)
+
+    coordinator.async_add_listener = _capture  # type: ignore[method-assign]
+    try:
+        await binary_sensor.async_setup_entry(
+            coordinator.hass, coordinator.config_entry, entities.extend
+        )
+    finally:
+        del coordinator.async_add_listener
+    return listeners[0], entities
+
+
+def _cases(
+    fleet: SyntheticFleet, loop: asyncio.AbstractEventLoop
+) -> dict[str, tuple[Callable[[], Any], Callable[[Any], Any]]]:
+    """Return ``name: (setup, run)`` pairs; only ``run`` is measured."""
+    first = fleet.statuses(poll=0)
+    second = fleet.statuses(poll=1)
+
+    def _polled() -> GatusDataUpdateCoordinator:
+        coordinator = make_coordinator(first)
+        coordinator.data = loop.run_until_complete(coordinator._async_update_data())
+        coordinator.config_entry.runtime_data.client.payload = second
+        return coordinator
+
+    def _update(coordinator: GatusDataUpdateCoordinator) -> None:
+        coordinator.data = loop.run_until_complete(coordinator._async_update_data())
+
+    def _with_listener() -> tuple[GatusDataUpdateCoordinator, Callable[[], None]]:
+        coordinator = _polled()
+        listener, _entities = loop.run_until_complete(setup_binary_sensors(coordinator))
+        # Poll the same payload again so the listener sees the steady state
+        # rather than every endpoint reported as added by the first poll.
+        coordinator.config_entry.runtime_data.client.payload = first
+        _update(coordinator)
+        assert not coordinator.added_endpoint_keys
+        assert not coordinator.removed_endpoint_keys
+        return coordinator, listener
+
+    def _with_entities() -> list[Any]:
+        coordinator = _polled()
+        return loop.run_until_complete(setup_binary_sensors(coordinator))[1]
+
+    def _properties(entities: list[Any]) -> None:
+        for entity in entities:
+            _ = entity.available, entity.is_on, entity.extra_state_attributes
+
+    return {
+        "from_dict": (
+            lambda: first,
+            lambda payload: list(map(GatusEndpoint.from_dict, payload)),
+        ),
+        "async_update_data": (_polled, _update),
+        "setup_endpoint_entities": (
+            lambda: _loaded(make_coordinator(first), first),
+            lambda coordinator: loop.run_until_complete(
+                setup_binary_sensors(coordinator)
+            ),
+        ),
+        "endpoint_discovery_unchanged": (
+            _with_listener,
+            lambda state: state[1](),
+        ),
+        "entity_properties": (_with_entities, _properties),
+    }
+
+
+def _loaded(
+    coordinator: GatusDataUpdateCoordinator, payload: list[dict[str, Any]]
+) -> GatusDataUpdateCoordinator:
+    """Give ``coordinator`` the models of ``payload`` as its data."""
+    endpoints = map(GatusEndpoint.from_dict, payload)
+    coordinator.data = {endpoint.key: endpoint for endpoint in endpoints}
+    return coordinator
+
+
+def _time(setup: Callable[[], Any], run: Callable[[Any], Any], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` runs, each on a fresh setup."""
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(setup: Callable[[], Any], run: Callable[[Any], Any]) -> int:
+    """Return the peak bytes allocated on top of the setup during one run."""
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        run(state)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    history_depth: int = 1,
+    failure_rate: float = 0.05,
+    repeat: int = 3,
+    cases: Sequence[str] | None = None,
+) -> list[BenchmarkResult]:
+    """Run the selected cases (all by default) for every fleet size."""
+    results = []
+    loop = asyncio.new_event_loop()
+    try:
+        for size in sizes:
+            fleet = SyntheticFleet(
+                size, history_depth=history_depth, failure_rate=failure_rate
+            )
+            for name, (setup, run) in _cases(fleet, loop).items():
+                if cases and name not in cases:
+                    continue
+                seconds = _time(setup, run, repeat)
+                results.append(
+                    BenchmarkResult(
+                        case=name,
+                        endpoints=size,
+                        history_depth=history_depth,
+                        failure_rate=failure_rate,
+                        seconds=seconds,
+                        per_endpoint_us=seconds / size * 1_000_000,
+                        peak_bytes=_peak_memory(setup, run),
+                    )
+                )
+    finally:
+        loop.close()
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmarks from the command line and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--endpoints", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--history-depth", type=int, default=1)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", dest="cases")
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.endpoints,
+        history_depth=args.history_depth,
+        failure_rate=args.failure_rate,
+        repeat=args.repeat,
+        cases=args.cases,
+    )
+    json.dump(
+        {
+            "python": platform.python_version(),
+            "results": [asdict(result) for result in results],
+        },
+        args.output,
+        indent=2,
+    )
+    args.output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -72,6 +72,6 @@ def mock_endpoints_dict() -> dict[str, GatusEndpoint]:
 @pytest.fixture
 def mock_api_client(mock_endpoint_data: list[dict]) -> MagicMock:
     """Return a mock GatusApiClient."""
-    client = MagicMock()
+    client = MagicMock(last_timing=None)
     client.async_get_data = AsyncMock(return_value=mock_endpoint_data)
     return client
@@ -0,0 +1,211 @@
+"""
+A local stand-in for a Gatus server, with latency and fault injection.
+
+Serves ``/api/v1/endpoints/statuses`` and the per-endpoint statuses routes
+from a SyntheticFleet. Use ``FakeGatus.app()`` with aiohttp's ``TestServer``
+in tests, or run ``python -m tests.fake_gatus`` and point a development Home
+Assistant at it for load testing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs, web
+
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+
+class FakeGatus:
+    """
+    Serves a synthetic fleet the way Gatus does, with configurable misbehaviour.
+
+    Every response waits ``latency`` seconds first. With ``chunk_size`` set
+    the body is sent chunked, ``chunk_delay`` seconds apart. With ``etag`` the
+    responses carry an ETag and a matching ``If-None-Match`` gets a 304.
+
+    The fleet stays at ``poll`` until ``advance()`` is called (after every
+    statuses request with ``auto_advance``), which moves every endpoint on by
+    one check and adds and removes ``churn`` endpoints. Faults queued with
+    ``fail()`` are answered, in order, before anything else.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fleet: SyntheticFleet,
+        *,
+        latency: float = 0.0,
+        chunk_size: int | None = None,
+        chunk_delay: float = 0.0,
+        etag: bool = True,
+        churn: tuple[int, int] = (0, 0),
+        auto_advance: bool = False,
+    ) -> None:
+        """Serve ``fleet``; see the class docstring for the options."""
+        self.fleet = fleet
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.etag = etag
+        self.churn = churn
+        self.auto_advance = auto_advance
+        self.poll = 0
+        # (method, path with query, request headers) of every request served.
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self._faults: deque[tuple[int, float | None]] = deque()
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application serving the Gatus API routes."""
+        app = web.Application()
+        app.router.add_get("/api/v1/endpoints/statuses", self._handle_statuses)
+        app.router.add_get(
+            "/api/v1/endpoints/{key}/statuses", self._handle_endpoint_statuses
+        )
+        return app
+
+    def fail(
+        self, status: int, *, times: int = 1, retry_after: float | None = None
+    ) -> None:
+        """Answer the next ``times`` requests with ``status``, e.g. 401, 429, 503."""
+        self._faults.extend([(status, retry_after)] * times)
+
+    def advance(self) -> None:
+        """Move every endpoint on by one check and apply the endpoint churn."""
+        self.poll += 1
+        added, removed = self.churn
+        if removed:
+            self.fleet.remove(list(self.fleet.endpoints)[:removed])
+        if added:
+            self.fleet.add(added)
+
+    async def _handle_statuses(self, request: web.Request) -> web.StreamResponse:
+        fault = await self._prepare(request)
+        if fault is not None:
+            return fault
+        payload = self.fleet.statuses(self.poll, _page_size(request))
+        response = await self._respond(request, payload)
+        if self.auto_advance:
+            self.advance()
+        return response
+
+    async def _handle_endpoint_statuses(
+        self, request: web.Request
+    ) -> web.StreamResponse:
+        fault = await self._prepare(request)
+        if fault is not None:
+            return fault
+        payload = self.fleet.endpoint_status(
+            request.match_info["key"], self.poll, _page_size(request)
+        )
+        if payload is None:
+            return web.json_response({"error": "not found"}, status=404)
+        return await self._respond(request, payload)
+
+    async def _prepare(self, request: web.Request) -> web.Response | None:
+        """Log the request, wait out the latency and return a queued fault."""
+        self.requests.append((request.method, request.path_qs, dict(request.headers)))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not self._faults:
+            return None
+        status, retry_after = self._faults.popleft()
+        headers = {}
+        if retry_after is not None:
+            headers[hdrs.RETRY_AFTER] = f"{retry_after:g}"
+        return web.json_response({"error": "injected"}, status=status, headers=headers)
+
+    async def _respond(self, request: web.Request, payload: Any) -> web.StreamResponse:
+        body = json.dumps(payload).encode()
+        headers = {}
+        if self.etag:
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+                return web.Response(status=304, headers={hdrs.ETAG: etag})
+            headers[hdrs.ETAG] = etag
+        if not self.chunk_size:
+            return web.Response(
+                body=body, content_type="application/json", headers=headers
+            )
+
+        response = web.StreamResponse(headers=headers)
+        response.content_type = "application/json"
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for start in range(0, len(body), self.chunk_size):
+            if start and self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            await response.write(body[start : start + self.chunk_size])
+        await response.write_eof()
+        return response
+
+
+def _page_size(request: web.Request) -> int | None:
+    """Return the ``pageSize`` query parameter, if valid."""
+    try:
+        return max(int(request.query["pageSize"]), 1)
+    except (KeyError, ValueError):
+        return None
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run a fake Gatus server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--endpoints", type=int, default=1000)
+    parser.add_argument("--history-depth", type=int, default=1)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--chunk-delay", type=float, default=0.0)
+    parser.add_argument("--no-etag", action="store_false", dest="etag")
+    parser.add_argument("--churn", type=int, nargs=2, default=(0, 0))
+    parser.add_argument(
+        "--advance-every",
+        type=float,
+        default=60.0,
+        help="seconds between new checks, like the Gatus check interval",
+    )
+    args = parser.parse_args(argv)
+
+    fake = FakeGatus(
+        SyntheticFleet(
+            args.endpoints,
+            history_depth=args.history_depth,
+            failure_rate=args.failure_rate,
+        ),
+        latency=args.latency,
+        chunk_size=args.chunk_size,
+        chunk_delay=args.chunk_delay,
+        etag=args.etag,
+        churn=tuple(args.churn),
+    )
+
+    async def _advance_periodically(_app: web.Application) -> AsyncIterator[None]:
+        async def _advance() -> None:
+            while True:
+                await asyncio.sleep(args.advance_every)
+                fake.advance()
+
+        task = asyncio.create_task(_advance())
+        yield
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    app = fake.app()
+    app.cleanup_ctx.append(_advance_periodically)
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
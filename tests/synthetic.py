@@ -0,0 +1,163 @@
+"""Deterministic synthetic Gatus status payloads for benchmarks and load tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from custom_components.gatus.webhook import endpoint_key
+
+# Timestamp of the first check of every synthetic endpoint.
+EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(*values: int) -> float:
+    """Return a well-spread, reproducible number in [0, 1) for ``values``."""
+    state = 0x9E3779B97F4A7C15
+    for value in values:
+        state = (state ^ value) * 0xBF58476D1CE4E5B9 & _MASK
+        state ^= state >> 31
+        state = state * 0x94D049BB133111EB & _MASK
+        state ^= state >> 29
+    return (state >> 11) / (1 << 53)
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticEndpoint:
+    """Identity and behaviour of one synthetic endpoint."""
+
+    index: int
+    group: str
+    name: str
+    key: str
+    base_latency_ms: float
+
+
+class SyntheticFleet:
+    """
+    A fleet of Gatus endpoints whose statuses are a pure function of the poll.
+
+    Every endpoint runs one check per poll. Poll ``n`` reports, per endpoint,
+    the ``history_depth`` checks ending with check ``n``, oldest first like
+    Gatus does. Whether a check fails and how long it took depend only on
+    ``seed``, the endpoint and the check number, so the same arguments always
+    produce the same payload.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        count: int,
+        *,
+        history_depth: int = 1,
+        failure_rate: float = 0.05,
+        jitter: float = 0.5,
+        group_size: int = 50,
+        interval: int = 60,
+        seed: int = 0,
+    ) -> None:
+        """
+        Create ``count`` endpoints spread over groups of ``group_size``.
+
+        Response times vary by up to ``jitter`` times an endpoint's base
+        latency either way.
+        """
+        self.history_depth = history_depth
+        self.failure_rate = failure_rate
+        self.jitter = jitter
+        self.interval = interval
+        self.seed = seed
+        self._group_size = group_size
+        self._next_index = 0
+        self.endpoints: dict[str, SyntheticEndpoint] = {}
+        self.add(count)
+
+    def add(self, count: int) -> list[str]:
+        """Add ``count`` new endpoints and return their keys."""
+        keys = []
+        for index in range(self._next_index, self._next_index + count):
+            group = f"group-{index // self._group_size:03d}"
+            name = f"endpoint-{index:05d}"
+            endpoint = SyntheticEndpoint(
+                index=index,
+                group=group,
+                name=name,
+                key=endpoint_key(group, name),
+                base_latency_ms=5 + 200 * _mix(self.seed, index),
+            )
+            self.endpoints[endpoint.key] = endpoint
+            keys.append(endpoint.key)
+        self._next_index += count
+        return keys
+
+    def remove(self, keys: list[str]) -> None:
+        """Remove the endpoints with the given keys."""
+        for key in keys:
+            self.endpoints.pop(key, None)
+
+    def statuses(
+        self, poll: int = 0, history_depth: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the ``/api/v1/endpoints/statuses`` payload at ``poll``.
+
+        ``history_depth`` overrides the fleet's depth, like Gatus' ``pageSize``.
+        """
+        depth = history_depth or self.history_depth
+        return [
+            self._status(endpoint, poll, depth) for endpoint in self.endpoints.values()
+        ]
+
+    def endpoint_status(
+        self, key: str, poll: int = 0, history_depth: int | None = None
+    ) -> dict[str, Any] | None:
+        """Return the per-endpoint statuses payload of ``key`` at ``poll``."""
+        endpoint = self.endpoints.get(key)
+        if endpoint is None:
+            return None
+        return self._status(endpoint, poll, history_depth or self.history_depth)
+
+    def _status(
+        self, endpoint: SyntheticEndpoint, poll: int, depth: int
+    ) -> dict[str, Any]:
+        first = max(poll - depth + 1, 0)
+        return {
+            "name": endpoint.name,
+            "group": endpoint.group,
+            "key": endpoint.key,
+            "results": [
+                self._result(endpoint, check) for check in range(first, poll + 1)
+            ],
+            "events": [{"type": "START", "timestamp": _timestamp(EPOCH)}],
+        }
+
+    def _checked_at(self, endpoint_index: int, check: int) -> datetime:
+        # Spread the endpoints over the interval like a real Gatus schedule.
+        offset = endpoint_index % self.interval
+        return EPOCH + timedelta(seconds=check * self.interval + offset)
+
+    def _result(self, endpoint: SyntheticEndpoint, check: int) -> dict[str, Any]:
+        success = _mix(self.seed, endpoint.index, check, 1) >= self.failure_rate
+        spread = 2 * _mix(self.seed, endpoint.index, check, 2) - 1
+        duration_ms = endpoint.base_latency_ms * (1 + self.jitter * spread)
+        result: dict[str, Any] = {
+            "status": 200 if success else 503,
+            "hostname": f"{endpoint.name}.{endpoint.group}.example.com",
+            "duration": int(duration_ms * 1_000_000),
+            "conditionResults": [
+                {"condition": "[STATUS] == 200", "success": success},
+                {"condition": "[RESPONSE_TIME] < 1000", "success": True},
+            ],
+            "success": success,
+            "timestamp": _timestamp(self._checked_at(endpoint.index, check)),
+        }
+        if not success:
+            result["errors"] = ["unexpected status code 503"]
+        return result
+
+
+def _timestamp(value: datetime) -> str:
+    """Format a timestamp the way Gatus does."""
+    return value.isoformat().replace("+00:00", "Z")
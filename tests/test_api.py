@@ -2,35 +2,67 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import json
+import threading
+import time
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
+from multidict import CIMultiDict
 
 from custom_components.gatus.api import (
+    CIRCUIT_COOLDOWN_MAX,
+    CIRCUIT_FAILURE_THRESHOLD,
+    NOT_MODIFIED,
     GatusApiClient,
     GatusApiClientAuthenticationError,
     GatusApiClientCommunicationError,
     GatusApiClientError,
+    JsonArrayStreamDecoder,
+    _parse_retry_after,
     _verify_response_or_raise,
+    default_json_loads,
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    """Skip the waits between retries."""
+    with patch("custom_components.gatus.api.asyncio.sleep", new=AsyncMock()) as sleep:
+        yield sleep
+
+
 @pytest.fixture
 def mock_session() -> MagicMock:
     """Return a mock aiohttp.ClientSession."""
     return MagicMock(spec=aiohttp.ClientSession)
 
 
-def _make_mock_response(status: int, payload: object = None) -> MagicMock:
+def _make_mock_response(
+    status: int, payload: object = None, headers: dict | None = None
+) -> MagicMock:
     """Build a mock aiohttp response."""
     response = MagicMock()
     response.status = status
-    response.json = AsyncMock(return_value=payload or [])
+    response.headers = CIMultiDict(headers or {})
+    response.read = AsyncMock(return_value=json.dumps(payload or []).encode())
     response.raise_for_status = MagicMock()
     return response
 
 
+def _make_streaming_response(body: bytes, chunk_size: int) -> MagicMock:
+    """Build a mock aiohttp response whose body arrives in fixed-size chunks."""
+
+    async def _iter_chunked(_size: int):
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    response = _make_mock_response(200)
+    response.content.iter_chunked = _iter_chunked
+    return response
+
+
 class TestVerifyResponseOrRaise:
     """Tests for _verify_response_or_raise."""
 
@@ -81,9 +113,24 @@ class TestGatusApiClient:
             method="get",
             url="http://localhost:8080/api/v1/endpoints/statuses",
             headers=None,
+            params=None,
             json=None,
+            trace_request_ctx=ANY,
         )
 
+    async def test_history_depth_requests_single_page(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that history_depth asks Gatus for one page of that size."""
+        mock_session.request = AsyncMock(return_value=_make_mock_response(200, []))
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, history_depth=1
+        )
+        await client.async_get_data()
+        _, kwargs = mock_session.request.call_args
+        assert kwargs["params"] == {"page": 1, "pageSize": 1}
+
     async def test_url_trailing_slash_stripped(self, mock_session: MagicMock) -> None:
         """Test that a trailing slash in the URL is stripped."""
         mock_session.request = AsyncMock(return_value=_make_mock_response(200, []))
@@ -132,3 +179,512 @@ class TestGatusApiClient:
         client = GatusApiClient(url="http://localhost:8080", session=mock_session)
         with pytest.raises(GatusApiClientError, match="Something really wrong"):
             await client.async_get_data()
+
+
+class TestGatusApiClientRetries:
+    """Tests for retries, Retry-After and the circuit breaker."""
+
+    async def test_transient_error_is_retried(
+        self, mock_session: MagicMock, mock_sleep: AsyncMock
+    ) -> None:
+        """A communication error followed by success returns the data."""
+        mock_session.request = AsyncMock(
+            side_effect=[TimeoutError, _make_mock_response(200, [{"key": "a"}])]
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_data() == [{"key": "a"}]
+        assert mock_session.request.call_count == 2
+        # Equal jitter on a 1 s base keeps the first wait between 0.5 and 1 s.
+        assert 0.5 <= mock_sleep.call_args.args[0] <= 1
+
+    async def test_gives_up_after_max_retries(self, mock_session: MagicMock) -> None:
+        """Retries are bounded by max_retries."""
+        mock_session.request = AsyncMock(side_effect=TimeoutError)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, max_retries=3
+        )
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_data()
+        assert mock_session.request.call_count == 4
+
+    async def test_auth_error_is_not_retried(self, mock_session: MagicMock) -> None:
+        """Authentication errors fail on the first attempt."""
+        mock_session.request = AsyncMock(return_value=_make_mock_response(401))
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        with pytest.raises(GatusApiClientAuthenticationError):
+            await client.async_get_data()
+        assert mock_session.request.call_count == 1
+
+    async def test_retry_after_is_honoured(
+        self, mock_session: MagicMock, mock_sleep: AsyncMock
+    ) -> None:
+        """A 429 with Retry-After waits exactly that long before retrying."""
+        mock_session.request = AsyncMock(
+            side_effect=[
+                _make_mock_response(429, headers={"Retry-After": "7"}),
+                _make_mock_response(200, []),
+            ]
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        await client.async_get_data()
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    async def test_long_retry_after_opens_circuit(
+        self, mock_session: MagicMock
+    ) -> None:
+        """A Retry-After too long to wait out pauses requests instead."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(503, headers={"Retry-After": "120"})
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_data()
+        with pytest.raises(GatusApiClientCommunicationError, match="paused"):
+            await client.async_get_data()
+        assert mock_session.request.call_count == 1
+
+    async def test_retry_after_cooldown_is_capped(
+        self, mock_session: MagicMock
+    ) -> None:
+        """A huge Retry-After pauses requests for at most CIRCUIT_COOLDOWN_MAX."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(503, headers={"Retry-After": "86400"})
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_data()
+
+        assert client._circuit_open_until is not None
+        remaining = client._circuit_open_until - time.monotonic()
+        assert 0 < remaining <= CIRCUIT_COOLDOWN_MAX
+
+    async def test_circuit_opens_after_repeated_failures(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Consecutive failed calls stop requests until the cool-down passes."""
+        mock_session.request = AsyncMock(side_effect=TimeoutError)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, max_retries=0
+        )
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(GatusApiClientCommunicationError, match="Timeout"):
+                await client.async_get_data()
+        with pytest.raises(GatusApiClientCommunicationError, match="paused"):
+            await client.async_get_data()
+        assert mock_session.request.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+        # After the cool-down a single probe request is let through.
+        client._circuit_open_until = 0
+        mock_session.request = AsyncMock(return_value=_make_mock_response(200, []))
+        assert await client.async_get_data() == []
+        assert client._consecutive_failures == 0
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("5", 5.0), ("-1", 0.0), ("", None), ("soon", None)],
+    )
+    def test_parse_retry_after(self, value: str, expected: float | None) -> None:
+        """Retry-After seconds are parsed and clamped; junk is ignored."""
+        assert _parse_retry_after(value) == expected
+
+    def test_parse_retry_after_http_date(self) -> None:
+        """A Retry-After date in the past means retry now."""
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestGatusApiClientGetEndpoint:
+    """Tests for GatusApiClient.async_get_endpoint."""
+
+    async def test_requests_per_endpoint_route(self, mock_session: MagicMock) -> None:
+        """The endpoint key is quoted into the per-endpoint statuses route."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, {"key": "media_plex"})
+        )
+
+        client = GatusApiClient(
+            url="http://localhost:8080/", session=mock_session, history_depth=1
+        )
+        result = await client.async_get_endpoint("media/plex")
+
+        assert result == {"key": "media_plex"}
+        _, kwargs = mock_session.request.call_args
+        assert (
+            kwargs["url"]
+            == "http://localhost:8080/api/v1/endpoints/media%2Fplex/statuses"
+        )
+        assert kwargs["params"] == {"page": 1, "pageSize": 1}
+
+    async def test_item_hook_applied(self, mock_session: MagicMock) -> None:
+        """The decoded record is passed through item_hook."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, {"key": "media_plex"})
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_endpoint("media_plex", item_hook=len) == 1
+
+    async def test_not_found_raises_communication_error(
+        self, mock_session: MagicMock
+    ) -> None:
+        """An unknown key surfaces as a communication error."""
+        response = _make_mock_response(404)
+        response.raise_for_status = MagicMock(
+            side_effect=aiohttp.ClientResponseError(MagicMock(), (), status=404)
+        )
+        mock_session.request = AsyncMock(return_value=response)
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_endpoint("missing")
+
+
+class TestGatusApiClientConditionalFetch:
+    """Tests for conditional fetching of endpoint statuses."""
+
+    async def test_etag_sent_as_if_none_match(self, mock_session: MagicMock) -> None:
+        """The ETag of the previous response is sent back on the next request."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, [{"key": "a"}], {"ETag": '"v1"'})
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        await client.async_get_data()
+        assert mock_session.request.call_args.kwargs["headers"] is None
+
+        await client.async_get_data()
+        assert mock_session.request.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"'
+        }
+
+    async def test_last_modified_sent_as_if_modified_since(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Last-Modified is used as a validator when there is no ETag."""
+        last_modified = "Thu, 01 Jan 2026 00:00:00 GMT"
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(
+                200, [{"key": "a"}], {"Last-Modified": last_modified}
+            )
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        await client.async_get_data()
+        await client.async_get_data()
+        assert mock_session.request.call_args.kwargs["headers"] == {
+            "If-Modified-Since": last_modified
+        }
+
+    async def test_304_returns_not_modified(self, mock_session: MagicMock) -> None:
+        """A 304 answer is reported as NOT_MODIFIED without reading the body."""
+        response = _make_mock_response(304)
+        mock_session.request = AsyncMock(return_value=response)
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_data() is NOT_MODIFIED
+        response.read.assert_not_called()
+
+    async def test_identical_body_returns_not_modified(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Without validators, an identical body hashes the same and is skipped."""
+        payload = [{"key": "external_google"}]
+        mock_session.request = AsyncMock(return_value=_make_mock_response(200, payload))
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_data() == payload
+        assert await client.async_get_data() is NOT_MODIFIED
+
+    async def test_changed_body_is_decoded(self, mock_session: MagicMock) -> None:
+        """A different body is decoded and returned."""
+        mock_session.request = AsyncMock(
+            side_effect=[
+                _make_mock_response(200, [{"key": "a"}]),
+                _make_mock_response(200, [{"key": "b"}]),
+            ]
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        await client.async_get_data()
+        assert await client.async_get_data() == [{"key": "b"}]
+
+
+class TestJsonArrayStreamDecoder:
+    """Tests for the incremental JSON array decoder."""
+
+    def test_elements_split_across_chunks(self) -> None:
+        """Elements are returned once complete, whatever the chunk boundaries."""
+        payload = [
+            {"key": "a", "name": "ä", "results": [{"duration": 123}]},
+            {"key": "b", "results": []},
+        ]
+        body = json.dumps(payload, ensure_ascii=False).encode()
+
+        decoder = JsonArrayStreamDecoder()
+        items = []
+        for start in range(0, len(body), 3):
+            items.extend(decoder.feed(body[start : start + 3]))
+        items.extend(decoder.close())
+        assert items == payload
+
+    def test_element_is_yielded_before_array_ends(self) -> None:
+        """A complete element is returned without waiting for the closing bracket."""
+        decoder = JsonArrayStreamDecoder()
+        assert decoder.feed(b'[{"key": "a"}, {"key"') == [{"key": "a"}]
+        assert decoder.feed(b': "b"}]') == [{"key": "b"}]
+        assert decoder.close() == []
+
+    def test_number_split_across_chunks(self) -> None:
+        """A bare number at the end of a chunk waits for the rest of its digits."""
+        decoder = JsonArrayStreamDecoder()
+        assert decoder.feed(b"[12") == []
+        assert decoder.feed(b"3, 4]") == [123, 4]
+
+    @pytest.mark.parametrize(
+        ("chunks", "expected"),
+        [
+            ([b"[1.", b"5]"], [1.5]),
+            ([b"[1", b".", b"5e", b"-", b"3]"], [1.5e-3]),
+            ([b"[-", b"2, 1]"], [-2, 1]),
+            ([b"[true", b", 1]"], [True, 1]),
+        ],
+    )
+    def test_split_number_waits_for_its_end(
+        self, chunks: list[bytes], expected: list[object]
+    ) -> None:
+        """A number is only complete once a separator or whitespace follows it."""
+        decoder = JsonArrayStreamDecoder()
+        items = []
+        for chunk in chunks:
+            items.extend(decoder.feed(chunk))
+        items.extend(decoder.close())
+        assert items == expected
+
+    @pytest.mark.parametrize(
+        "body",
+        [b"[1,,2]", b"[1 2]", b"[1,]", b"[,1]", b'[{"a": 1}{"b": 2}]', b"[1.x]"],
+    )
+    def test_malformed_separators_raise(self, body: bytes) -> None:
+        """Elements must be separated by exactly one comma."""
+        decoder = JsonArrayStreamDecoder()
+        with pytest.raises(ValueError, match="Expected"):
+            decoder.feed(body)
+
+    @pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[[], {}]"])
+    def test_empty_containers(self, body: bytes) -> None:
+        """Empty arrays, alone or as elements, decode."""
+        decoder = JsonArrayStreamDecoder()
+        assert decoder.feed(body) + decoder.close() == json.loads(body)
+
+    def test_truncated_array_raises(self) -> None:
+        """Closing the decoder before the array ends raises ValueError."""
+        decoder = JsonArrayStreamDecoder()
+        decoder.feed(b'[{"key": "a"}, {"ke')
+        with pytest.raises(ValueError, match="Truncated"):
+            decoder.close()
+
+    def test_non_array_raises(self) -> None:
+        """A document that is not an array is rejected."""
+        decoder = JsonArrayStreamDecoder()
+        with pytest.raises(ValueError, match="Expected a JSON array"):
+            decoder.feed(b'{"key": "a"}')
+
+
+class TestGatusApiClientStreaming:
+    """Tests for streaming mode and item hooks."""
+
+    async def test_item_hook_applied_to_each_element(
+        self, mock_session: MagicMock
+    ) -> None:
+        """item_hook transforms every element of a buffered payload."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, [{"key": "a"}, {"key": "b"}])
+        )
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        result = await client.async_get_data(item_hook=lambda item: item["key"])
+        assert result == ["a", "b"]
+
+    async def test_streaming_decodes_chunked_body(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Streaming mode decodes the body chunk by chunk through item_hook."""
+        payload = [{"key": f"endpoint_{i}"} for i in range(50)]
+        body = json.dumps(payload).encode()
+        response = _make_streaming_response(body, chunk_size=7)
+        mock_session.request = AsyncMock(return_value=response)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, stream=True
+        )
+        result = await client.async_get_data(item_hook=lambda item: item["key"])
+        assert result == [item["key"] for item in payload]
+        response.read.assert_not_called()
+
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_item_hook_none_drops_element(
+        self, mock_session: MagicMock, *, stream: bool
+    ) -> None:
+        """Elements the hook maps to None are left out of the result."""
+        body = json.dumps([{"key": "a"}, {"key": "b"}, {"key": "c"}]).encode()
+        response = (
+            _make_streaming_response(body, chunk_size=5)
+            if stream
+            else _make_mock_response(200, json.loads(body))
+        )
+        mock_session.request = AsyncMock(return_value=response)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, stream=stream
+        )
+        result = await client.async_get_data(
+            item_hook=lambda item: None if item["key"] == "b" else item["key"]
+        )
+        assert result == ["a", "c"]
+
+    async def test_reconfigure_drops_cached_body(self, mock_session: MagicMock) -> None:
+        """After reconfigure the same body is decoded again with new options."""
+        mock_session.request = AsyncMock(
+            side_effect=lambda *_a, **_kw: _make_mock_response(200, [{"key": "a"}])
+        )
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_data() == [{"key": "a"}]
+        assert await client.async_get_data() is NOT_MODIFIED
+
+        client.reconfigure(history_depth=5, stream=False)
+
+        assert await client.async_get_data() == [{"key": "a"}]
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["pageSize"] == 5
+
+    async def test_streaming_identical_body_returns_not_modified(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Streaming mode hashes the chunks and detects an unchanged body."""
+        body = json.dumps([{"key": "a"}]).encode()
+        mock_session.request = AsyncMock(
+            side_effect=[
+                _make_streaming_response(body, chunk_size=4),
+                _make_streaming_response(body, chunk_size=5),
+            ]
+        )
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, stream=True
+        )
+        assert await client.async_get_data() == [{"key": "a"}]
+        assert await client.async_get_data() is NOT_MODIFIED
+
+    @pytest.mark.parametrize(("stream", "hooked"), [(False, 1), (True, 2)])
+    async def test_identical_body_decode_cost(
+        self, mock_session: MagicMock, *, stream: bool, hooked: int
+    ) -> None:
+        """
+        Only buffered mode skips decoding a body equal to the previous one.
+
+        Streaming mode hooks every element before the digest is known, so it
+        still reports NOT_MODIFIED but has built the items again.
+        """
+        body = json.dumps([{"key": "a"}]).encode()
+        mock_session.request = AsyncMock(
+            side_effect=[
+                _make_streaming_response(body, chunk_size=4)
+                if stream
+                else _make_mock_response(200, [{"key": "a"}])
+                for _ in range(2)
+            ]
+        )
+        seen: list[dict] = []
+
+        def _hook(item: dict) -> dict:
+            seen.append(item)
+            return item
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, stream=stream
+        )
+        assert await client.async_get_data(item_hook=_hook) == [{"key": "a"}]
+        assert await client.async_get_data(item_hook=_hook) is NOT_MODIFIED
+        assert len(seen) == hooked
+
+    async def test_streaming_truncated_body_raises_api_error(
+        self, mock_session: MagicMock
+    ) -> None:
+        """A truncated streamed body surfaces as GatusApiClientError."""
+        response = _make_streaming_response(b'[{"key": "a"}, {"k', chunk_size=4)
+        mock_session.request = AsyncMock(return_value=response)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, stream=True
+        )
+        with pytest.raises(GatusApiClientError):
+            await client.async_get_data()
+
+
+class TestGatusApiClientDecoder:
+    """Tests for the pluggable JSON decoder."""
+
+    def test_default_decoder_prefers_orjson(self) -> None:
+        """orjson is used when it is installed."""
+        orjson = pytest.importorskip("orjson")
+        assert default_json_loads is orjson.loads
+
+    async def test_custom_decoder_receives_raw_bytes(
+        self, mock_session: MagicMock
+    ) -> None:
+        """A custom json_loads is called with the undecoded response bytes."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, [{"key": "a"}])
+        )
+        json_loads = MagicMock(side_effect=json.loads)
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, json_loads=json_loads
+        )
+        assert await client.async_get_data() == [{"key": "a"}]
+        json_loads.assert_called_once_with(b'[{"key": "a"}]')
+
+
+class TestGatusApiClientExecutorDecode:
+    """Tests for decoding large payloads off the event loop."""
+
+    async def test_large_body_decoded_in_executor(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Bodies above the threshold are decoded and hooked in a worker thread."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, [{"key": "a"}])
+        )
+        threads: list[threading.Thread] = []
+
+        def _hook(item: dict) -> str:
+            threads.append(threading.current_thread())
+            return item["key"]
+
+        client = GatusApiClient(
+            url="http://localhost:8080", session=mock_session, executor_threshold=1
+        )
+        assert await client.async_get_data(item_hook=_hook) == ["a"]
+        assert threads
+        assert threads[0] is not threading.main_thread()
+
+    async def test_small_body_decoded_inline(self, mock_session: MagicMock) -> None:
+        """Bodies below the threshold keep the cheap inline path."""
+        mock_session.request = AsyncMock(
+            return_value=_make_mock_response(200, [{"key": "a"}])
+        )
+        threads: list[threading.Thread] = []
+
+        def _hook(item: dict) -> str:
+            threads.append(threading.current_thread())
+            return item["key"]
+
+        client = GatusApiClient(url="http://localhost:8080", session=mock_session)
+        assert await client.async_get_data(item_hook=_hook) == ["a"]
+        assert threads == [threading.current_thread()]
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from custom_components.gatus.binary_sensor import GatusEndpointBinarySensor
+from custom_components.gatus.binary_sensor import (
+    GatusEndpointBinarySensor,
+    async_setup_entry,
+)
+from custom_components.gatus.devices import GatusDevices
 from custom_components.gatus.models import GatusEndpoint, GatusResult
 
 from .conftest import MOCK_ENDPOINT_DATA, MOCK_ENDPOINTS_DICT, MOCK_URL
@@ -21,8 +26,11 @@ def _make_coordinator(
     coordinator.last_update_success = success
     coordinator.config_entry.entry_id = "test_entry_id"
     coordinator.config_entry.data = {"url": MOCK_URL}
-    # runtime_data.integration is accessed in entity.py for sw_version
+    # runtime_data.integration is accessed in devices.py for sw_version
     coordinator.config_entry.runtime_data.integration.version = "1.0.0"
+    coordinator.config_entry.runtime_data.devices = GatusDevices(
+        coordinator.config_entry
+    )
     return coordinator
 
 
@@ -107,6 +115,109 @@ class TestGatusEndpointBinarySensorAvailable:
         assert sensor.available is False
 
 
+class TestGatusEndpointBinarySensorCoordinatorUpdate:
+    """Tests for per-endpoint state write gating."""
+
+    def test_writes_state_when_endpoint_changed(self) -> None:
+        """State is written when the endpoint key is in the changed set."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT)
+        coordinator.changed_endpoint_keys = frozenset({"external_google"})
+        sensor = _make_sensor(coordinator)
+        sensor._last_written_available = True
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_skips_write_when_other_endpoint_changed(self) -> None:
+        """State is not written when only other endpoints changed."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT)
+        coordinator.changed_endpoint_keys = frozenset({"media_plex"})
+        sensor = _make_sensor(coordinator)
+        sensor._last_written_available = True
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor.async_write_ha_state.assert_not_called()
+
+    def test_writes_state_when_availability_changed(self) -> None:
+        """A failed refresh is written even if no endpoint changed."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT, success=False)
+        coordinator.changed_endpoint_keys = frozenset()
+        sensor = _make_sensor(coordinator)
+        sensor._last_written_available = True
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor.async_write_ha_state.assert_called_once()
+
+
+class TestEndpointDiscovery:
+    """Tests for adding and removing entities as endpoints come and go."""
+
+    async def _setup(
+        self, data: dict[str, GatusEndpoint]
+    ) -> tuple[MagicMock, MagicMock, list[GatusEndpointBinarySensor]]:
+        """Set up the platform; return the coordinator, entry and entities."""
+        coordinator = _make_coordinator(data=data)
+        coordinator.added_endpoint_keys = frozenset()
+        coordinator.removed_endpoint_keys = frozenset()
+        entry = MagicMock()
+        entry.runtime_data.coordinator = coordinator
+        entities: list[GatusEndpointBinarySensor] = []
+        await async_setup_entry(MagicMock(), entry, entities.extend)
+        return coordinator, entry, entities
+
+    async def test_entities_for_initial_endpoints(self) -> None:
+        """Every endpoint in the data gets an entity at setup."""
+        _coordinator, _entry, entities = await self._setup(MOCK_ENDPOINTS_DICT)
+        assert {entity._endpoint_key for entity in entities} == set(MOCK_ENDPOINTS_DICT)
+
+    async def test_unchanged_refresh_adds_nothing(self) -> None:
+        """A refresh without added keys does not look at the data."""
+        coordinator, _entry, entities = await self._setup(MOCK_ENDPOINTS_DICT)
+        listener = coordinator.async_add_listener.call_args.args[0]
+        coordinator.data = MagicMock()
+
+        listener()
+
+        coordinator.data.get.assert_not_called()
+        assert len(entities) == 2
+
+    async def test_added_endpoint_gets_entity(self) -> None:
+        """Endpoints reported as added get entities."""
+        first = {"external_google": MOCK_ENDPOINTS_DICT["external_google"]}
+        coordinator, _entry, entities = await self._setup(first)
+        listener = coordinator.async_add_listener.call_args.args[0]
+
+        coordinator.data = MOCK_ENDPOINTS_DICT
+        coordinator.added_endpoint_keys = frozenset({"media_plex"})
+        listener()
+        listener()
+
+        assert [entity._endpoint_key for entity in entities] == [
+            "external_google",
+            "media_plex",
+        ]
+
+    async def test_removed_endpoint_entities_removed_from_registry(self) -> None:
+        """Entities of removed endpoints are removed from the entity registry."""
+        coordinator, _entry, entities = await self._setup(MOCK_ENDPOINTS_DICT)
+        listener = coordinator.async_add_listener.call_args.args[0]
+        for entity in entities:
+            entity.registry_entry = MagicMock()
+            entity.entity_id = f"binary_sensor.{entity._endpoint_key}"
+
+        coordinator.removed_endpoint_keys = frozenset({"media_plex"})
+        with patch("custom_components.gatus.entity.er.async_get") as get_registry:
+            listener()
+            listener()
+
+        get_registry.return_value.async_remove.assert_called_once_with(
+            "binary_sensor.media_plex"
+        )
+
+
 class TestGatusEndpointBinarySensorAttributes:
     """Tests for extra_state_attributes."""
 
@@ -182,6 +293,35 @@ class TestGatusEntityDeviceInfo:
 
         assert device_info.get("sw_version") is None
 
+    def test_device_info_is_shared(self) -> None:
+        """Entities reuse the entry's device info instead of building their own."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT)
+
+        first = _make_sensor(coordinator)
+        second = _make_sensor(coordinator, key="media_plex", name="plex", group="media")
+
+        assert first.device_info is second.device_info
+
+    def test_group_devices(self) -> None:
+        """With per-group devices an entity sits on the device of its group."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT)
+        coordinator.config_entry.runtime_data.devices.per_group = True
+
+        sensor = _make_sensor(coordinator)
+        device_info = sensor.device_info
+        assert device_info is not None
+
+        assert device_info["name"] == "external"
+        assert device_info["via_device"] == ("gatus", "test_entry_id")
+
+    def test_name_omits_group_on_group_device(self) -> None:
+        """On its group's device the entity name does not repeat the group."""
+        coordinator = _make_coordinator(data=MOCK_ENDPOINTS_DICT)
+        assert _make_sensor(coordinator).name == "external google"
+
+        coordinator.config_entry.runtime_data.devices.per_group = True
+        assert _make_sensor(coordinator).name == "google"
+
 
 class TestGatusResultModel:
     """Tests for GatusResult dataclass."""
@@ -214,6 +354,18 @@ class TestGatusResultModel:
         assert result.duration_ms == pytest.approx(50.0)
         assert result.timestamp == "2026-01-01T00:00:00Z"
 
+    def test_results_have_no_instance_dict(self) -> None:
+        """GatusResult is slotted, so instances carry no per-instance __dict__."""
+        result = GatusResult.from_dict(MOCK_ENDPOINT_DATA[0]["results"][0])
+        assert not hasattr(result, "__dict__")
+
+    def test_from_dict_interns_hostname(self) -> None:
+        """Equal hostnames from separate payloads share one string object."""
+        raw = '{"hostname": "example.com"}'
+        first = GatusResult.from_dict(json.loads(raw))
+        second = GatusResult.from_dict(json.loads(raw))
+        assert first.hostname is second.hostname
+
     def test_from_dict_handles_missing_fields(self) -> None:
         """from_dict uses safe defaults when fields are absent."""
         result = GatusResult.from_dict({})
@@ -260,6 +412,41 @@ class TestGatusEndpointModel:
         endpoint = GatusEndpoint(key="k", name="n", group="g", results=[])
         assert endpoint.latest_result is None
 
+    def test_from_dict_interns_group(self) -> None:
+        """Groups repeated across endpoints share one string object."""
+        raw = '{"group": "media"}'
+        first = GatusEndpoint.from_dict(json.loads(raw))
+        second = GatusEndpoint.from_dict(json.loads(raw))
+        assert first.group is second.group
+        assert not hasattr(first, "__dict__")
+
+    def test_older_results_parsed_lazily(self) -> None:
+        """Only the latest result is parsed until results is read."""
+        raw = [
+            {"success": False, "status": 500, "timestamp": "t1"},
+            {"success": True, "status": 200, "timestamp": "t2"},
+        ]
+        endpoint = GatusEndpoint.from_dict(
+            {"key": "k", "name": "n", "group": "g", "results": raw}
+        )
+        assert endpoint.latest_result is not None
+        assert endpoint.latest_result.timestamp == "t2"
+        assert endpoint._results is None
+        assert endpoint.result_count == 2
+
+        results = endpoint.results
+        assert [r.timestamp for r in results] == ["t1", "t2"]
+        assert results[-1] is endpoint.latest_result
+        assert endpoint.result_count == 2
+
+    def test_equality_ignores_unparsed_history(self) -> None:
+        """Endpoints compare equal on identity, latest result and result count."""
+        first = GatusEndpoint.from_dict(MOCK_ENDPOINT_DATA[0])
+        second = GatusEndpoint.from_dict(MOCK_ENDPOINT_DATA[0])
+        other = GatusEndpoint.from_dict(MOCK_ENDPOINT_DATA[1])
+        assert first == second
+        assert first != other
+
     def test_from_dict_parses_nested_results(self) -> None:
         """from_dict correctly parses nested result objects."""
         endpoint = GatusEndpoint.from_dict(MOCK_ENDPOINT_DATA[0])
@@ -16,7 +16,12 @@ from custom_components.gatus.config_flow import (
     GatusFlowHandler,
     GatusOptionsFlowHandler,
 )
-from custom_components.gatus.const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from custom_components.gatus.const import (
+    CONF_HISTORY_DEPTH,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_HISTORY_DEPTH,
+    DEFAULT_SCAN_INTERVAL,
+)
 
 from .conftest import MOCK_ENDPOINT_DATA, MOCK_URL
 
@@ -144,6 +149,11 @@ class TestGatusOptionsFlowHandler:
             mock_show_form.assert_called_once()
             call_kwargs = mock_show_form.call_args.kwargs
             assert call_kwargs["step_id"] == "init"
+            assert CONF_HISTORY_DEPTH in call_kwargs["data_schema"].schema
+
+    def test_default_history_depth_is_latest_only(self) -> None:
+        """DEFAULT_HISTORY_DEPTH fetches only the newest result per endpoint."""
+        assert DEFAULT_HISTORY_DEPTH == 1
 
     def test_default_scan_interval_constant(self) -> None:
         """DEFAULT_SCAN_INTERVAL is 60 seconds."""
@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from custom_components.gatus.api import (
+    NOT_MODIFIED,
     GatusApiClientAuthenticationError,
+    GatusApiClientCommunicationError,
     GatusApiClientError,
 )
+from custom_components.gatus.const import ENDPOINT_REFRESH_CONCURRENCY
 from custom_components.gatus.coordinator import GatusDataUpdateCoordinator
+from custom_components.gatus.filters import EndpointFilter
 from custom_components.gatus.models import GatusEndpoint
+from custom_components.gatus.timing import RequestStats, RequestTiming, RollingStats
 
 from .conftest import MOCK_ENDPOINT_DATA
 
 
+def _mock_get_data(*payloads: object) -> AsyncMock:
+    """Mock async_get_data, applying item_hook to list payloads like the client."""
+    responses = iter(payloads)
+
+    async def _get_data(item_hook=None):
+        payload = next(responses)
+        if item_hook is not None and isinstance(payload, list):
+            return [
+                hooked for item in payload if (hooked := item_hook(item)) is not None
+            ]
+        return payload
+
+    return AsyncMock(side_effect=_get_data)
+
+
 def _make_coordinator(client: MagicMock) -> GatusDataUpdateCoordinator:
     """Build a coordinator with a fake hass and injected client mock."""
     hass = MagicMock()
@@ -32,6 +57,23 @@ def _make_coordinator(client: MagicMock) -> GatusDataUpdateCoordinator:
     coordinator.last_update_success = True
     coordinator.last_exception = None
     coordinator.data = {}
+    coordinator.history = {}
+    coordinator.statistics_windows = {}
+    coordinator.min_update_interval = None
+    coordinator.max_update_interval = None
+    coordinator._stable_polls = 0
+    coordinator._has_failures = False
+    coordinator._snapshot_store = MagicMock()
+    coordinator._snapshot_data = None
+    coordinator.stale_grace = None
+    coordinator.stale_since = None
+    coordinator.endpoint_filter = EndpointFilter()
+    coordinator.request_stats = RequestStats(10)
+    coordinator.poll_stats = RollingStats(10)
+    coordinator.parse_rate = None
+    coordinator.state_writes = None
+    coordinator.listener_ms = None
+    coordinator._performance_listeners = []
     return coordinator
 
 
@@ -40,8 +82,8 @@ class TestGatusDataUpdateCoordinator:
 
     async def test_successful_update_returns_endpoint_dict(self) -> None:
         """Coordinator parses raw dicts and returns a dict-keyed GatusEndpoint index."""
-        client = MagicMock()
-        client.async_get_data = AsyncMock(return_value=MOCK_ENDPOINT_DATA)
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
 
         coordinator = _make_coordinator(client)
         result = await coordinator._async_update_data()
@@ -53,8 +95,8 @@ class TestGatusDataUpdateCoordinator:
 
     async def test_parsed_endpoint_matches_raw_data(self) -> None:
         """Parsed GatusEndpoint values match the source raw dict."""
-        client = MagicMock()
-        client.async_get_data = AsyncMock(return_value=MOCK_ENDPOINT_DATA)
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
 
         coordinator = _make_coordinator(client)
         result = await coordinator._async_update_data()
@@ -71,7 +113,7 @@ class TestGatusDataUpdateCoordinator:
 
     async def test_auth_error_raises_config_entry_auth_failed(self) -> None:
         """Authentication error is re-raised as ConfigEntryAuthFailed."""
-        client = MagicMock()
+        client = MagicMock(last_timing=None)
         client.async_get_data = AsyncMock(
             side_effect=GatusApiClientAuthenticationError("bad creds")
         )
@@ -82,7 +124,7 @@ class TestGatusDataUpdateCoordinator:
 
     async def test_api_error_raises_update_failed(self) -> None:
         """Generic API error is re-raised as UpdateFailed."""
-        client = MagicMock()
+        client = MagicMock(last_timing=None)
         client.async_get_data = AsyncMock(
             side_effect=GatusApiClientError("connection failed")
         )
@@ -93,9 +135,559 @@ class TestGatusDataUpdateCoordinator:
 
     async def test_unexpected_data_format_is_returned_as_is(self) -> None:
         """Non-list responses are returned as-is (coordinator logs a warning)."""
-        client = MagicMock()
-        client.async_get_data = AsyncMock(return_value={"unexpected": "dict"})
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data({"unexpected": "dict"})
 
         coordinator = _make_coordinator(client)
         result = await coordinator._async_update_data()
         assert result == {"unexpected": "dict"}
+
+    async def test_not_modified_keeps_current_data_object(self) -> None:
+        """An unchanged payload returns the existing data without re-parsing."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(NOT_MODIFIED)
+
+        coordinator = _make_coordinator(client)
+        existing = {"external_google": GatusEndpoint.from_dict(MOCK_ENDPOINT_DATA[0])}
+        coordinator.data = existing
+
+        result = await coordinator._async_update_data()
+        assert result is existing
+
+    async def test_changed_endpoint_keys_tracks_latest_result_changes(self) -> None:
+        """Only endpoints whose latest result changed are reported as changed."""
+        updated = [
+            MOCK_ENDPOINT_DATA[0],
+            {
+                **MOCK_ENDPOINT_DATA[1],
+                "results": [
+                    {**MOCK_ENDPOINT_DATA[1]["results"][0], "success": True},
+                ],
+            },
+        ]
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA, updated)
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.changed_endpoint_keys == {"external_google", "media_plex"}
+
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.changed_endpoint_keys == {"media_plex"}
+
+    async def test_removed_endpoint_is_reported_as_changed(self) -> None:
+        """Endpoints that disappear from the payload are reported as changed."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(
+            MOCK_ENDPOINT_DATA, MOCK_ENDPOINT_DATA[:1]
+        )
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.changed_endpoint_keys == {"media_plex"}
+
+    async def test_added_and_removed_keys_published(self) -> None:
+        """Each poll publishes the keys that appeared and disappeared."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(
+            MOCK_ENDPOINT_DATA[:1], MOCK_ENDPOINT_DATA[1:], NOT_MODIFIED
+        )
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.added_endpoint_keys == {"external_google"}
+        assert coordinator.removed_endpoint_keys == frozenset()
+
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.added_endpoint_keys == {"media_plex"}
+        assert coordinator.removed_endpoint_keys == {"external_google"}
+
+        await coordinator._async_update_data()
+        assert coordinator.added_endpoint_keys == frozenset()
+        assert coordinator.removed_endpoint_keys == frozenset()
+
+    async def test_failed_poll_clears_added_and_removed_keys(self) -> None:
+        """Listeners woken by a failed poll do not see the previous key changes."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        client.async_get_data = AsyncMock(side_effect=GatusApiClientError("boom"))
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.added_endpoint_keys == frozenset()
+
+    async def test_not_modified_reports_no_changes(self) -> None:
+        """An unchanged payload clears the changed key set."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA, NOT_MODIFIED)
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        assert coordinator.changed_endpoint_keys == frozenset()
+
+    async def test_history_records_new_results_across_polls(self) -> None:
+        """Changed endpoints feed their new results into the rolling windows."""
+        later = [
+            {
+                **MOCK_ENDPOINT_DATA[0],
+                "results": [
+                    {
+                        **MOCK_ENDPOINT_DATA[0]["results"][0],
+                        "timestamp": "2026-01-01T00:02:00Z",
+                    }
+                ],
+            },
+            MOCK_ENDPOINT_DATA[1],
+        ]
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA, later)
+
+        coordinator = _make_coordinator(client)
+        coordinator.statistics_windows = {"1h": 3_600_000}
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.history["external_google"].windows["1h"].count == 2
+        assert coordinator.history["media_plex"].windows["1h"].count == 1
+
+    async def test_no_history_without_statistics_windows(self) -> None:
+        """Without statistic windows no per-endpoint history is kept."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.history == {}
+
+    async def test_history_dropped_for_removed_endpoint(self) -> None:
+        """Endpoints that disappear lose their history."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(
+            MOCK_ENDPOINT_DATA, MOCK_ENDPOINT_DATA[:1]
+        )
+
+        coordinator = _make_coordinator(client)
+        coordinator.statistics_windows = {"1h": 3_600_000}
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = await coordinator._async_update_data()
+        assert set(coordinator.history) == {"external_google"}
+
+
+def _with_success(endpoint: dict, *, success: bool, minute: int) -> dict:
+    """Return a copy of a raw endpoint whose single result has the given outcome."""
+    result = {
+        **endpoint["results"][0],
+        "success": success,
+        "timestamp": f"2026-01-01T01:{minute:02d}:00Z",
+    }
+    return {**endpoint, "results": [result]}
+
+
+HEALTHY = [_with_success(ep, success=True, minute=0) for ep in MOCK_ENDPOINT_DATA]
+
+
+class TestEndpointFilter:
+    """Tests for applying the endpoint filter while polling."""
+
+    async def test_filtered_endpoints_are_not_built(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Excluded endpoints never reach GatusEndpoint.from_dict."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        coordinator = _make_coordinator(client)
+        coordinator.endpoint_filter = EndpointFilter(exclude_groups=["media"])
+        built: list[str] = []
+        from_dict = GatusEndpoint.from_dict
+        monkeypatch.setattr(
+            GatusEndpoint,
+            "from_dict",
+            staticmethod(lambda data: built.append(data["key"]) or from_dict(data)),
+        )
+
+        result = await coordinator._async_update_data()
+
+        assert list(result) == ["external_google"]
+        assert built == ["external_google"]
+        assert "media_plex" not in coordinator.history
+
+    async def test_excluding_every_endpoint_empties_the_index(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A filter rejecting every endpoint yields an empty index, not a list."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        coordinator = _make_coordinator(client)
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.endpoint_filter = EndpointFilter(exclude_groups=["*"])
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+
+        result = await coordinator._async_update_data()
+
+        assert result == {}
+        assert coordinator.removed_endpoint_keys == {"external_google", "media_plex"}
+        assert coordinator.history == {}
+        assert "unexpected data format" not in caplog.text
+
+    async def test_refresh_skips_filtered_endpoint(self) -> None:
+        """A targeted refresh of an excluded endpoint does not add it."""
+        client = MagicMock(last_timing=None)
+        client.async_get_endpoint = AsyncMock(
+            side_effect=lambda _key, item_hook: item_hook(MOCK_ENDPOINT_DATA[1])
+        )
+        coordinator = _make_coordinator(client)
+        coordinator.endpoint_filter = EndpointFilter(exclude_groups=["media"])
+        coordinator.async_update_listeners = MagicMock()
+
+        await coordinator.async_refresh_endpoints(["media_plex"])
+
+        assert "media_plex" not in coordinator.data
+        coordinator.async_update_listeners.assert_not_called()
+
+
+class TestApplyOptions:
+    """Tests for applying changed options to a running coordinator."""
+
+    def test_apply_options_updates_settings(self) -> None:
+        """New intervals, grace period and filter take effect in place."""
+        coordinator = _make_coordinator(MagicMock())
+        coordinator.update_interval = timedelta(seconds=60)
+        coordinator._stable_polls = 5
+        endpoint_filter = EndpointFilter(exclude_groups=["media"])
+
+        coordinator.async_apply_options(
+            update_interval=timedelta(seconds=30),
+            max_update_interval=timedelta(seconds=300),
+            stale_grace=timedelta(seconds=10),
+            endpoint_filter=endpoint_filter,
+        )
+
+        assert coordinator.update_interval == timedelta(seconds=30)
+        assert coordinator.min_update_interval == timedelta(seconds=30)
+        assert coordinator.max_update_interval == timedelta(seconds=300)
+        assert coordinator._stable_polls == 0
+        assert coordinator.stale_grace == timedelta(seconds=10)
+        assert coordinator.endpoint_filter is endpoint_filter
+
+
+class TestAdaptivePolling:
+    """Tests for the adaptive polling interval."""
+
+    def _make_adaptive_coordinator(
+        self, *payloads: object
+    ) -> GatusDataUpdateCoordinator:
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(*payloads)
+        coordinator = _make_coordinator(client)
+        coordinator.update_interval = timedelta(seconds=60)
+        coordinator.min_update_interval = timedelta(seconds=60)
+        coordinator.max_update_interval = timedelta(seconds=300)
+        return coordinator
+
+    async def _poll(self, coordinator: GatusDataUpdateCoordinator, times: int) -> None:
+        for _ in range(times):
+            coordinator.data = await coordinator._async_update_data()
+
+    async def test_backs_off_while_stable(self) -> None:
+        """The interval doubles after every few healthy polls, up to the maximum."""
+        coordinator = self._make_adaptive_coordinator(HEALTHY, *[NOT_MODIFIED] * 8)
+
+        await self._poll(coordinator, 2)
+        assert coordinator.update_interval == timedelta(seconds=60)
+        await self._poll(coordinator, 1)
+        assert coordinator.update_interval == timedelta(seconds=120)
+        await self._poll(coordinator, 6)
+        assert coordinator.update_interval == timedelta(seconds=300)
+
+    async def test_tightens_immediately_on_failure(self) -> None:
+        """A failing endpoint returns polling to the minimum interval."""
+        failing = [
+            HEALTHY[0],
+            _with_success(MOCK_ENDPOINT_DATA[1], success=False, minute=1),
+        ]
+        coordinator = self._make_adaptive_coordinator(
+            HEALTHY, NOT_MODIFIED, NOT_MODIFIED, failing, NOT_MODIFIED, NOT_MODIFIED
+        )
+
+        await self._poll(coordinator, 3)
+        assert coordinator.update_interval == timedelta(seconds=120)
+        await self._poll(coordinator, 1)
+        assert coordinator.update_interval == timedelta(seconds=60)
+        # Unchanged polls keep the fast interval while the failure persists.
+        await self._poll(coordinator, 2)
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+    async def test_recovery_counts_as_unsettled(self) -> None:
+        """An endpoint recovering restarts the stable period."""
+        recovered = [
+            HEALTHY[0],
+            _with_success(MOCK_ENDPOINT_DATA[1], success=True, minute=2),
+        ]
+        coordinator = self._make_adaptive_coordinator(
+            MOCK_ENDPOINT_DATA, recovered, *[NOT_MODIFIED] * 3
+        )
+
+        await self._poll(coordinator, 4)
+        assert coordinator.update_interval == timedelta(seconds=60)
+        await self._poll(coordinator, 1)
+        assert coordinator.update_interval == timedelta(seconds=120)
+
+    async def test_fixed_interval_without_maximum(self) -> None:
+        """Without a maximum interval the polling interval never changes."""
+        coordinator = self._make_adaptive_coordinator(HEALTHY, *[NOT_MODIFIED] * 5)
+        coordinator.max_update_interval = None
+
+        await self._poll(coordinator, 6)
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+
+class TestRefreshEndpoints:
+    """Tests for GatusDataUpdateCoordinator.async_refresh_endpoints."""
+
+    def _make_refresh_coordinator(
+        self, get_endpoint: AsyncMock
+    ) -> GatusDataUpdateCoordinator:
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        client.async_get_endpoint = get_endpoint
+        coordinator = _make_coordinator(client)
+        coordinator.async_update_listeners = MagicMock()
+        return coordinator
+
+    async def test_merges_changed_endpoint_in_place(self) -> None:
+        """A refreshed endpoint replaces its entry in the existing data dict."""
+        recovered = _with_success(MOCK_ENDPOINT_DATA[1], success=True, minute=2)
+        coordinator = self._make_refresh_coordinator(
+            AsyncMock(side_effect=lambda _key, item_hook: item_hook(recovered))
+        )
+        coordinator.statistics_windows = {"24h": 86_400_000}
+        coordinator.data = await coordinator._async_update_data()
+        data = coordinator.data
+
+        await coordinator.async_refresh_endpoints(["media_plex"])
+
+        assert coordinator.data is data
+        assert data["media_plex"].latest_result.success is True
+        assert coordinator.changed_endpoint_keys == frozenset({"media_plex"})
+        assert coordinator.history["media_plex"].windows["24h"].count == 2
+        coordinator.async_update_listeners.assert_called_once()
+
+    async def test_unchanged_endpoint_skips_listeners(self) -> None:
+        """Refreshing an endpoint with no new result does not wake entities."""
+        coordinator = self._make_refresh_coordinator(
+            AsyncMock(
+                side_effect=lambda _key, item_hook: item_hook(MOCK_ENDPOINT_DATA[1])
+            )
+        )
+        coordinator.data = await coordinator._async_update_data()
+
+        await coordinator.async_refresh_endpoints(["media_plex"])
+        coordinator.async_update_listeners.assert_not_called()
+
+    async def test_error_raised_after_merging_other_endpoints(self) -> None:
+        """A failing endpoint does not prevent the others from being merged."""
+        recovered = _with_success(MOCK_ENDPOINT_DATA[1], success=True, minute=2)
+
+        async def _get_endpoint(key, item_hook):
+            if key == "external_google":
+                msg = "boom"
+                raise GatusApiClientError(msg)
+            return item_hook(recovered)
+
+        coordinator = self._make_refresh_coordinator(
+            AsyncMock(side_effect=_get_endpoint)
+        )
+        coordinator.data = await coordinator._async_update_data()
+
+        with pytest.raises(GatusApiClientError):
+            await coordinator.async_refresh_endpoints(["external_google", "media_plex"])
+        assert coordinator.data["media_plex"].latest_result.success is True
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than ENDPOINT_REFRESH_CONCURRENCY requests run at once."""
+        running = 0
+        peak = 0
+
+        async def _get_endpoint(key, item_hook):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return item_hook({**MOCK_ENDPOINT_DATA[0], "key": key})
+
+        coordinator = self._make_refresh_coordinator(
+            AsyncMock(side_effect=_get_endpoint)
+        )
+        await coordinator.async_refresh_endpoints([f"k{i}" for i in range(10)])
+
+        assert peak == ENDPOINT_REFRESH_CONCURRENCY
+        assert len(coordinator.data) == 10
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving the last good data while Gatus is unreachable."""
+
+    def _make_stale_coordinator(self, *payloads: object) -> GatusDataUpdateCoordinator:
+        responses = iter(payloads)
+
+        async def _get_data(item_hook=None):
+            payload = next(responses)
+            if isinstance(payload, Exception):
+                raise payload
+            return [item_hook(item) for item in payload]
+
+        client = MagicMock(last_timing=None)
+        client.async_get_data = AsyncMock(side_effect=_get_data)
+        coordinator = _make_coordinator(client)
+        coordinator.stale_grace = timedelta(minutes=5)
+        coordinator.async_update_listeners = MagicMock()
+        return coordinator
+
+    async def test_serves_last_data_within_grace(self) -> None:
+        """A communication error within the grace period keeps the data."""
+        coordinator = self._make_stale_coordinator(
+            MOCK_ENDPOINT_DATA, GatusApiClientCommunicationError("timeout")
+        )
+        coordinator.data = await coordinator._async_update_data()
+        data = coordinator.data
+
+        assert await coordinator._async_update_data() is data
+        assert coordinator.stale_since is not None
+        assert coordinator.changed_endpoint_keys == frozenset()
+        coordinator.async_update_listeners.assert_called_once()
+
+    async def test_fails_after_grace(self) -> None:
+        """Once the grace period has passed the update fails."""
+        coordinator = self._make_stale_coordinator(
+            MOCK_ENDPOINT_DATA,
+            GatusApiClientCommunicationError("timeout"),
+            GatusApiClientCommunicationError("timeout"),
+        )
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        coordinator.stale_since -= timedelta(minutes=5)
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    async def test_success_clears_staleness(self) -> None:
+        """A successful poll clears stale_since."""
+        coordinator = self._make_stale_coordinator(
+            MOCK_ENDPOINT_DATA,
+            GatusApiClientCommunicationError("timeout"),
+            MOCK_ENDPOINT_DATA,
+        )
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+        assert coordinator.stale_since is None
+
+    async def test_no_grace_without_data(self) -> None:
+        """Without earlier data there is nothing to serve."""
+        coordinator = self._make_stale_coordinator(
+            GatusApiClientCommunicationError("timeout")
+        )
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+
+class TestRequestStats:
+    """Tests for recording request timings on the coordinator."""
+
+    async def test_successful_poll_records_timing(self) -> None:
+        """The client's timing of each successful poll is kept."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        client.last_timing = RequestTiming(ttfb=12.0, total=20.0, bytes_received=512)
+        coordinator = _make_coordinator(client)
+
+        await coordinator._async_update_data()
+
+        stats = coordinator.request_stats.as_dict()
+        assert stats["ttfb_ms"]["last"] == 12.0
+        assert stats["bytes_received"]["last"] == 512
+        assert stats["dns_ms"] == {"count": 0}
+
+
+class TestPerformanceMeasurements:
+    """Tests for the measurements behind the performance sensors."""
+
+    async def test_poll_duration_and_parse_rate(self) -> None:
+        """Each poll is timed and parse throughput comes from decode time."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        client.last_timing = RequestTiming(decode=4.0)
+        coordinator = _make_coordinator(client)
+
+        await coordinator._async_update_data()
+
+        assert len(coordinator.poll_stats) == 1
+        assert coordinator.parse_rate == len(MOCK_ENDPOINT_DATA) / 0.004
+
+    async def test_failed_poll_is_timed(self) -> None:
+        """Failed polls count towards the poll duration too."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = AsyncMock(side_effect=GatusApiClientError("boom"))
+        coordinator = _make_coordinator(client)
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert len(coordinator.poll_stats) == 1
+
+    def test_listener_dispatch_counts_state_writes(self) -> None:
+        """State writes made by listeners are counted per dispatch."""
+        coordinator = _make_coordinator(MagicMock())
+        coordinator._pending_state_writes = 0
+
+        def _listener() -> None:
+            coordinator.async_count_state_write()
+            coordinator.async_count_state_write()
+
+        coordinator._listeners = {object(): (_listener, None)}
+        coordinator.async_update_listeners()
+
+        assert coordinator.state_writes == 2
+        assert coordinator.listener_ms is not None
+
+    async def test_performance_listeners_follow_every_refresh(self) -> None:
+        """Performance listeners run after refreshes that skip the dispatch."""
+        coordinator = _make_coordinator(MagicMock())
+        calls: list[int | None] = []
+        remove = coordinator.async_add_performance_listener(
+            lambda: calls.append(coordinator.state_writes)
+        )
+
+        # An unchanged poll never reaches async_update_listeners.
+        with patch.object(DataUpdateCoordinator, "_async_refresh", AsyncMock()):
+            await coordinator._async_refresh()
+        assert calls == [None]
+
+        remove()
+        with patch.object(DataUpdateCoordinator, "_async_refresh", AsyncMock()):
+            await coordinator._async_refresh()
+        assert calls == [None]
+
+    async def test_performance_listeners_see_measured_dispatch(self) -> None:
+        """The listener dispatch is measured before performance listeners run."""
+        coordinator = _make_coordinator(MagicMock())
+        coordinator._pending_state_writes = 0
+        coordinator._listeners = {object(): (coordinator.async_count_state_write, None)}
+        seen: list[int | None] = []
+        coordinator.async_add_performance_listener(
+            lambda: seen.append(coordinator.state_writes)
+        )
+
+        async def _refresh(*_args: object, **_kwargs: object) -> None:
+            coordinator.async_update_listeners()
+
+        with patch.object(DataUpdateCoordinator, "_async_refresh", _refresh):
+            await coordinator._async_refresh()
+
+        assert seen == [1]
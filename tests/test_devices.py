@@ -0,0 +1,67 @@
+"""Tests for the device metadata shared by Gatus entities."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.gatus.const import DOMAIN
+from custom_components.gatus.devices import GatusDevices
+
+from .conftest import MOCK_URL
+
+
+def _make_entry() -> MagicMock:
+    """Build a minimal config entry."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = {"url": MOCK_URL}
+    entry.runtime_data.integration.version = "1.0.0"
+    return entry
+
+
+class TestGatusDevices:
+    """Tests for GatusDevices."""
+
+    def test_server_device_is_built_once(self) -> None:
+        """The server device info is computed once and shared."""
+        devices = GatusDevices(_make_entry())
+
+        server = devices.server
+
+        assert devices.server is server
+        assert server["identifiers"] == {(DOMAIN, "test_entry_id")}
+        assert server["name"] == "Gatus (gatus.example.com)"
+        assert server["sw_version"] == "1.0.0"
+
+    def test_endpoints_share_server_device_by_default(self) -> None:
+        """Without per-group devices every endpoint sits on the server device."""
+        devices = GatusDevices(_make_entry())
+        assert devices.endpoint("external") is devices.server
+
+    def test_group_devices(self) -> None:
+        """Each group gets one cached device linked to the server device."""
+        devices = GatusDevices(_make_entry(), per_group=True)
+
+        external = devices.endpoint("external")
+
+        assert devices.endpoint("external") is external
+        assert devices.endpoint("media") is not external
+        assert external["name"] == "external"
+        assert external["via_device"] == (DOMAIN, "test_entry_id")
+        assert external["identifiers"] == {(DOMAIN, "test_entry_id_group_external")}
+
+    def test_ungrouped_endpoint_stays_on_server_device(self) -> None:
+        """Endpoints without a group sit on the server device."""
+        devices = GatusDevices(_make_entry(), per_group=True)
+        assert devices.endpoint("") is devices.server
+
+    def test_group_of(self) -> None:
+        """Group devices map back to their group; the server device does not."""
+        devices = GatusDevices(_make_entry(), per_group=True)
+        group_device = MagicMock(
+            identifiers=devices.endpoint("my_group")["identifiers"]
+        )
+        server_device = MagicMock(identifiers=devices.server["identifiers"])
+
+        assert devices.group_of(group_device) == "my_group"
+        assert devices.group_of(server_device) is None
@@ -0,0 +1,147 @@
+"""Tests running GatusApiClient against the fake Gatus server."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+
+from custom_components.gatus.api import (
+    NOT_MODIFIED,
+    GatusApiClient,
+    GatusApiClientAuthenticationError,
+    GatusApiClientCommunicationError,
+    GatusApiClientError,
+)
+from custom_components.gatus.models import GatusEndpoint
+
+from .fake_gatus import FakeGatus
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+
+@pytest.fixture
+async def serve() -> AsyncIterator[Callable[..., GatusApiClient]]:
+    """Return a factory starting a fake Gatus and a client talking to it."""
+    servers: list[TestServer] = []
+    session = aiohttp.ClientSession()
+
+    async def _serve(fake: FakeGatus, **client_kwargs: object) -> GatusApiClient:
+        server = TestServer(fake.app())
+        await server.start_server()
+        servers.append(server)
+        return GatusApiClient(
+            url=str(server.make_url("/")), session=session, **client_kwargs
+        )
+
+    yield _serve
+    await session.close()
+    for server in servers:
+        await server.close()
+
+
+class TestFakeGatus:
+    """Tests for the fake Gatus server as seen by GatusApiClient."""
+
+    async def test_serves_statuses_with_page_size(self, serve: Callable) -> None:
+        """The statuses route serves the fleet, honouring pageSize."""
+        fake = FakeGatus(SyntheticFleet(25, history_depth=10))
+        fake.poll = 5
+        client = await serve(fake, history_depth=3)
+
+        endpoints = await client.async_get_data(item_hook=GatusEndpoint.from_dict)
+
+        assert len(endpoints) == 25
+        assert all(len(endpoint.results) == 3 for endpoint in endpoints)
+
+    async def test_etag_answers_not_modified(self, serve: Callable) -> None:
+        """An unchanged fleet is answered with 304 to the client's validator."""
+        fake = FakeGatus(SyntheticFleet(5))
+        client = await serve(fake)
+
+        assert isinstance(await client.async_get_data(), list)
+        assert await client.async_get_data() is NOT_MODIFIED
+        assert "If-None-Match" in fake.requests[-1][2]
+
+        fake.advance()
+        assert isinstance(await client.async_get_data(), list)
+
+    async def test_slow_chunked_body_streams(self, serve: Callable) -> None:
+        """A body sent in small, delayed chunks is decoded incrementally."""
+        fleet = SyntheticFleet(30)
+        fake = FakeGatus(fleet, chunk_size=256, chunk_delay=0.001, etag=False)
+        client = await serve(fake, stream=True)
+
+        endpoints = await client.async_get_data(item_hook=GatusEndpoint.from_dict)
+
+        assert [endpoint.key for endpoint in endpoints] == list(fleet.endpoints)
+        assert client.last_timing.bytes_received > 256
+
+    async def test_unauthorized(self, serve: Callable) -> None:
+        """An injected 401 is reported as an authentication error."""
+        fake = FakeGatus(SyntheticFleet(5))
+        fake.fail(401)
+        client = await serve(fake)
+
+        with pytest.raises(GatusApiClientAuthenticationError):
+            await client.async_get_data()
+
+    async def test_rate_limit_is_retried(self, serve: Callable) -> None:
+        """A 429 with Retry-After is waited out and retried."""
+        fake = FakeGatus(SyntheticFleet(5))
+        fake.fail(429, retry_after=0)
+        client = await serve(fake)
+
+        assert len(await client.async_get_data()) == 5
+        assert len(fake.requests) == 2
+
+    async def test_server_error(self, serve: Callable) -> None:
+        """An injected 5xx is a communication error once retries run out."""
+        fake = FakeGatus(SyntheticFleet(5))
+        fake.fail(502)
+        client = await serve(fake, max_retries=0)
+
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_data()
+
+    async def test_latency_exceeding_timeout(self, serve: Callable) -> None:
+        """A response slower than the client timeout fails the request."""
+        fake = FakeGatus(SyntheticFleet(5), latency=0.2)
+        client = await serve(fake, timeout=0.05, max_retries=0)
+
+        with pytest.raises(GatusApiClientCommunicationError):
+            await client.async_get_data()
+
+    async def test_churn_and_auto_advance(self, serve: Callable) -> None:
+        """Every poll moves the checks on and replaces churned endpoints."""
+        fleet = SyntheticFleet(10)
+        first_keys = list(fleet.endpoints)
+        fake = FakeGatus(fleet, churn=(2, 1), auto_advance=True)
+        client = await serve(fake)
+
+        first = await client.async_get_data(item_hook=GatusEndpoint.from_dict)
+        second = await client.async_get_data(item_hook=GatusEndpoint.from_dict)
+
+        assert [endpoint.key for endpoint in first] == first_keys
+        keys = [endpoint.key for endpoint in second]
+        assert len(keys) == 11
+        assert first_keys[0] not in keys
+        assert second[0].latest_result.timestamp > first[1].latest_result.timestamp
+
+    async def test_endpoint_route(self, serve: Callable) -> None:
+        """The per-endpoint route serves one endpoint and 404s unknown keys."""
+        fleet = SyntheticFleet(5)
+        key = next(iter(fleet.endpoints))
+        client = await serve(FakeGatus(fleet), max_retries=0)
+
+        endpoint = await client.async_get_endpoint(
+            key, item_hook=GatusEndpoint.from_dict
+        )
+        assert endpoint.key == key
+
+        with pytest.raises(GatusApiClientError):
+            await client.async_get_endpoint("unknown_endpoint")
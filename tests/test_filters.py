@@ -0,0 +1,81 @@
+"""Tests for the Gatus endpoint filters."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.gatus.const import (
+    CONF_EXCLUDE_ENDPOINTS,
+    CONF_INCLUDE_GROUPS,
+)
+from custom_components.gatus.filters import EndpointFilter
+
+
+class TestEndpointFilter:
+    """Tests for EndpointFilter."""
+
+    def test_empty_filter_matches_everything(self) -> None:
+        """Without rules every endpoint passes and the filter is falsy."""
+        endpoint_filter = EndpointFilter()
+        assert not endpoint_filter
+        assert endpoint_filter.matches("core", "api", "core_api")
+
+    def test_include_groups_by_pattern(self) -> None:
+        """Only endpoints in a matching group pass an include rule."""
+        endpoint_filter = EndpointFilter(include_groups=["prod-*"])
+        assert endpoint_filter.matches("prod-eu", "api", "prod-eu_api")
+        assert not endpoint_filter.matches("staging", "api", "staging_api")
+
+    def test_patterns_are_case_insensitive(self) -> None:
+        """Patterns match regardless of case."""
+        endpoint_filter = EndpointFilter(include_groups=["Core"])
+        assert endpoint_filter.matches("core", "api", "core_api")
+
+    def test_include_rules_are_combined(self) -> None:
+        """An endpoint matching either an include group or pattern passes."""
+        endpoint_filter = EndpointFilter(
+            include_groups=["core"], include_patterns=["*db*"]
+        )
+        assert endpoint_filter.matches("core", "api", "core_api")
+        assert endpoint_filter.matches("storage", "postgres-db", "storage_postgres-db")
+        assert not endpoint_filter.matches("storage", "s3", "storage_s3")
+
+    def test_patterns_match_name_or_key(self) -> None:
+        """Endpoint patterns are tried against both the name and the key."""
+        endpoint_filter = EndpointFilter(exclude_patterns=["media_*"])
+        assert not endpoint_filter.matches("media", "plex", "media_plex")
+        endpoint_filter = EndpointFilter(exclude_patterns=["plex"])
+        assert not endpoint_filter.matches("media", "plex", "media_plex")
+
+    def test_exclusions_win(self) -> None:
+        """An excluded endpoint is dropped even when it is also included."""
+        endpoint_filter = EndpointFilter(
+            include_groups=["media"], exclude_groups=["media"]
+        )
+        assert not endpoint_filter.matches("media", "plex", "media_plex")
+
+    def test_blank_patterns_are_ignored(self) -> None:
+        """Empty entries left in the options do not count as rules."""
+        assert not EndpointFilter(include_groups=["", "  "])
+
+    def test_from_options(self) -> None:
+        """The filter is built from the config entry options."""
+        endpoint_filter = EndpointFilter.from_options(
+            {CONF_INCLUDE_GROUPS: ["media"], CONF_EXCLUDE_ENDPOINTS: ["jellyfin"]}
+        )
+        assert endpoint_filter.matches("media", "plex", "media_plex")
+        assert not endpoint_filter.matches("media", "jellyfin", "media_jellyfin")
+        assert not endpoint_filter.matches("core", "api", "core_api")
+
+    def test_wrap_without_rules_returns_hook(self) -> None:
+        """An empty filter adds no per-record overhead."""
+        hook = MagicMock()
+        assert EndpointFilter().wrap(hook) is hook
+
+    def test_wrap_skips_hook_for_filtered_records(self) -> None:
+        """Filtered records map to None without calling the hook."""
+        hook = MagicMock(return_value="model")
+        wrapped = EndpointFilter(exclude_groups=["media"]).wrap(hook)
+        assert wrapped({"key": "media_plex", "name": "plex", "group": "media"}) is None
+        hook.assert_not_called()
+        assert wrapped({"key": "core_api", "name": "api", "group": "core"}) == "model"
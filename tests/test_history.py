@@ -0,0 +1,139 @@
+"""Tests for the per-endpoint result statistics."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.gatus.history import (
+    EndpointHistory,
+    RollingWindow,
+    parse_timestamp,
+)
+from custom_components.gatus.models import GatusEndpoint
+
+T0 = 1_767_225_600_000  # 2026-01-01T00:00:00Z in epoch milliseconds
+
+
+def _raw_result(minute: int, success: bool = True, duration_ms: int = 50) -> dict:
+    return {
+        "success": success,
+        "status": 200 if success else 503,
+        "duration": duration_ms * 1_000_000,
+        "timestamp": f"2026-01-01T00:{minute:02d}:00.123456789Z",
+    }
+
+
+def _endpoint(*results: dict) -> GatusEndpoint:
+    return GatusEndpoint.from_dict(
+        {"key": "k", "name": "n", "group": "g", "results": list(results)}
+    )
+
+
+class TestParseTimestamp:
+    """Tests for parse_timestamp."""
+
+    def test_parses_nanosecond_rfc3339(self) -> None:
+        """Gatus' nanosecond timestamps are parsed to epoch milliseconds."""
+        assert parse_timestamp("2026-01-01T00:00:00.123456789Z") == T0 + 123
+
+    def test_parses_offset(self) -> None:
+        """Timestamps with a UTC offset are normalized."""
+        assert parse_timestamp("2026-01-01T01:00:00+01:00") == T0
+
+    @pytest.mark.parametrize("value", [None, "", "not a timestamp"])
+    def test_invalid_returns_none(self, value: str | None) -> None:
+        """Missing or malformed timestamps return None."""
+        assert parse_timestamp(value) is None
+
+
+class TestEndpointHistory:
+    """Tests for EndpointHistory."""
+
+    def test_append_feeds_windows(self) -> None:
+        """Appended results reach every window in microseconds."""
+        history = EndpointHistory({"1h": 3_600_000})
+        history.append(T0, success=True, duration_ns=50_000_000)
+        history.append(T0 + 60_000, success=False, duration_ns=10_000_000)
+
+        assert history.last_timestamp == T0 + 60_000
+        assert history.windows["1h"].count == 2
+        assert history.windows["1h"].uptime == 50
+        assert history.windows["1h"].mean_ms == 30
+
+    def test_duplicate_or_older_timestamps_are_ignored(self) -> None:
+        """Results not newer than the last added one are de-duplicated."""
+        history = EndpointHistory({"1h": 3_600_000})
+        assert history.append(T0, success=True, duration_ns=0)
+        assert not history.append(T0, success=False, duration_ns=0)
+        assert not history.append(T0 - 1, success=False, duration_ns=0)
+        assert history.windows["1h"].count == 1
+
+    def test_record_adds_only_new_results(self) -> None:
+        """Overlapping pages from successive polls are counted once."""
+        history = EndpointHistory({"1h": 3_600_000})
+        assert history.record(_endpoint(_raw_result(0), _raw_result(1))) == 2
+        assert (
+            history.record(_endpoint(_raw_result(1), _raw_result(2, success=False)))
+            == 1
+        )
+        assert history.record(_endpoint(_raw_result(2))) == 0
+        assert history.windows["1h"].count == 3
+
+    def test_record_does_not_materialize_history(self) -> None:
+        """Recording walks raw results without caching parsed results."""
+        endpoint = _endpoint(_raw_result(0), _raw_result(1), _raw_result(2))
+        EndpointHistory().record(endpoint)
+        assert endpoint._results is None
+
+
+class TestRollingWindow:
+    """Tests for RollingWindow."""
+
+    def test_empty_window_has_no_statistics(self) -> None:
+        """An empty window reports None rather than zero."""
+        window = RollingWindow(3_600_000)
+        assert window.count == 0
+        assert window.uptime is None
+        assert window.mean_ms is None
+        assert window.percentile_ms(95) is None
+
+    def test_uptime_and_mean(self) -> None:
+        """Uptime and mean response time cover every result in the window."""
+        window = RollingWindow(3_600_000)
+        window.add(T0, success=True, duration_us=10_000)
+        window.add(T0 + 60_000, success=True, duration_us=20_000)
+        window.add(T0 + 120_000, success=True, duration_us=30_000)
+        window.add(T0 + 180_000, success=False, duration_us=40_000)
+
+        assert window.count == 4
+        assert window.uptime == 75
+        assert window.mean_ms == 25
+
+    def test_percentile_is_within_histogram_error(self) -> None:
+        """Percentiles are accurate to the histogram's bin width."""
+        window = RollingWindow(3_600_000)
+        for offset in range(100):
+            window.add(T0 + offset, success=True, duration_us=(offset + 1) * 1_000)
+
+        assert window.percentile_ms(50) == pytest.approx(50, rel=0.07)
+        assert window.percentile_ms(95) == pytest.approx(95, rel=0.07)
+        assert window.percentile_ms(100) == pytest.approx(100, rel=0.07)
+
+    def test_old_slots_are_evicted(self) -> None:
+        """Results older than the window stop counting."""
+        window = RollingWindow(3_600_000)
+        window.add(T0, success=False, duration_us=900_000)
+        window.add(T0 + 3_600_000, success=True, duration_us=1_000)
+
+        assert window.count == 1
+        assert window.uptime == 100
+        assert window.percentile_ms(100) == pytest.approx(1, rel=0.07)
+
+    def test_history_feeds_windows(self) -> None:
+        """Stored results are pushed into every configured window."""
+        history = EndpointHistory({"1h": 3_600_000, "24h": 86_400_000})
+        history.record(_endpoint(_raw_result(0), _raw_result(1, success=False)))
+        history.record(_endpoint(_raw_result(1, success=False)))
+
+        assert history.windows["1h"].count == 2
+        assert history.windows["24h"].uptime == 50
@@ -0,0 +1,242 @@
+"""Tests for applying option changes to a running Gatus entry."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.const import CONF_URL, CONF_WEBHOOK_ID
+
+from custom_components.gatus import (
+    PLATFORMS,
+    async_remove_config_entry_device,
+    async_setup_entry,
+    async_update_options,
+)
+from custom_components.gatus.const import (
+    CONF_EXCLUDE_GROUPS,
+    CONF_GROUP_DEVICES,
+    CONF_SCAN_INTERVAL,
+    CONF_STATISTICS_WINDOWS,
+    CONF_WEBHOOK,
+    DEFAULT_STATISTICS_WINDOWS,
+)
+from custom_components.gatus.data import GatusData
+from custom_components.gatus.devices import GatusDevices
+
+from .conftest import MOCK_ENDPOINTS_DICT, MOCK_URL
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+
+def _make_entry(options: dict, applied: dict | None = None) -> MagicMock:
+    """Build an entry whose runtime data was set up with ``applied``."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {CONF_URL: MOCK_URL, CONF_WEBHOOK_ID: "hook"}
+    entry.options = options
+    coordinator = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+    entry.runtime_data = GatusData(
+        client=MagicMock(),
+        coordinator=coordinator,
+        integration=MagicMock(),
+        devices=MagicMock(),
+        url=MOCK_URL,
+        options=applied or {},
+    )
+    return entry
+
+
+def _make_hass() -> MagicMock:
+    """Build a fake hass whose config entries can be reloaded."""
+    hass = MagicMock()
+    hass.config_entries.async_reload = AsyncMock()
+    return hass
+
+
+class TestAsyncSetupEntry:
+    """Tests for async_setup_entry."""
+
+    async def _setup(self, *, snapshot: bool) -> tuple[MagicMock, list[str]]:
+        """Set up an entry; return the coordinator and the order of the steps."""
+        calls: list[str] = []
+
+        def _background_task(_hass: object, target: Coroutine, _name: str) -> None:
+            calls.append("background refresh")
+            target.close()
+
+        hass = MagicMock()
+        hass.config_entries.async_forward_entry_setups = AsyncMock(
+            side_effect=lambda *_: calls.append("forward")
+        )
+        entry = MagicMock()
+        entry.entry_id = "entry"
+        entry.data = {CONF_URL: MOCK_URL, CONF_WEBHOOK_ID: "hook"}
+        entry.options = {}
+        entry.async_create_background_task.side_effect = _background_task
+        coordinator = MagicMock()
+        coordinator.async_load_snapshot = AsyncMock(return_value=snapshot)
+        coordinator.async_config_entry_first_refresh = AsyncMock(
+            side_effect=lambda: calls.append("first refresh")
+        )
+        coordinator.async_refresh = AsyncMock()
+        with (
+            patch(
+                "custom_components.gatus.GatusDataUpdateCoordinator",
+                return_value=coordinator,
+            ) as coordinator_cls,
+            patch("custom_components.gatus.GatusApiClient"),
+            patch("custom_components.gatus.async_create_clientsession"),
+            patch("custom_components.gatus.async_get_loaded_integration"),
+            patch("custom_components.gatus.dr.async_get"),
+        ):
+            assert await async_setup_entry(hass, entry) is True
+        hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
+            entry, PLATFORMS
+        )
+        coordinator.created_with = coordinator_cls.call_args.kwargs
+        return coordinator, calls
+
+    async def test_snapshot_creates_entities_before_first_refresh(self) -> None:
+        """With a snapshot the platforms are set up without waiting on Gatus."""
+        coordinator, calls = await self._setup(snapshot=True)
+
+        assert calls == ["forward", "background refresh"]
+        coordinator.async_config_entry_first_refresh.assert_not_awaited()
+        coordinator.async_refresh.assert_called_once()
+
+    async def test_without_snapshot_first_refresh_is_awaited(self) -> None:
+        """Without a snapshot setup waits for Gatus before adding entities."""
+        _coordinator, calls = await self._setup(snapshot=False)
+
+        assert calls == ["first refresh", "forward"]
+
+    async def test_no_statistics_windows_by_default(self) -> None:
+        """Statistic sensors are opt-in; a new entry tracks no windows."""
+        coordinator, _calls = await self._setup(snapshot=False)
+
+        assert coordinator.created_with["statistics_windows"] == {}
+
+
+class TestAsyncUpdateOptions:
+    """Tests for async_update_options."""
+
+    async def test_scan_interval_applied_without_reload(self) -> None:
+        """A new scan interval is applied to the running coordinator."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_SCAN_INTERVAL: 120})
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_not_called()
+        coordinator = entry.runtime_data.coordinator
+        settings = coordinator.async_apply_options.call_args.kwargs
+        assert settings["update_interval"] == timedelta(seconds=120)
+        coordinator.async_request_refresh.assert_awaited_once()
+        assert entry.runtime_data.options == {CONF_SCAN_INTERVAL: 120}
+
+    async def test_filters_and_client_options_applied(self) -> None:
+        """Filters reach the coordinator and the client drops its cache."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_EXCLUDE_GROUPS: ["media"]})
+
+        await async_update_options(hass, entry)
+
+        settings = entry.runtime_data.coordinator.async_apply_options.call_args.kwargs
+        assert not settings["endpoint_filter"].matches("media", "plex", "media_plex")
+        entry.runtime_data.client.reconfigure.assert_called_once_with(
+            history_depth=1, stream=False
+        )
+
+    async def test_url_change_reloads(self) -> None:
+        """A changed URL needs a new client, so the entry is reloaded."""
+        hass = _make_hass()
+        entry = _make_entry({})
+        entry.data = {**entry.data, CONF_URL: "http://other.example.com"}
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_awaited_once_with("entry")
+        entry.runtime_data.coordinator.async_apply_options.assert_not_called()
+
+    async def test_statistics_windows_change_reloads(self) -> None:
+        """Changing the statistics windows changes the entities, so it reloads."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_STATISTICS_WINDOWS: ["1h"]})
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_awaited_once_with("entry")
+
+    async def test_group_devices_change_reloads(self) -> None:
+        """Moving entities onto group devices takes a reload."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_GROUP_DEVICES: True})
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_awaited_once_with("entry")
+
+    async def test_reordered_windows_do_not_reload(self) -> None:
+        """Options equal to what is running, in another order, apply in place."""
+        hass = _make_hass()
+        entry = _make_entry(
+            {CONF_STATISTICS_WINDOWS: ["24h", "1h"]},
+            applied={CONF_STATISTICS_WINDOWS: ["1h", "24h"]},
+        )
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_not_called()
+
+    async def test_default_windows_made_explicit_do_not_reload(self) -> None:
+        """Saving the default windows for the first time applies in place."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_STATISTICS_WINDOWS: DEFAULT_STATISTICS_WINDOWS})
+
+        await async_update_options(hass, entry)
+
+        hass.config_entries.async_reload.assert_not_called()
+
+    async def test_webhook_toggled_live(self) -> None:
+        """Enabling the webhook registers it; disabling unregisters it."""
+        hass = _make_hass()
+        entry = _make_entry({CONF_WEBHOOK: True})
+
+        with patch("custom_components.gatus.async_register_webhook") as register:
+            await async_update_options(hass, entry)
+        register.assert_called_once_with(hass, entry)
+
+        entry.options = {CONF_WEBHOOK: False}
+        with patch("custom_components.gatus.async_unregister") as unregister:
+            await async_update_options(hass, entry)
+        unregister.assert_called_once_with(hass, "hook")
+
+
+class TestAsyncRemoveConfigEntryDevice:
+    """Tests for async_remove_config_entry_device."""
+
+    async def _can_remove(self, group: str | None) -> bool:
+        """Return whether the device of ``group`` (server if None) is removable."""
+        entry = _make_entry({CONF_GROUP_DEVICES: True})
+        entry.runtime_data.coordinator.data = MOCK_ENDPOINTS_DICT
+        devices = GatusDevices(entry, per_group=True)
+        entry.runtime_data.devices = devices
+        device_info = devices.server if group is None else devices.endpoint(group)
+        device_entry = MagicMock(identifiers=device_info["identifiers"])
+        return await async_remove_config_entry_device(MagicMock(), entry, device_entry)
+
+    async def test_server_device_is_kept(self) -> None:
+        """The server device cannot be removed."""
+        assert await self._can_remove(None) is False
+
+    async def test_group_with_endpoints_is_kept(self) -> None:
+        """A group device whose group still has endpoints cannot be removed."""
+        assert await self._can_remove("external") is False
+
+    async def test_vanished_group_can_be_removed(self) -> None:
+        """A group device whose group has no endpoints left can be removed."""
+        assert await self._can_remove("retired") is True
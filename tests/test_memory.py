@@ -0,0 +1,183 @@
+"""Memory footprint regression tests for the model layer and polling."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.gatus.models import GatusEndpoint, GatusResult
+
+from .benchmark import make_coordinator, setup_binary_sensors
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Fleet size the bounds below are checked at.
+ENDPOINTS = 1000
+
+# Retained bytes per endpoint for the endpoint index of a latest-only poll:
+# the endpoint, its latest GatusResult and the index entry. About 300 bytes
+# on CPython 3.13.
+MAX_BYTES_PER_ENDPOINT = 400
+
+# Retained bytes per endpoint after a coordinator poll, which adds the
+# endpoint history of every statistic window. About 2.4 KB with the 24h
+# window on CPython 3.13.
+MAX_BYTES_PER_WINDOWED_ENDPOINT = 3000
+
+# Retained bytes per parsed result, list slot included. About 80 bytes.
+MAX_BYTES_PER_RESULT = 100
+
+
+def _payload(**kwargs: Any) -> list[dict[str, Any]]:
+    """
+    Return a synthetic payload whose strings are already interned.
+
+    The models intern names and hostnames, and growing the interpreter's
+    intern table would otherwise be counted against the first test to run.
+    """
+    payload = SyntheticFleet(ENDPOINTS, **kwargs).statuses(poll=10)
+    for record in payload:
+        GatusEndpoint.from_dict(record)
+    return payload
+
+
+@pytest.fixture
+def traced() -> Iterator[Callable[[], int]]:
+    """Trace allocations; yield a function returning the bytes held so far."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    def _retained() -> int:
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - baseline
+
+    yield _retained
+    tracemalloc.stop()
+
+
+class TestModelFootprint:
+    """Upper bounds on the memory the models retain."""
+
+    def test_bytes_per_endpoint(self, traced: Callable[[], int]) -> None:
+        """The endpoint index of a latest-only payload stays compact."""
+        payload = _payload()
+        start = traced()
+
+        data = {ep.key: ep for ep in map(GatusEndpoint.from_dict, payload)}
+
+        assert len(data) == ENDPOINTS
+        assert (traced() - start) / ENDPOINTS <= MAX_BYTES_PER_ENDPOINT
+
+    def test_bytes_per_result(self, traced: Callable[[], int]) -> None:
+        """Parsed results stay within the per-result bound."""
+        payload = _payload(history_depth=10)
+        raw_results = [result for record in payload for result in record["results"]]
+        start = traced()
+
+        results = [GatusResult.from_dict(result) for result in raw_results]
+
+        assert (traced() - start) / len(results) <= MAX_BYTES_PER_RESULT
+
+    def test_older_results_cost_nothing_until_read(
+        self, traced: Callable[[], int]
+    ) -> None:
+        """Deeper history only costs per-result memory once results are read."""
+        payload = _payload(history_depth=10)
+        start = traced()
+
+        endpoints = [GatusEndpoint.from_dict(record) for record in payload]
+        unparsed = traced() - start
+        for endpoint in endpoints:
+            _ = endpoint.results
+        parsed = traced() - start
+
+        assert unparsed / ENDPOINTS <= MAX_BYTES_PER_ENDPOINT
+        assert (parsed - unparsed) / (ENDPOINTS * 9) <= MAX_BYTES_PER_RESULT
+
+
+class TestCoordinatorFootprint:
+    """Upper bounds on what a coordinator poll retains per endpoint."""
+
+    @pytest.mark.parametrize(
+        ("statistics_windows", "bound"),
+        [
+            ({}, MAX_BYTES_PER_ENDPOINT),
+            ({"24h": 86400}, MAX_BYTES_PER_WINDOWED_ENDPOINT),
+        ],
+        ids=["no_windows", "24h_window"],
+    )
+    def test_bytes_per_endpoint(
+        self,
+        traced: Callable[[], int],
+        statistics_windows: dict[str, int],
+        bound: int,
+    ) -> None:
+        """The data and histories built by a poll stay within the bound."""
+        coordinator = make_coordinator(_payload(), statistics_windows)
+        client = coordinator.config_entry.runtime_data.client
+        loop = asyncio.new_event_loop()
+        try:
+            start = traced()
+            coordinator.data = loop.run_until_complete(coordinator._async_update_data())
+            client.payload = None
+            retained = traced() - start
+        finally:
+            loop.close()
+
+        assert len(coordinator.data) == ENDPOINTS
+        assert len(coordinator.history) == (ENDPOINTS if statistics_windows else 0)
+        assert retained / ENDPOINTS <= bound
+
+
+class TestPollingFootprint:
+    """Memory must not grow across polls once the state is built."""
+
+    def test_no_growth_across_polls(self, traced: Callable[[], int]) -> None:
+        """Repeated polls with entity listeners attached retain nothing extra."""
+        # Fixed response times, so the latency histograms do not keep gaining
+        # bins; that growth is bounded and not what this test looks for.
+        fleet = SyntheticFleet(ENDPOINTS // 2, jitter=0)
+        endpoints = len(fleet.endpoints)
+        coordinator = make_coordinator(fleet.statuses(poll=0))
+        client = coordinator.config_entry.runtime_data.client
+        loop = asyncio.new_event_loop()
+
+        def _poll(poll: int) -> None:
+            client.payload = fleet.statuses(poll=poll)
+            coordinator.data = loop.run_until_complete(coordinator._async_update_data())
+            client.payload = None
+            coordinator.async_update_listeners()
+
+        def _no_state_write() -> None:
+            return None
+
+        try:
+            _poll(0)
+            _listener, entities = loop.run_until_complete(
+                setup_binary_sensors(coordinator)
+            )
+            entity: Any
+            for entity in entities:
+                entity.async_write_ha_state = _no_state_write
+                coordinator.async_add_listener(entity._handle_coordinator_update)
+            for poll in range(1, 4):
+                _poll(poll)
+            assert coordinator.state_writes == endpoints
+            settled = traced()
+
+            polls = 20
+            for poll in range(4, 4 + polls):
+                _poll(poll)
+            growth = traced() - settled
+        finally:
+            loop.close()
+
+        # A single object leaked per endpoint and poll would be 50+ bytes.
+        assert growth / (endpoints * polls) < 1
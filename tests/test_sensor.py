@@ -0,0 +1,196 @@
+"""Tests for the Gatus sensor platform."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from custom_components.gatus.devices import GatusDevices
+from custom_components.gatus.history import EndpointHistory
+from custom_components.gatus.sensor import (
+    PERFORMANCE_SENSORS,
+    STATISTIC_SENSORS,
+    GatusEndpointStatisticSensor,
+    GatusPerformanceSensor,
+    GatusStaleSinceSensor,
+)
+from custom_components.gatus.timing import RequestStats, RequestTiming, RollingStats
+
+from .conftest import MOCK_ENDPOINTS_DICT, MOCK_URL
+
+T0 = 1_767_225_600_000  # 2026-01-01T00:00:00Z in epoch milliseconds
+
+UPTIME, RESPONSE_TIME_AVG, RESPONSE_TIME_P95 = STATISTIC_SENSORS
+
+
+def _make_coordinator(
+    history: dict[str, EndpointHistory] | None = None, success: bool = True
+) -> MagicMock:
+    """Build a minimal mock coordinator with per-endpoint history."""
+    coordinator = MagicMock()
+    coordinator.data = MOCK_ENDPOINTS_DICT
+    coordinator.history = history or {}
+    coordinator.changed_endpoint_keys = frozenset()
+    coordinator.last_update_success = success
+    coordinator.config_entry.entry_id = "test_entry_id"
+    coordinator.config_entry.data = {"url": MOCK_URL}
+    coordinator.config_entry.runtime_data.integration.version = "1.0.0"
+    coordinator.config_entry.runtime_data.devices = GatusDevices(
+        coordinator.config_entry
+    )
+    return coordinator
+
+
+def _make_history(*results: tuple[bool, int]) -> EndpointHistory:
+    """Build a history with a 1h window from (success, duration_ms) pairs."""
+    history = EndpointHistory({"1h": 3_600_000})
+    for offset, (success, duration_ms) in enumerate(results):
+        history.append(
+            T0 + offset * 60_000, success=success, duration_ns=duration_ms * 1_000_000
+        )
+    return history
+
+
+def _make_sensor(
+    coordinator: MagicMock, description=UPTIME, window: str = "1h"
+) -> GatusEndpointStatisticSensor:
+    """Instantiate a statistic sensor for the google endpoint."""
+    return GatusEndpointStatisticSensor(
+        coordinator=coordinator,
+        endpoint_key="external_google",
+        endpoint_name="google",
+        endpoint_group="external",
+        description=description,
+        window=window,
+    )
+
+
+class TestGatusEndpointStatisticSensor:
+    """Tests for the rolling statistic sensors."""
+
+    def test_uptime(self) -> None:
+        """Uptime is the percentage of successful results in the window."""
+        history = _make_history((True, 10), (True, 10), (True, 10), (False, 10))
+        sensor = _make_sensor(_make_coordinator({"external_google": history}))
+        assert sensor.available is True
+        assert sensor.native_value == 75
+
+    def test_response_times(self) -> None:
+        """Average and p95 response times are reported in milliseconds."""
+        history = _make_history((True, 10), (True, 30))
+        coordinator = _make_coordinator({"external_google": history})
+        assert _make_sensor(coordinator, RESPONSE_TIME_AVG).native_value == 20
+        assert _make_sensor(coordinator, RESPONSE_TIME_P95).native_value is not None
+
+    def test_unavailable_without_history(self) -> None:
+        """The sensor is unavailable until its window holds a result."""
+        sensor = _make_sensor(_make_coordinator())
+        assert sensor.available is False
+        assert sensor.native_value is None
+
+    def test_unavailable_for_unconfigured_window(self) -> None:
+        """A window the history does not track reports nothing."""
+        history = _make_history((True, 10))
+        sensor = _make_sensor(
+            _make_coordinator({"external_google": history}), window="7d"
+        )
+        assert sensor.available is False
+        assert sensor.native_value is None
+
+    def test_unavailable_when_coordinator_failed(self) -> None:
+        """The sensor is unavailable when the last poll failed."""
+        history = _make_history((True, 10))
+        coordinator = _make_coordinator({"external_google": history}, success=False)
+        assert _make_sensor(coordinator).available is False
+
+    def test_unique_id_and_name_include_metric_and_window(self) -> None:
+        """Each metric and window gets its own entity."""
+        sensor = _make_sensor(_make_coordinator(), RESPONSE_TIME_P95, "24h")
+        assert sensor.unique_id == "test_entry_id_external_google_response_time_p95_24h"
+        assert sensor.name == "external google 95th percentile response time (24h)"
+
+    def test_name_omits_group_on_group_device(self) -> None:
+        """On its group's device the sensor name does not repeat the group."""
+        coordinator = _make_coordinator()
+        coordinator.config_entry.runtime_data.devices.per_group = True
+        sensor = _make_sensor(coordinator, UPTIME, "24h")
+        assert sensor.name == "google uptime (24h)"
+
+    def test_response_time_sensors_disabled_by_default(self) -> None:
+        """Only the uptime sensor is enabled by default."""
+        assert UPTIME.entity_registry_enabled_default is True
+        assert RESPONSE_TIME_AVG.entity_registry_enabled_default is False
+        assert RESPONSE_TIME_P95.entity_registry_enabled_default is False
+
+
+class TestGatusStaleSinceSensor:
+    """Tests for the stale since diagnostic sensor."""
+
+    def test_reports_stale_since(self) -> None:
+        """The sensor reports when Gatus first failed to answer."""
+        coordinator = _make_coordinator(success=False)
+        coordinator.stale_since = datetime(2026, 1, 1, tzinfo=UTC)
+        sensor = GatusStaleSinceSensor(coordinator)
+
+        assert sensor.available is True
+        assert sensor.native_value == datetime(2026, 1, 1, tzinfo=UTC)
+        assert sensor.unique_id == "test_entry_id_stale_since"
+
+    def test_none_while_fresh(self) -> None:
+        """The sensor has no value while Gatus answers."""
+        coordinator = _make_coordinator()
+        coordinator.stale_since = None
+        assert GatusStaleSinceSensor(coordinator).native_value is None
+
+
+class TestGatusPerformanceSensor:
+    """Tests for the performance diagnostic sensors."""
+
+    def test_values_come_from_coordinator(self) -> None:
+        """Each sensor reads its measurement from the coordinator."""
+        coordinator = _make_coordinator(success=False)
+        coordinator.poll_stats = RollingStats(10)
+        for value in (10.0, 30.0, 20.0):
+            coordinator.poll_stats.add(value)
+        coordinator.request_stats = RequestStats(10)
+        coordinator.request_stats.add(RequestTiming(bytes_received=2048))
+        coordinator.parse_rate = 5000.0
+        coordinator.state_writes = 3
+        coordinator.listener_ms = 1.5
+
+        values = {
+            description.key: GatusPerformanceSensor(
+                coordinator, description
+            ).native_value
+            for description in PERFORMANCE_SENSORS
+        }
+        assert values == {
+            "poll_duration": 20.0,
+            "poll_duration_p95": 30.0,
+            "payload_size": 2048,
+            "parse_rate": 5000.0,
+            "state_writes": 3,
+            "listener_time": 1.5,
+        }
+
+    async def test_state_written_by_performance_listener(self) -> None:
+        """State is written after each refresh, not by the listener dispatch."""
+        coordinator = _make_coordinator()
+        sensor = GatusPerformanceSensor(coordinator, PERFORMANCE_SENSORS[0])
+        sensor.async_write_ha_state = MagicMock()
+        sensor.async_on_remove = MagicMock()
+
+        await sensor.async_added_to_hass()
+        sensor._handle_coordinator_update()
+
+        sensor.async_write_ha_state.assert_not_called()
+        coordinator.async_add_performance_listener.assert_called_once_with(
+            sensor.async_write_ha_state
+        )
+
+    def test_available_while_polls_fail(self) -> None:
+        """The sensors stay available when Gatus is unreachable."""
+        coordinator = _make_coordinator(success=False)
+        sensor = GatusPerformanceSensor(coordinator, PERFORMANCE_SENSORS[0])
+        assert sensor.available is True
+        assert sensor.unique_id == "test_entry_id_poll_duration"
@@ -0,0 +1,78 @@
+"""Tests for the Gatus services."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+
+from custom_components.gatus.api import GatusApiClientError
+from custom_components.gatus.services import (
+    SERVICE_REFRESH_ENDPOINT,
+    async_setup_services,
+)
+
+from .conftest import MOCK_ENDPOINTS_DICT
+
+
+def _make_hass(*entries: MagicMock) -> MagicMock:
+    """Build a hass mock with the given loaded entries."""
+    hass = MagicMock()
+    hass.config_entries.async_loaded_entries.return_value = list(entries)
+    return hass
+
+
+def _make_entry(entry_id: str = "entry") -> MagicMock:
+    """Build a loaded entry whose coordinator knows the mock endpoints."""
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.runtime_data.coordinator.data = MOCK_ENDPOINTS_DICT
+    entry.runtime_data.coordinator.async_refresh_endpoints = AsyncMock()
+    return entry
+
+
+async def _call(hass: MagicMock, **data: object) -> None:
+    """Register the services and call refresh_endpoint with ``data``."""
+    async_setup_services(hass)
+    domain, service, handler = hass.services.async_register.call_args.args
+    assert (domain, service) == ("gatus", SERVICE_REFRESH_ENDPOINT)
+    schema = hass.services.async_register.call_args.kwargs["schema"]
+    call = MagicMock()
+    call.data = schema(data)
+    await handler(call)
+
+
+class TestRefreshEndpointService:
+    """Tests for the refresh_endpoint service."""
+
+    async def test_refreshes_known_keys(self) -> None:
+        """Known keys are refreshed through the coordinator."""
+        entry = _make_entry()
+        await _call(_make_hass(entry), endpoint_key="media_plex")
+        entry.runtime_data.coordinator.async_refresh_endpoints.assert_awaited_once_with(
+            ["media_plex"]
+        )
+
+    async def test_unknown_key_raises(self) -> None:
+        """Keys no loaded entry knows are reported back to the caller."""
+        with pytest.raises(ServiceValidationError):
+            await _call(_make_hass(_make_entry()), endpoint_key=["media_plex", "nope"])
+
+    async def test_unloaded_entry_raises(self) -> None:
+        """Targeting an entry that is not loaded is rejected."""
+        with pytest.raises(ServiceValidationError):
+            await _call(
+                _make_hass(_make_entry()),
+                endpoint_key="media_plex",
+                config_entry_id="other",
+            )
+
+    async def test_api_error_raises_home_assistant_error(self) -> None:
+        """Gatus errors are surfaced as HomeAssistantError."""
+        entry = _make_entry()
+        entry.runtime_data.coordinator.async_refresh_endpoints.side_effect = (
+            GatusApiClientError("boom")
+        )
+        with pytest.raises(HomeAssistantError):
+            await _call(_make_hass(entry), endpoint_key="media_plex")
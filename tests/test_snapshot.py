@@ -0,0 +1,133 @@
+"""Tests for the persisted endpoint snapshot."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.gatus.const import SNAPSHOT_SAVE_DELAY
+from custom_components.gatus.models import GatusEndpoint
+from custom_components.gatus.snapshot import pack_endpoints, unpack_endpoints
+
+from .conftest import MOCK_ENDPOINT_DATA, MOCK_ENDPOINTS_DICT
+from .test_coordinator import _make_coordinator, _mock_get_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class _DebouncingStore:
+    """Mimics Store.async_delay_save: every call restarts the delay."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.written: list[dict] = []
+        self._pending: tuple[float, Callable[[], dict]] | None = None
+
+    def async_delay_save(self, data_func: Callable[[], dict], delay: float) -> None:
+        self._pending = (self.now + delay, data_func)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock on, writing the pending data once its delay passed."""
+        self.now += seconds
+        if self._pending is not None and self._pending[0] <= self.now:
+            self.written.append(self._pending[1]())
+            self._pending = None
+
+
+class TestSnapshotRoundTrip:
+    """Tests for pack_endpoints and unpack_endpoints."""
+
+    def test_round_trip_preserves_latest_results(self) -> None:
+        """Endpoints survive a JSON round trip unchanged."""
+        stored = json.loads(json.dumps(pack_endpoints(MOCK_ENDPOINTS_DICT)))
+        assert unpack_endpoints(stored) == MOCK_ENDPOINTS_DICT
+
+    def test_rows_are_flat(self) -> None:
+        """Each endpoint is stored as one flat row."""
+        rows = pack_endpoints(MOCK_ENDPOINTS_DICT)["endpoints"]
+        assert rows[0] == [
+            "external_google",
+            "google",
+            "external",
+            True,
+            "google.com",
+            200,
+            50_000_000,
+            "2026-01-01T00:00:00Z",
+        ]
+
+    def test_endpoint_without_results(self) -> None:
+        """Endpoints without results are restored without a latest result."""
+        endpoint = GatusEndpoint(key="k", name="n", group="g", results=[])
+        restored = unpack_endpoints(pack_endpoints({"k": endpoint}))
+        assert restored["k"].latest_result is None
+
+
+class TestCoordinatorSnapshot:
+    """Tests for saving and loading the coordinator snapshot."""
+
+    async def test_load_snapshot_sets_data(self) -> None:
+        """A saved snapshot becomes the coordinator data."""
+        coordinator = _make_coordinator(MagicMock(last_timing=None))
+        coordinator._snapshot_store.async_load = AsyncMock(
+            return_value=pack_endpoints(MOCK_ENDPOINTS_DICT)
+        )
+
+        assert await coordinator.async_load_snapshot() is True
+        assert coordinator.data == MOCK_ENDPOINTS_DICT
+
+    async def test_missing_snapshot(self) -> None:
+        """Without a saved snapshot the data is left alone."""
+        coordinator = _make_coordinator(MagicMock(last_timing=None))
+        coordinator._snapshot_store.async_load = AsyncMock(return_value=None)
+
+        assert await coordinator.async_load_snapshot() is False
+        assert coordinator.data == {}
+
+    async def test_saved_only_when_data_changed(self) -> None:
+        """A poll that changes nothing does not schedule a write."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA, MOCK_ENDPOINT_DATA)
+        coordinator = _make_coordinator(client)
+
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = await coordinator._async_update_data()
+
+        coordinator._snapshot_store.async_delay_save.assert_called_once()
+        data_func = coordinator._snapshot_store.async_delay_save.call_args.args[0]
+        assert data_func() == pack_endpoints(MOCK_ENDPOINTS_DICT)
+
+    async def test_saves_the_polled_data_whatever_data_becomes(self) -> None:
+        """The pending save packs the polled index even if data is replaced."""
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(MOCK_ENDPOINT_DATA)
+        coordinator = _make_coordinator(client)
+
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = {"unexpected": "payload"}
+
+        data_func = coordinator._snapshot_store.async_delay_save.call_args.args[0]
+        assert data_func() == pack_endpoints(MOCK_ENDPOINTS_DICT)
+
+    async def test_written_while_polling_faster_than_the_delay(self) -> None:
+        """Polls faster than the save delay do not keep postponing the write."""
+        polls = [
+            [
+                {**raw, "results": [{**raw["results"][0], "duration": poll}]}
+                for raw in MOCK_ENDPOINT_DATA
+            ]
+            for poll in range(30)
+        ]
+        client = MagicMock(last_timing=None)
+        client.async_get_data = _mock_get_data(*polls)
+        coordinator = _make_coordinator(client)
+        store = coordinator._snapshot_store = _DebouncingStore()
+
+        for _ in polls:
+            coordinator.data = await coordinator._async_update_data()
+            store.advance(SNAPSHOT_SAVE_DELAY / 6)
+
+        assert len(store.written) >= 4
+        assert store.written[-1] == pack_endpoints(coordinator.data)
@@ -0,0 +1,95 @@
+"""Tests for the synthetic fleet generator and the benchmark runner."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from custom_components.gatus.models import GatusEndpoint
+
+from .benchmark import main, run_benchmarks
+from .synthetic import SyntheticFleet
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestSyntheticFleet:
+    """Tests for SyntheticFleet."""
+
+    def test_payload_is_deterministic(self) -> None:
+        """The same arguments always produce the same payload."""
+        first = SyntheticFleet(50, history_depth=3, seed=7).statuses(poll=4)
+        second = SyntheticFleet(50, history_depth=3, seed=7).statuses(poll=4)
+        assert first == second
+        assert SyntheticFleet(50, history_depth=3, seed=8).statuses(poll=4) != first
+
+    def test_payload_parses_into_models(self) -> None:
+        """Every record is a valid Gatus endpoint status with unique keys."""
+        payload = SyntheticFleet(120, group_size=50).statuses(poll=2)
+        endpoints = [GatusEndpoint.from_dict(record) for record in payload]
+        assert len({endpoint.key for endpoint in endpoints}) == 120
+        assert {endpoint.group for endpoint in endpoints} == {
+            "group-000",
+            "group-001",
+            "group-002",
+        }
+        assert all(endpoint.latest_result is not None for endpoint in endpoints)
+
+    def test_history_depth_and_ordering(self) -> None:
+        """Each poll reports up to history_depth checks, oldest first."""
+        fleet = SyntheticFleet(1, history_depth=3)
+        assert len(fleet.statuses(poll=0)[0]["results"]) == 1
+        results = fleet.statuses(poll=5)[0]["results"]
+        assert len(results) == 3
+        timestamps = [result["timestamp"] for result in results]
+        assert timestamps == sorted(timestamps)
+        assert fleet.statuses(poll=6)[0]["results"][-2] == results[-1]
+
+    def test_failure_rate(self) -> None:
+        """The share of failing checks follows the failure rate."""
+        payload = SyntheticFleet(2000, failure_rate=0.2).statuses()
+        failures = sum(not record["results"][-1]["success"] for record in payload)
+        assert 300 < failures < 500
+        assert all(
+            record["results"][-1]["success"]
+            for record in SyntheticFleet(100, failure_rate=0).statuses()
+        )
+
+    def test_add_and_remove(self) -> None:
+        """Endpoints can be added and removed between polls."""
+        fleet = SyntheticFleet(3)
+        removed = next(iter(fleet.endpoints))
+        added = fleet.add(2)
+        fleet.remove([removed])
+        keys = [record["key"] for record in fleet.statuses()]
+        assert len(keys) == 4
+        assert removed not in keys
+        assert set(added) <= set(keys)
+        assert fleet.endpoint_status(removed) is None
+        assert fleet.endpoint_status(added[0])["key"] == added[0]
+
+
+class TestBenchmark:
+    """Smoke tests keeping the benchmark runner working."""
+
+    def test_run_benchmarks_covers_every_case(self) -> None:
+        """Every case reports a time and peak memory for each fleet size."""
+        results = run_benchmarks([20, 40], repeat=1)
+        assert {result.case for result in results} == {
+            "from_dict",
+            "async_update_data",
+            "setup_endpoint_entities",
+            "endpoint_discovery_unchanged",
+            "entity_properties",
+        }
+        assert {result.endpoints for result in results} == {20, 40}
+        assert all(result.seconds > 0 for result in results)
+        assert all(result.peak_bytes >= 0 for result in results)
+
+    def test_main_prints_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """The command line prints machine-readable results."""
+        main(["--endpoints", "10", "--repeat", "1", "--case", "from_dict"])
+        report = json.loads(capsys.readouterr().out)
+        assert [result["case"] for result in report["results"]] == ["from_dict"]
+        assert report["results"][0]["endpoints"] == 10
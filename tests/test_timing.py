@@ -0,0 +1,95 @@
+"""Tests for request phase timing."""
+
+from __future__ import annotations
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.gatus.api import GatusApiClient
+from custom_components.gatus.timing import (
+    RequestStats,
+    RequestTiming,
+    RollingStats,
+    create_trace_config,
+)
+
+
+class TestRollingStats:
+    """Tests for RollingStats."""
+
+    def test_empty(self) -> None:
+        """An empty window only reports its count."""
+        assert RollingStats(5).as_dict() == {"count": 0}
+
+    def test_summary(self) -> None:
+        """The summary covers the kept samples."""
+        stats = RollingStats(100)
+        for value in range(1, 101):
+            stats.add(float(value))
+
+        assert stats.as_dict() == {
+            "count": 100,
+            "last": 100.0,
+            "mean": 50.5,
+            "p50": 50.0,
+            "p95": 95.0,
+            "max": 100.0,
+        }
+
+    def test_oldest_samples_dropped(self) -> None:
+        """Only the most recent samples are kept."""
+        stats = RollingStats(2)
+        for value in (100.0, 1.0, 2.0):
+            stats.add(value)
+        assert len(stats) == 2
+        assert stats.percentile(100) == 2.0
+
+
+class TestRequestStats:
+    """Tests for RequestStats."""
+
+    def test_missing_phases_are_skipped(self) -> None:
+        """Phases that were not measured do not add samples."""
+        stats = RequestStats(10)
+        stats.add(RequestTiming(transfer=3.0, total=4.0, bytes_received=10))
+
+        summary = stats.as_dict()
+        assert summary["transfer_ms"]["count"] == 1
+        assert summary["connect_ms"]["count"] == 0
+        assert summary["bytes_received"]["last"] == 10
+
+
+class TestTraceConfig:
+    """Tests for the aiohttp trace hooks against a local server."""
+
+    async def test_phases_recorded(self) -> None:
+        """A real request fills in every phase and the payload size."""
+        body = b'[{"key": "a"}]'
+
+        async def _statuses(_request: web.Request) -> web.Response:
+            return web.Response(body=body, content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/api/v1/endpoints/statuses", _statuses)
+        async with (
+            TestServer(app) as server,
+            aiohttp.ClientSession(trace_configs=[create_trace_config()]) as session,
+        ):
+            client = GatusApiClient(url=str(server.make_url("/")), session=session)
+            assert await client.async_get_data() == [{"key": "a"}]
+            first = client.last_timing
+            await client.async_get_data()
+            second = client.last_timing
+
+        assert first is not None
+        assert second is not None
+        assert first.connect is not None
+        assert first.connect >= 0
+        assert first.ttfb is not None
+        assert first.transfer is not None
+        assert first.decode is not None
+        assert first.total >= first.ttfb
+        assert first.bytes_received == len(body)
+        # The second request reuses the keep-alive connection.
+        assert second.connect == 0
@@ -0,0 +1,100 @@
+"""Tests for the Gatus webhook receiver."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.gatus.webhook import async_register_webhook, endpoint_key
+
+
+class TestEndpointKey:
+    """Tests for endpoint_key."""
+
+    @pytest.mark.parametrize(
+        ("group", "name", "expected"),
+        [
+            ("media", "plex", "media_plex"),
+            ("Core Services", "API v1.2", "core-services_api-v1-2"),
+            ("", "front_end/#1", "_front-end--1"),
+        ],
+    )
+    def test_matches_gatus_keys(self, group: str, name: str, expected: str) -> None:
+        """Keys are built the way Gatus builds them."""
+        assert endpoint_key(group, name) == expected
+
+
+class TestWebhookHandler:
+    """Tests for the registered webhook handler."""
+
+    def _register(self) -> tuple[MagicMock, object]:
+        entry = MagicMock()
+        entry.data = {"webhook_id": "abc123"}
+        entry.runtime_data.coordinator.async_request_refresh = AsyncMock()
+        with patch(
+            "custom_components.gatus.webhook.webhook.async_register"
+        ) as mock_register:
+            async_register_webhook(MagicMock(), entry)
+        assert mock_register.call_args.args[3] == "abc123"
+        return entry, mock_register.call_args.args[4]
+
+    async def _handle(self, entry: MagicMock, handler: object, body: object) -> None:
+        """Post ``body``, then run the refresh the handler started in the background."""
+        request = MagicMock()
+        request.json = AsyncMock(return_value=body)
+        await handler(MagicMock(), "abc123", request)
+        await entry.async_create_background_task.call_args.args[1]
+
+    async def test_alert_triggers_refresh(self) -> None:
+        """A Gatus alert refreshes the coordinator."""
+        entry, handler = self._register()
+
+        await self._handle(
+            entry, handler, {"group": "media", "name": "plex", "status": "TRIGGERED"}
+        )
+        entry.runtime_data.coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_known_endpoint_refreshed_alone(self) -> None:
+        """An alert for a known endpoint re-fetches only that endpoint."""
+        entry, handler = self._register()
+        coordinator = entry.runtime_data.coordinator
+        coordinator.data = {"media_plex": MagicMock()}
+        coordinator.async_refresh_endpoints = AsyncMock()
+
+        await self._handle(entry, handler, {"group": "media", "name": "plex"})
+        coordinator.async_refresh_endpoints.assert_awaited_once_with(["media_plex"])
+        coordinator.async_request_refresh.assert_not_awaited()
+
+    async def test_invalid_body_still_refreshes(self) -> None:
+        """A body that is not JSON still refreshes all endpoints."""
+        entry, handler = self._register()
+        request = MagicMock()
+        request.json = AsyncMock(side_effect=ValueError)
+
+        await handler(MagicMock(), "abc123", request)
+        await entry.async_create_background_task.call_args.args[1]
+        entry.runtime_data.coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_answers_before_refreshing(self) -> None:
+        """The handler returns without waiting for the refresh."""
+        entry, handler = self._register()
+        request = MagicMock()
+        request.json = AsyncMock(return_value={"group": "media", "name": "plex"})
+
+        await handler(MagicMock(), "abc123", request)
+
+        entry.runtime_data.coordinator.async_request_refresh.assert_not_awaited()
+        refresh = entry.async_create_background_task.call_args.args[1]
+        await refresh
+        entry.runtime_data.coordinator.async_request_refresh.assert_awaited_once()
+
+    def test_unregisters_on_unload(self) -> None:
+        """The webhook is unregistered when the entry unloads."""
+        entry, _ = self._register()
+        unload = entry.async_on_unload.call_args.args[0]
+        with patch(
+            "custom_components.gatus.webhook.webhook.async_unregister"
+        ) as mock_unregister:
+            unload()
+        mock_unregister.assert_called_once()